@@ -1,5 +1,7 @@
 # main.py (Entry point for the Web Analysis Tool)
 
+import argparse
+import importlib
 import sys
 import os
 import logging
@@ -19,21 +21,70 @@ import logging
 project_root = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, os.path.join(project_root, "src"))
 
-from src.gui.main_app import WebAnalysisToolGUI, QApplication
-from src.utils.logger_config import setup_logging, LOG_DIR, APP_DATA_DIR
-from src.utils.custom_exceptions import ConfigurationError
+# The GUI (PyQt, and through it lxml, builtwith, ...) and the analysis modules are imported
+# lazily in the functions below, after logging is set up, so `--help` and CLI-only modes
+# never load PyQt.
+from src.utils.logger_config import setup_logging, APP_DATA_DIR
+from src.utils.custom_exceptions import ConfigurationError, DataCollectionError
+
+def parse_arguments(argv=None):
+    """Parses the command line. Without options the GUI is started."""
+    parser = argparse.ArgumentParser(description="Web Analysis Tool")
+    parser.add_argument("--analyze", metavar="URL",
+                        help="Run the backend analysis of URL, print the results as JSON and exit (no GUI).")
+    return parser.parse_args(argv)
+
+def run_analysis(url, logger):
+    """
+    Fetches url, runs the backend analysis on it and prints the results as JSON.
+    The page is fetched through DataCollector (same session, retries and HTTP cache as the GUI).
+    Returns the exit code: 0 on success, 1 if the page could not be fetched.
+    """
+    backend_analyzer = importlib.import_module("src.backend_analysis.backend_analyzer")
+    data_collector = importlib.import_module("src.data_collection.data_collector")
+
+    logger.info(f"Running backend analysis for {url} (CLI mode).")
+    try:
+        collector = data_collector.DataCollector(output_directory=os.path.join(APP_DATA_DIR, "collected_data"))
+        response = collector.fetch_page(url)
+    except DataCollectionError as e:
+        logger.error(f"Could not fetch {url} for analysis: {e}")
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    analysis = backend_analyzer.BackendAnalyzer().analyze_all(url, response.text, dict(response.headers))
+    print(backend_analyzer._dumps(analysis))
+    return 0
+
+def run_gui(logger):
+    """Starts the Qt application and blocks until the main window is closed. Returns the exit code."""
+    main_app = importlib.import_module("src.gui.main_app")
+
+    app = main_app.QApplication(sys.argv)
+    app.setStyleSheet(main_app.WebAnalysisToolGUI.APP_QSS)
+    # Optional: Set an application icon
+    # icon_path = os.path.join(project_root, "src", "gui", "icon.png") # Assuming you have an icon.png
+    # if os.path.exists(icon_path):
+    #     app.setWindowIcon(QIcon(icon_path))
+
+    # Initialize and show the main application window
+    # Pass the gpg_home_path to the GUI, so it can pass it to PGPManager
+    # The main_app.py was already designed to construct this path, so this is more of a confirmation.
+    main_window = main_app.WebAnalysisToolGUI() # main_app.py already calculates gpg_home_path
+    main_window.show()
+    logger.info("Main application window displayed.")
+    return main_app.run_event_loop(app)
 
 if __name__ == "__main__":
-    # Create application data directories if they don't exist
-    # This ensures log directory and GPG home parent directory are created before use.
-    if not os.path.exists(APP_DATA_DIR):
-        os.makedirs(APP_DATA_DIR, exist_ok=True)
-    if not os.path.exists(LOG_DIR):
-        os.makedirs(LOG_DIR, exist_ok=True)
+    args = parse_arguments()
+
+    # Create the application data directory (the GPG home parent) if it doesn't exist.
+    # setup_logging creates the log directory itself.
+    os.makedirs(APP_DATA_DIR, exist_ok=True)
 
     # Setup centralized logging
-    # The log level can be configured here (e.g., logging.DEBUG for more verbose output)
-    logger = setup_logging(log_level=logging.INFO)
+    # The log level can be configured here (e.g., logging.DEBUG for more verbose output).
+    # Optimized runs (python -O, PYTHONOPTIMIZE=1) log warnings and errors only.
+    logger = setup_logging(log_level=logging.INFO if __debug__ else logging.WARNING)
     logger.info("Application starting...")
 
     # GPG Home for the application (consistent with PGPManager and main_app.py)
@@ -42,19 +93,9 @@ if __name__ == "__main__":
     # PGPManager will create it if it doesn't exist, with 0o700 permissions.
 
     try:
-        app = QApplication(sys.argv)
-        # Optional: Set an application icon
-        # icon_path = os.path.join(project_root, "src", "gui", "icon.png") # Assuming you have an icon.png
-        # if os.path.exists(icon_path):
-        #     app.setWindowIcon(QIcon(icon_path))
-
-        # Initialize and show the main application window
-        # Pass the gpg_home_path to the GUI, so it can pass it to PGPManager
-        # The main_app.py was already designed to construct this path, so this is more of a confirmation.
-        main_window = WebAnalysisToolGUI() # main_app.py already calculates gpg_home_path
-        main_window.show()
-        logger.info("Main application window displayed.")
-        sys.exit(app.exec())
+        if args.analyze:
+            sys.exit(run_analysis(args.analyze, logger))
+        sys.exit(run_gui(logger))
 
     except ConfigurationError as e:
         logger.critical(f"Configuration error on startup: {e}. Application cannot start.")
@@ -1,29 +1,383 @@
 # backend_analyzer.py
 
+import asyncio
+import aiohttp
 import builtwith
 import logging # Use standard logging
 import json
 import re
-from urllib.parse import urlparse, urljoin
-from bs4 import BeautifulSoup
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, asdict, is_dataclass
+from functools import lru_cache
+from urllib.parse import urlparse, urlsplit
+import lxml.html
+import requests
+from lxml import etree
+from requests.structures import CaseInsensitiveDict
+
+try:
+    import hyperscan
+except ImportError:  # Optional accelerator; the compiled regex union below is used instead
+    hyperscan = None
+
+try:
+    import orjson
+except ImportError:  # Optional; the standard json module is used instead
+    orjson = None
+
+try:
+    from pybloom_live import ScalableBloomFilter
+except ImportError:  # Optional; only needed for dedupe="bloom" in generate_site_structure_map
+    ScalableBloomFilter = None
 
 # Import custom exceptions
 from ..utils.custom_exceptions import BackendAnalysisError
+from ..utils.url_utils import origin_of, resolve_url
 
 # Get a logger for this module
 logger = logging.getLogger(__name__)
 
+# Default cap on the number of pages analyze_many processes concurrently
+DEFAULT_MAX_CONCURRENCY = 8
+# Timeout (seconds) for the page fetch done by identify_technologies and identify_technologies_async
+TECH_FETCH_TIMEOUT = 5
+TECH_FETCH_USER_AGENT = "builtwith"
+# Number of origins (scheme://host) whose technologies identify_technologies keeps cached
+TECH_CACHE_SIZE = 1024
+# Default cap on the amount of page/script content (in characters) scanned by discover_api_endpoints
+DEFAULT_MAX_SCAN_BYTES = 4 * 1024 * 1024
+# Content shorter than this cannot hold an API path worth reporting
+_MIN_SCAN_LENGTH = 16
+
+# Forms that look like login forms: either the action points at an auth-related path,
+# or the form contains a password field. The union is evaluated in a single XPath pass
+# so each form is returned once, in document order.
+_LOGIN_FORMS_XPATH = etree.XPath(
+    "//form[re:test(@action, 'login|auth|signin|session', 'i') or .//input[@type='password']]",
+    namespaces={"re": "http://exslt.org/regular-expressions"}
+)
+
+# Cookie names that indicate a server-side session
+_SESSION_COOKIE_NAMES = frozenset({
+    "sessionid", "sessid", "jsessionid", "phpsessid", "asp.net_sessionid", "connect.sid",
+    "session", "session_id", "sid", "express.sid", "sails.sid", "rack.session", "laravel_session",
+    "ci_session", "cakephp", "symfony", "frontend", "cfid", "cftoken", "kohanasession", "zdsession",
+    "_session_id", "wt_session", "mojolicious", "plack_session", "flask_session", "beaker.session.id"
+})
+# Cookie name prefixes/suffixes for frameworks that add a per-app part (e.g. Classic ASP, Rails "_myapp_session")
+_SESSION_COOKIE_PREFIXES = ("aspsessionid", "sess_", "wordpress_logged_in_")
+_SESSION_COOKIE_SUFFIXES = ("_session", "_sess", ".sid")
+# Session tokens matched anywhere in a cookie name (e.g. "my_sessionid", "app-sessid")
+_SESSION_COOKIE_TOKEN_RE = re.compile(
+    "|".join(re.escape(token) for token in ("sessionid", "sessid", "jsessionid", "phpsessid", "asp.net_sessionid", "connect.sid"))
+)
+# Standard cookie-name prefixes (RFC 6265bis) that are stripped before matching
+_COOKIE_NAME_PREFIXES = ("__host-", "__secure-")
+# Extracts cookie names ("name=") from a (possibly joined) lowercased Set-Cookie header value
+_COOKIE_NAME_RE = re.compile(r"(?:^|[;,])\s*([^=;,\s]+)\s*=")
+# Header values containing one of these prefixes likely carry a JWT
+_JWT_PREFIXES = ("bearer ", "jwt ")
+# One scan per header value: a JWT prefix, or a token shaped like a JWT (base64url '{"' header, dot-separated)
+_JWT_RE = re.compile("|".join([re.escape(prefix) for prefix in _JWT_PREFIXES] + [r"\beyj[\w-]+\.[\w-]+\."]))
+_JWT_HEADER_NAMES = ("authorization", "x-auth-token", "x-access-token")
+
+def _is_session_cookie_name(name):
+    """Returns True if a lowercased cookie name looks like a server-side session cookie."""
+    for prefix in _COOKIE_NAME_PREFIXES:
+        if name.startswith(prefix):
+            name = name[len(prefix):]
+            break
+    # Also try the name without a "."-separated route suffix (e.g. Jetty's "jsessionid.node0")
+    for candidate in (name, name.partition(".")[0]):
+        if (candidate in _SESSION_COOKIE_NAMES or candidate.startswith(_SESSION_COOKIE_PREFIXES)
+                or candidate.endswith(_SESSION_COOKIE_SUFFIXES)):
+            return True
+    return _SESSION_COOKIE_TOKEN_RE.search(name) is not None
+
+def _normalize_headers(response_headers):
+    """Returns a copy of the response headers with lowercased keys, for consistent access."""
+    return {k.lower(): v for k, v in response_headers.items()} if response_headers else {}
+
+# Regex patterns for API paths in JavaScript or text content.
+# Each pattern has exactly one capturing group: the candidate path or URL.
+# More comprehensive patterns can be added here
+API_REGEX_PATTERNS = (
+    r"([\"']?/api(?:/[\w\-/\.\{\}]+)+[\"'])",  # /api/v1/users, /api/resource.json
+    r"([\"']?/rest(?:/[\w\-/\.\{\}]+)+[\"'])", # /rest/v2/items
+    r"([\"']?/graphql[\"'])", # /graphql
+    r"(?:fetch|axios\.get|axios\.post|\$\.ajax|\$\.get|\$\.post)\s*\(\s*[\"']([^\"']+)[\"']", # JS calls
+    r"(?:apiUrl|apiBaseUrl|endpoint)\s*[:=]\s*[\"']([^\"']+)[\"']" # JS variables
+)
+
+# Substrings (lowercase) that make an absolute URL from the patterns above a plausible API endpoint
+_API_TOKENS = ("api", "rest", "graphql", "/v1/", "/v2/")
+# Substrings (lowercase) that make an <a> href an explicit API link (e.g. API documentation)
+_DOC_API_TOKENS = ("api", "rest", "graphql", "swagger", "openapi")
+
+# All patterns compiled once into a single alternation so the content is scanned in one pass.
+_API_RE = re.compile("|".join(f"(?:{pattern})" for pattern in API_REGEX_PATTERNS), re.IGNORECASE)
+
+# Extracts (name, content) pairs from <meta> tags, as builtwith does
+_META_TAG_RE = re.compile(r"""<meta[^>]*?name=['"]([^>]*?)['"][^>]*?content=['"]([^>]*?)['"][^>]*?>""", re.IGNORECASE)
+
+# builtwith fingerprint table with every pattern precompiled; built once per process on first use
+_FINGERPRINTS = None
+
+def _compile_fingerprint_pattern(pattern):
+    """Compiles a Wappalyzer-style pattern, dropping its "\\;version:..." style metadata."""
+    return re.compile(pattern.split("\\;")[0], re.IGNORECASE)
+
+def _as_list(value):
+    return value if isinstance(value, list) else [value]
+
+def _get_fingerprints():
+    """
+    Returns the builtwith fingerprint table with all patterns precompiled.
+    builtwith itself recompiles each pattern on every match, which with ~800 apps thrashes
+    the re module cache; here the compile cost is paid once per process.
+    """
+    global _FINGERPRINTS
+    if _FINGERPRINTS is None:
+        categories = builtwith.data["categories"]
+        fingerprints = {}
+        for app_name, app_spec in builtwith.data["apps"].items():
+            fingerprints[app_name] = {
+                "url": _compile_fingerprint_pattern(app_spec["url"]) if "url" in app_spec else None,
+                "headers": {name: _compile_fingerprint_pattern(pattern) for name, pattern in app_spec.get("headers", {}).items()},
+                "html": [_compile_fingerprint_pattern(pattern) for key in ("html", "script") for pattern in _as_list(app_spec.get(key, []))],
+                "meta": {name: _compile_fingerprint_pattern(pattern) for name, pattern in app_spec.get("meta", {}).items()},
+                "categories": [categories[str(cat_id)] for cat_id in app_spec["cats"]],
+                "implies": _as_list(app_spec.get("implies", []))
+            }
+        _FINGERPRINTS = fingerprints
+    return _FINGERPRINTS
+
+def _add_fingerprint_app(techs, app_name, fingerprints):
+    """Adds an app (and the apps it implies) to its categories in techs."""
+    app = fingerprints[app_name]
+    for category in app["categories"]:
+        category_apps = techs.setdefault(category, [])
+        if app_name not in category_apps:
+            category_apps.append(app_name)
+            for implied_name in app["implies"]:
+                _add_fingerprint_app(techs, implied_name, fingerprints)
+
+def _match_fingerprints(url, html_content_str, response_headers, fingerprints):
+    """
+    Matches a fetched page against the precompiled fingerprints, with the same rules and
+    result format as builtwith.builtwith but without any network access.
+
+    Args:
+        url (str): The URL of the page.
+        html_content_str (str): The HTML content of the page.
+        response_headers (Mapping): The response headers, looked up case-insensitively.
+        fingerprints (dict): The table returned by _get_fingerprints().
+
+    Returns:
+        dict: Identified technologies, as {category: [app names]}.
+    """
+    techs = {}
+    for app_name, app in fingerprints.items():
+        if app["url"] is not None and app["url"].search(url):
+            _add_fingerprint_app(techs, app_name, fingerprints)
+
+    if response_headers:
+        for app_name, app in fingerprints.items():
+            app_headers = app["headers"]
+            if app_headers and all(
+                response_headers.get(name) and regex.search(response_headers.get(name))
+                for name, regex in app_headers.items()
+            ):
+                _add_fingerprint_app(techs, app_name, fingerprints)
+
+    if html_content_str:
+        for app_name, app in fingerprints.items():
+            if any(regex.search(html_content_str) for regex in app["html"]):
+                _add_fingerprint_app(techs, app_name, fingerprints)
+
+        metas = dict(_META_TAG_RE.findall(html_content_str))
+        for app_name, app in fingerprints.items():
+            if any(name in metas and regex.search(metas[name]) for name, regex in app["meta"].items()):
+                _add_fingerprint_app(techs, app_name, fingerprints)
+    return techs
+
+def _as_lxml_tree(document):
+    """
+    Returns the lxml tree to analyze for document, which is either an lxml element or,
+    for legacy callers, a BeautifulSoup object (re-serialized and parsed with lxml).
+    """
+    if document is None or isinstance(document, etree._Element):
+        return document
+    return lxml.html.fromstring(str(document))
+
+@lru_cache(maxsize=TECH_CACHE_SIZE)
+def _tech_for_origin(origin):
+    """
+    Fetches origin and matches it against the fingerprints, once per origin.
+    Returns the technologies as a hashable tuple of (category, (name, ...)) pairs.
+    Failures raise and are therefore not cached.
+    """
+    response = requests.get(origin, headers={"User-Agent": TECH_FETCH_USER_AGENT}, timeout=TECH_FETCH_TIMEOUT)
+    tech_info = _match_fingerprints(origin, response.text, response.headers, _get_fingerprints())
+    return tuple((category, tuple(names)) for category, names in tech_info.items())
+
+def clear_tech_cache():
+    """Forgets the technologies cached by BackendAnalyzer.identify_technologies, e.g. after a site was redeployed."""
+    _tech_for_origin.cache_clear()
+
+def _dumps(obj):
+    """Serializes analysis results (plain dicts or result dataclasses) to indented JSON text."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+    if is_dataclass(obj):
+        obj = asdict(obj)
+    return json.dumps(obj, indent=2)
+
+class _Node:
+    """A node of the site structure trie: one path segment."""
+    __slots__ = ("children", "is_page")
+
+    def __init__(self):
+        self.children = {} # Path segment -> _Node
+        self.is_page = False # Whether the path up to this segment is itself a page
+
+def _export_structure(root):
+    """
+    Converts a site structure trie into the legacy format: a leaf page is the string "[page]",
+    and a page that also has sub-pages is a dict carrying a "[page_marker]": True entry.
+    """
+    exported = {}
+    stack = [(root, exported)]
+    while stack:
+        node, out = stack.pop()
+        for segment, child in node.children.items():
+            if not child.children:
+                out[segment] = "[page]"
+            else:
+                out[segment] = sub_structure = {"[page_marker]": True} if child.is_page else {}
+                stack.append((child, sub_structure))
+    return exported
+
+def _iter_unique_bloom(links):
+    """Yields links not seen before, tracking them in a Bloom filter rather than a set."""
+    seen = ScalableBloomFilter(initial_capacity=10000, error_rate=0.001)
+    for link in links:
+        if not seen.add(link): # add() returns True if the link was (probably) already present
+            yield link
+
+def _compile_hyperscan_db():
+    """Compiles API_REGEX_PATTERNS into a Hyperscan database, or returns None if unavailable."""
+    if hyperscan is None:
+        return None
+    try:
+        db = hyperscan.Database()
+        db.compile(
+            expressions=[pattern.encode("utf-8") for pattern in API_REGEX_PATTERNS],
+            ids=list(range(len(API_REGEX_PATTERNS))),
+            elements=len(API_REGEX_PATTERNS),
+            # UTF-8 with Unicode properties, so \w matches what it matches for _API_RE on str
+            flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP] * len(API_REGEX_PATTERNS)
+        )
+        return db
+    except Exception as e:
+        logger.warning(f"Could not compile API patterns with Hyperscan, falling back to Python regex: {e}")
+        return None
+
+_API_HS_DB = _compile_hyperscan_db()
+
+def _iter_api_path_candidates(chunks):
+    """
+    Yields the captured path of every API pattern match in the given content chunks.
+
+    Each chunk (the page source, or one script body) is scanned on its own, so the chunks are
+    never concatenated and no match spans two unrelated scripts. Hyperscan, when available, is
+    only a prefilter: one multi-pattern scan per chunk, stopped at the first hit, tells whether
+    the chunk contains any match at all. Hyperscan reports only the leftmost start of each
+    match end, which does not give re.finditer's non-overlapping matches, so _API_RE is then
+    run over the chunks that hit. Chunks without any match, most scripts, skip the Python regex.
+    """
+    for chunk in chunks:
+        if _API_HS_DB is not None and not _hyperscan_hits(chunk):
+            continue
+        for match in _API_RE.finditer(chunk):
+            # Only the alternative that matched has a non-None group: the captured path itself.
+            yield match.group(match.lastindex)
+
+def _hyperscan_hits(chunk):
+    """Returns True if any of API_REGEX_PATTERNS matches somewhere in chunk, stopping at the first match."""
+    try:
+        _API_HS_DB.scan(chunk.encode("utf-8"), match_event_handler=_stop_scan)
+    except hyperscan.ScanTerminated:
+        return True
+    return False
+
+def _stop_scan(pattern_id, start, end, flags, context):
+    return True # Non-zero ends the scan with ScanTerminated
+
+@dataclass(slots=True)
+class AuthAnalysis:
+    """Results of the authentication analysis of a page."""
+    login_forms_found: bool = False
+    form_details: list = field(default_factory=list)
+    cookies_used: bool = False
+    session_cookies_likely: bool = False
+    http_auth_headers_present: bool = False
+    auth_header_details: str = None
+    jwt_likely: bool = False
+
+    def to_dict(self):
+        """Returns the results as a plain dict, for consumers that expect the legacy format."""
+        return asdict(self)
+
+@dataclass(slots=True)
+class BackendAnalysisResult:
+    """
+    Results of a comprehensive backend analysis of a page.
+    A failed analysis step holds an {"error": ...} dict in place of its normal result.
+    """
+    url: str
+    technologies: dict = None
+    authentication_analysis: AuthAnalysis = None
+    api_endpoints: list = None
+    site_structure: dict = None
+
+    def to_dict(self):
+        """Returns the results as a plain (nested) dict, for consumers that expect the legacy format."""
+        return asdict(self)
+
 class BackendAnalyzer:
     """Analyzes backend characteristics of a website based on collected data."""
 
     def __init__(self):
         """Initializes the BackendAnalyzer."""
+        # Pooled aiohttp session, created lazily on the event loop that first needs it
+        self._session = None
+        self._session_loop = None
         logger.info("BackendAnalyzer initialized.")
 
+    def _get_session(self):
+        """Returns the pooled aiohttp session for the running event loop, creating it if needed."""
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            self._session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=64, ttl_dns_cache=300))
+            self._session_loop = loop
+        return self._session
+
+    async def close(self):
+        """Closes the pooled aiohttp session, if one was opened."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._session_loop = None
+
     def identify_technologies(self, url):
         """
         Identifies web technologies used by a given URL.
 
+        The site root is fetched and fingerprinted once per origin (scheme://host); later calls
+        for any URL on the same origin are answered from a cache (see clear_tech_cache).
+
         Args:
             url (str): The URL to analyze.
 
@@ -40,105 +394,158 @@ class BackendAnalyzer:
                 # but being explicit can avoid potential issues.
                 url = "http://" + url 
             
-            tech_info = builtwith.parse(url)
+            url_parts = urlsplit(url)
+            origin = f"{url_parts.scheme}://{url_parts.netloc}"
+            tech_info = {category: list(names) for category, names in _tech_for_origin(origin)}
+            if not tech_info:
+                logger.warning(f"No technologies identified by builtwith for {url}. This might be normal for some sites or indicate an issue.")
+            else:
+                logger.info("Technologies identified for %s: %s", url, tech_info)
+            return tech_info if tech_info else {}
+        except Exception as e:
+            logger.error(f"Error identifying technologies for {url}: {e}", exc_info=True)
+            raise BackendAnalysisError(f"Failed to identify technologies for {url}: {e}")
+
+    def identify_technologies_from_content(self, html_content_str, response_headers, url):
+        """
+        Identifies web technologies from an already fetched page, without any network access.
+
+        Args:
+            html_content_str (str): The HTML content of the page.
+            response_headers (dict): The HTTP response headers of the page.
+            url (str): The URL of the page (some fingerprints match on the URL itself).
+
+        Returns:
+            dict: A dictionary of identified technologies.
+        Raises:
+            BackendAnalysisError: If technology identification fails.
+        """
+        logger.info(f"Identifying technologies for {url} from fetched content")
+        try:
+            # Fingerprints name headers in canonical case ("X-Powered-By"), hence the case-insensitive mapping.
+            tech_info = _match_fingerprints(
+                url, html_content_str or "", CaseInsensitiveDict(response_headers or {}), _get_fingerprints()
+            )
             if not tech_info:
                 logger.warning(f"No technologies identified by builtwith for {url}. This might be normal for some sites or indicate an issue.")
             else:
-                logger.info(f"Technologies identified for {url}: {tech_info}")
+                logger.info("Technologies identified for %s: %s", url, tech_info)
             return tech_info if tech_info else {}
         except Exception as e:
             logger.error(f"Error identifying technologies for {url}: {e}", exc_info=True)
             raise BackendAnalysisError(f"Failed to identify technologies for {url}: {e}")
 
-    def analyze_authentication(self, soup, response_headers):
+    async def identify_technologies_async(self, url):
+        """
+        Fetches a URL over the pooled aiohttp session and identifies the web technologies it uses.
+
+        Args:
+            url (str): The URL to analyze.
+
+        Returns:
+            dict: A dictionary of identified technologies.
+        Raises:
+            BackendAnalysisError: If fetching the page or technology identification fails.
+        """
+        logger.info(f"Identifying technologies for {url}")
+        if not url.startswith(("http://", "https://")):
+            url = "http://" + url
+        try:
+            session = self._get_session()
+            async with session.get(url, headers={"User-Agent": TECH_FETCH_USER_AGENT}, timeout=aiohttp.ClientTimeout(total=TECH_FETCH_TIMEOUT)) as response:
+                html_content_str = await response.text(errors="replace")
+                response_headers = dict(response.headers)
+        except Exception as e:
+            logger.error(f"Error fetching {url} for technology identification: {e}", exc_info=True)
+            raise BackendAnalysisError(f"Failed to identify technologies for {url}: {e}")
+        return await asyncio.to_thread(self.identify_technologies_from_content, html_content_str, response_headers, url)
+
+    def analyze_authentication(self, tree, response_headers, _normalized=False):
         """
         Performs a basic analysis of authentication mechanisms based on HTML forms and response headers.
 
         Args:
-            soup (BeautifulSoup): The BeautifulSoup object of the page.
-            response_headers (dict): The HTTP response headers, keys should be lowercased for consistent access.
+            tree (lxml.html.HtmlElement): The parsed lxml root element of the page
+                                          (a BeautifulSoup object is also accepted).
+            response_headers (dict): The HTTP response headers.
+            _normalized (bool): Internal. True when response_headers already has lowercased keys,
+                                so they are not normalized a second time.
 
         Returns:
-            dict: Analysis results regarding authentication.
+            AuthAnalysis: Analysis results regarding authentication.
         """
         logger.info("Analyzing authentication mechanisms.")
-        auth_analysis = {
-            "login_forms_found": False,
-            "form_details": [],
-            "cookies_used": False,
-            "session_cookies_likely": False,
-            "http_auth_headers_present": False,
-            "auth_header_details": None,
-            "jwt_likely": False
-        }
-
-        if not soup:
-            logger.warning("Soup object is None, cannot analyze HTML for authentication clues.")
+        auth_analysis = AuthAnalysis()
+
+        if tree is None:
+            logger.warning("Parsed HTML tree is None, cannot analyze HTML for authentication clues.")
             # Continue with header analysis if possible
 
-        if soup:
+        if tree is not None:
             try:
-                # Check for login forms (more specific selectors might be needed)
-                login_forms = soup.find_all("form", attrs={"action": re.compile(r"login|auth|signin|session", re.IGNORECASE)})
-                # Also check for forms with password fields as a strong indicator
-                password_input_forms = soup.find_all("form", lambda tag: tag.find("input", attrs={"type": "password"}))
-                
-                all_potential_login_forms = list(set(login_forms + password_input_forms))
+                tree = _as_lxml_tree(tree)
+                # Check for login forms by action (more specific selectors might be needed)
+                # or by the presence of a password field, which is a strong indicator.
+                all_potential_login_forms = _LOGIN_FORMS_XPATH(tree)
 
                 if all_potential_login_forms:
-                    auth_analysis["login_forms_found"] = True
+                    auth_analysis.login_forms_found = True
                     for form in all_potential_login_forms:
                         form_detail = {"action": form.get("action", "N/A"), "method": form.get("method", "GET").upper()}
                         inputs = []
-                        for input_tag in form.find_all("input"):
+                        for input_tag in form.iter("input"):
                             inputs.append({
                                 "name": input_tag.get("name"), 
                                 "type": input_tag.get("type", "text")
                             })
                         form_detail["inputs"] = inputs
-                        auth_analysis["form_details"].append(form_detail)
+                        auth_analysis.form_details.append(form_detail)
             except Exception as e:
                 logger.error(f"Error analyzing HTML forms for authentication: {e}", exc_info=True)
 
         # Standardize header keys to lowercase for consistent checking
-        normalized_headers = {k.lower(): v for k, v in response_headers.items()} if response_headers else {}
+        normalized_headers = (response_headers or {}) if _normalized else _normalize_headers(response_headers)
 
         try:
             if "set-cookie" in normalized_headers:
-                auth_analysis["cookies_used"] = True
+                auth_analysis.cookies_used = True
                 cookies_header = normalized_headers["set-cookie"]
                 # Ensure cookies_header is a string before calling lower()
                 if isinstance(cookies_header, list):
                     cookies_header = "; ".join(cookies_header) # Join if it's a list of cookie strings
                 
-                if any(c_name in cookies_header.lower() for c_name in ["sessionid", "sessid", "jsessionid", "phpsessid", "asp.net_sessionid", "connect.sid"]):
-                    auth_analysis["session_cookies_likely"] = True
+                cookie_names = _COOKIE_NAME_RE.findall(cookies_header.lower())
+                if any(_is_session_cookie_name(name) for name in cookie_names):
+                    auth_analysis.session_cookies_likely = True
             
             if "authorization" in normalized_headers or "www-authenticate" in normalized_headers:
-                auth_analysis["http_auth_headers_present"] = True
-                auth_analysis["auth_header_details"] = normalized_headers.get("www-authenticate", normalized_headers.get("authorization"))
+                auth_analysis.http_auth_headers_present = True
+                auth_analysis.auth_header_details = normalized_headers.get("www-authenticate", normalized_headers.get("authorization"))
             
             # Check for JWT patterns in common headers
-            jwt_patterns = ["bearer ", "jwt "]
-            for header_name in ["authorization", "x-auth-token", "x-access-token"]:
-                header_value = normalized_headers.get(header_name, "")
-                if any(pattern in header_value.lower() for pattern in jwt_patterns):
-                    auth_analysis["jwt_likely"] = True
+            for header_name in _JWT_HEADER_NAMES:
+                header_value = normalized_headers.get(header_name, "").lower()
+                if _JWT_RE.search(header_value):
+                    auth_analysis.jwt_likely = True
                     break # Found JWT evidence
         except Exception as e:
             logger.error(f"Error analyzing headers for authentication: {e}", exc_info=True)
 
-        logger.info(f"Authentication analysis results: {auth_analysis}")
+        logger.info("Authentication analysis results: %s", auth_analysis)
         return auth_analysis
 
-    def discover_api_endpoints(self, soup, base_url, page_content_str=None):
+    def discover_api_endpoints(self, tree, base_url, page_content_str=None, max_scan_bytes=DEFAULT_MAX_SCAN_BYTES):
         """
         Tries to discover potential API endpoints from script tags, links, and page content.
 
         Args:
-            soup (BeautifulSoup): The BeautifulSoup object of the page.
+            tree (lxml.html.HtmlElement): The parsed lxml root element of the page
+                                          (a BeautifulSoup object is also accepted).
             base_url (str): The base URL of the website.
             page_content_str (str, optional): The raw HTML/JS content as a string for regex search.
+            max_scan_bytes (int): Cap on the content scanned with the API patterns. When the page and
+                                  its scripts exceed it, only the start of each one is scanned
+                                  (endpoint literals usually appear early in bundled JS).
 
         Returns:
             list: A list of unique, absolute potential API endpoint URLs.
@@ -150,69 +557,78 @@ class BackendAnalyzer:
             logger.error("Base URL is required for API endpoint discovery.")
             return []
 
-        # Regex patterns for API paths in JavaScript or text content
-        # More comprehensive patterns can be added here
-        api_regex_patterns = [
-            r"([\"\\]["\"]?/api(?:/[\w\-/\.\{\}]+)+[\"\\]["\"])_?",  # /api/v1/users, /api/resource.json
-            r"([\"\\]["\"]?/rest(?:/[\w\-/\.\{\}]+)+[\"\\]["\"])_?", # /rest/v2/items
-            r"([\"\\]["\"]?/graphql[\"\\]["\"])_?", # /graphql
-            r"(?:fetch|axios\.get|axios\.post|\$\.ajax|\$\.get|\$\.post)\s*\(\s*["\"]([^"\"]+)["\"]", # JS calls
-            r"(?:apiUrl|apiBaseUrl|endpoint)\s*[:=]\s*["\"]([^"\"]+)["\"]" # JS variables
-        ]
-
-        content_to_search = ""
-        if page_content_str:
-            content_to_search += page_content_str
-        if soup:
+        try:
+            tree = _as_lxml_tree(tree)
+        except Exception as e:
+            logger.error(f"Could not convert the parsed document for API endpoint discovery: {e}", exc_info=True)
+            tree = None
+
+        content_chunks = [page_content_str] if page_content_str else []
+        if tree is not None:
             # Extract script tag contents for more targeted search
-            for script_tag in soup.find_all("script"):
-                if script_tag.string:
-                    content_to_search += script_tag.string + "\n"
-        
+            content_chunks.extend(script_tag.text for script_tag in tree.iter("script") if script_tag.text)
+
+        origin = origin_of(base_url) # Parsed once; candidates are resolved against it
+        content_length = sum(map(len, content_chunks))
+        if content_length < _MIN_SCAN_LENGTH and (tree is None or next(tree.iter("a"), None) is None):
+            logger.info("No content or links to search for API endpoints.")
+            return []
+        if content_length > max_scan_bytes:
+            chunk_budget = max_scan_bytes // len(content_chunks)
+            logger.warning(f"Content for {base_url} is {content_length} characters, over the {max_scan_bytes} scan limit; "
+                           f"scanning only the first {chunk_budget} characters of the page and of each script. "
+                           f"Raise max_scan_bytes to scan everything.")
+            content_chunks = [chunk[:chunk_budget] for chunk in content_chunks]
+
         try:
-            for pattern in api_regex_patterns:
-                # Find all non-overlapping matches in the string
-                found_matches = re.findall(pattern, content_to_search, re.IGNORECASE)
-                for match in found_matches:
-                    # If the pattern has capturing groups, re.findall returns tuples or list of strings
-                    # We are interested in the captured path itself.
-                    path_candidate = match if isinstance(match, str) else match[0] # Adjust based on regex group structure
-                    path_candidate = path_candidate.strip("\"\\' ") # Clean quotes and spaces
-                    
-                    if path_candidate.startswith(("/", "http://", "https://")):
-                        try:
-                            abs_url = urljoin(base_url, path_candidate)
-                            # Basic validation: ensure it looks like a plausible API path
-                            if "api" in abs_url.lower() or "rest" in abs_url.lower() or "graphql" in abs_url.lower() or any(p_match in path_candidate for p_match in ["/v1/", "/v2/"]):
-                                endpoints.add(abs_url)
-                        except ValueError as ve:
-                            logger.debug(f"Could not form absolute URL from candidate \"{path_candidate}\" with base \"{base_url}\": {ve}")
+            # Single pass over the content with all API patterns at once
+            for path_candidate in _iter_api_path_candidates(content_chunks):
+                path_candidate = path_candidate.strip("\"\\' ") # Clean quotes and spaces
+                
+                if path_candidate.startswith(("/", "http://", "https://")):
+                    try:
+                        abs_url = resolve_url(origin, base_url, path_candidate)
+                        # Basic validation: ensure it looks like a plausible API path
+                        abs_url_lower = abs_url.lower()
+                        if any(token in abs_url_lower for token in _API_TOKENS):
+                            endpoints.add(abs_url)
+                    except ValueError as ve:
+                        logger.debug("Could not form absolute URL from candidate \"%s\" with base \"%s\": %s", path_candidate, base_url, ve)
 
             # Also check <a> tags for explicit API links (e.g., API documentation)
-            if soup:
-                for a_tag in soup.find_all("a", href=True):
-                    href = a_tag["href"].strip()
-                    if "api" in href.lower() or "rest" in href.lower() or "graphql" in href.lower() or "swagger" in href.lower() or "openapi" in href.lower():
+            if tree is not None:
+                for a_tag in tree.iter("a"):
+                    href = a_tag.get("href")
+                    if not href:
+                        continue
+                    href = href.strip()
+                    href_lower = href.lower()
+                    if any(token in href_lower for token in _DOC_API_TOKENS):
                         try:
-                            abs_url = urljoin(base_url, href)
+                            abs_url = resolve_url(origin, base_url, href)
                             endpoints.add(abs_url)
                         except ValueError as ve:
-                             logger.debug(f"Could not form absolute URL from <a> tag href \"{href}\" with base \"{base_url}\": {ve}")
+                             logger.debug("Could not form absolute URL from <a> tag href \"%s\" with base \"%s\": %s", href, base_url, ve)
 
         except Exception as e:
             logger.error(f"Error during API endpoint discovery: {e}", exc_info=True)
             # Do not raise, return what has been found so far
 
-        logger.info(f"Discovered {len(endpoints)} potential API endpoints: {list(endpoints)}")
+        logger.info("Discovered %d potential API endpoints: %s", len(endpoints), endpoints)
         return list(endpoints)
 
-    def generate_site_structure_map(self, links, base_url):
+    def generate_site_structure_map(self, links, base_url, dedupe="set"):
         """
         Generates a simple textual or dictionary representation of the site structure based on internal links.
 
         Args:
-            links (list): A list of absolute URLs found on the site.
+            links (iterable): The absolute URLs found on the site. Duplicates are skipped.
             base_url (str): The base URL of the website to filter internal links.
+            dedupe (str): How duplicate links are skipped. "set" (default) holds every distinct link
+                          in memory. "bloom" uses a scalable Bloom filter instead, for very large
+                          batches (100k+ links): memory per URL is a few bytes, at the cost of a small
+                          false-positive rate (about 0.1%) where a distinct link is wrongly skipped.
+                          Requires the optional pybloom_live package; falls back to "set" without it.
 
         Returns:
             dict: A dictionary representing the site structure.
@@ -222,117 +638,237 @@ class BackendAnalyzer:
         if not base_url:
             logger.error("Base URL is required for site structure mapping.")
             return structure
-            
+
+        if dedupe == "bloom" and ScalableBloomFilter is None:
+            logger.warning("pybloom_live is not installed; falling back to set-based link deduplication.")
+            dedupe = "set"
+        if dedupe == "bloom":
+            links = _iter_unique_bloom(links)
+        else:
+            links = dict.fromkeys(links) # Ordered set: keeps the output order stable
+
+        # Built as a trie of _Node; the legacy format is produced at the end.
+        structure_tree = _Node()
         try:
             parsed_base = urlparse(base_url)
             if not parsed_base.scheme or not parsed_base.netloc:
                 logger.error(f"Invalid base_url for site structure mapping: {base_url}")
                 return structure
+            base_netloc = parsed_base.netloc
 
             for link in links:
                 if not link: continue
-                try:
-                    parsed_link = urlparse(link)
-                    # Ensure it is an internal link and has a path
-                    if parsed_link.netloc == parsed_base.netloc and parsed_link.path and parsed_link.path != "/":
-                        # Normalize path: remove trailing slash unless it is the only slash
-                        path = parsed_link.path
-                        if path.endswith("/") and len(path) > 1:
-                            path = path[:-1]
-                        
-                        path_segments = [seg for seg in path.split("/") if seg] # Filter out empty segments
-                        
-                        current_level = structure
-                        for i, segment in enumerate(path_segments):
-                            is_last_segment = (i == len(path_segments) - 1)
-                            
-                            if segment not in current_level:
-                                current_level[segment] = "[page]" if is_last_segment else {}
-                            elif not isinstance(current_level[segment], dict):
-                                # If it was marked as a page but now we find sub-paths, convert to dict
-                                if not is_last_segment:
-                                    current_level[segment] = {"[page_marker]": True} # Mark that this path itself is also a page
-                                # else, it is already a page, do nothing to overwrite
-                            
-                            if isinstance(current_level[segment], dict):
-                                current_level = current_level[segment]
-                            # If it is a page string and we are not at the last segment, it means we have a conflict
-                            # e.g. /users (page) and /users/profile (sub-page). The dict conversion above handles this.
-                except ValueError as ve:
-                    logger.warning(f"Could not parse link {link} during site structure mapping: {ve}")
-                    continue # Skip malformed links
+                # Ensure it is an internal link (same netloc, any scheme) and has a path
+                scheme_end = link.find("://")
+                if scheme_end == -1 or not link.startswith(base_netloc, scheme_end + 3):
+                    continue
+                path = link[scheme_end + 3 + len(base_netloc):]
+                if path[:1] != "/":
+                    continue # No path, or a different host sharing the prefix (e.g. example.com.evil.org)
+                path = path.split("?", 1)[0].split("#", 1)[0]
+
+                node = structure_tree
+                for segment in path.split("/"):
+                    if segment: # Filter out empty segments (leading, trailing and doubled slashes)
+                        child = node.children.get(segment)
+                        if child is None:
+                            child = node.children[sys.intern(segment)] = _Node()
+                        node = child
+                node.is_page = True # Never exported for the root itself (a bare "/" link)
         except Exception as e:
             logger.error(f"Error generating site structure map for {base_url}: {e}", exc_info=True)
             # Return partially built structure or empty if critical error
 
+        structure = _export_structure(structure_tree)
         logger.info(f"Site structure map generated for {base_url}. Root items: {len(structure)}")
         return structure
 
-    def analyze_all(self, url, html_content_str, response_headers, collected_links):
-        """
-        Performs a comprehensive backend analysis using all available methods.
-
-        Args:
-            url (str): The primary URL of the website analyzed.
-            html_content_str (str): The HTML content of the main page as a string.
-            response_headers (dict): The HTTP response headers from the main page request.
-            collected_links (list): A list of links collected from the website.
+    def _technologies_error(self, url, e):
+        """Converts a technology identification failure into an error entry so analysis can continue."""
+        if isinstance(e, BackendAnalysisError):
+            logger.warning(f"Technology identification failed for {url}: {e}. Continuing analysis.")
+            return {"error": str(e)}
+        logger.error(f"Unexpected error during technology identification for {url}: {e}", exc_info=True)
+        return {"error": f"Unexpected error: {str(e)}"}
 
-        Returns:
-            dict: A dictionary containing all analysis results.
-        Raises:
-            BackendAnalysisError: If a critical part of the analysis fails.
+    def _identify_technologies_safe(self, url, html_content_str=None, response_headers=None):
         """
-        logger.info(f"Starting comprehensive backend analysis for URL: {url}")
-        analysis_results = {
-            "url": url,
-            "technologies": None,
-            "authentication_analysis": None,
-            "api_endpoints": None,
-            "site_structure": None
-        }
+        Identifies technologies, matching against the page content when the caller already has it
+        and only fetching the URL when it does not.
+        """
+        try:
+            if html_content_str or response_headers:
+                return self.identify_technologies_from_content(html_content_str, response_headers, url)
+            return self.identify_technologies(url)
+        except Exception as e:
+            return self._technologies_error(url, e)
 
+    async def _identify_technologies_safe_async(self, url, html_content_str=None, response_headers=None):
+        """Async counterpart of _identify_technologies_safe, fetching over the pooled aiohttp session."""
+        if html_content_str or response_headers:
+            return await asyncio.to_thread(self._identify_technologies_safe, url, html_content_str, response_headers)
         try:
-            analysis_results["technologies"] = self.identify_technologies(url)
-        except BackendAnalysisError as e:
-            logger.warning(f"Technology identification failed for {url}: {e}. Continuing analysis.")
-            analysis_results["technologies"] = {"error": str(e)}
+            return await self.identify_technologies_async(url)
         except Exception as e:
-            logger.error(f"Unexpected error during technology identification for {url}: {e}", exc_info=True)
-            analysis_results["technologies"] = {"error": f"Unexpected error: {str(e)}"}
+            return self._technologies_error(url, e)
+
+    def _parse_html(self, url, html_content_str):
+        """Parses the page HTML into an lxml tree. Returns None if there is no HTML or parsing fails."""
+        if not html_content_str:
+            return None
+        try:
+            return lxml.html.fromstring(html_content_str)
+        except Exception as e:
+            logger.error(f"Failed to parse HTML for backend analysis of {url}: {e}", exc_info=True)
+            # Some analyses might still run without a parsed tree, or with partial data
+            return None
+
+    def _analyze_parsed(self, url, tree, html_content_str, response_headers, collected_links, technologies):
+        """
+        Runs the HTML/header based analyses on an already parsed tree and assembles the results.
+        response_headers must already be normalized with _normalize_headers.
+        """
+        analysis_results = BackendAnalysisResult(url=url, technologies=technologies)
 
-        soup = None
-        if html_content_str:
-            try:
-                soup = BeautifulSoup(html_content_str, "lxml")
-            except Exception as e:
-                logger.error(f"Failed to parse HTML for backend analysis of {url}: {e}", exc_info=True)
-                # Some analyses might still run without soup, or with partial data
-        
         try:
-            analysis_results["authentication_analysis"] = self.analyze_authentication(soup, response_headers or {})
+            analysis_results.authentication_analysis = self.analyze_authentication(tree, response_headers, _normalized=True)
         except Exception as e: # Catch any unexpected error from this specific analysis
             logger.error(f"Authentication analysis failed for {url}: {e}", exc_info=True)
-            analysis_results["authentication_analysis"] = {"error": f"Unexpected error: {str(e)}"}
+            analysis_results.authentication_analysis = {"error": f"Unexpected error: {str(e)}"}
 
         parsed_url = urlparse(url)
         base_url = f"{parsed_url.scheme}://{parsed_url.netloc}"
 
         try:
-            analysis_results["api_endpoints"] = self.discover_api_endpoints(soup, base_url, page_content_str=html_content_str)
+            analysis_results.api_endpoints = self.discover_api_endpoints(tree, base_url, page_content_str=html_content_str)
         except Exception as e:
             logger.error(f"API endpoint discovery failed for {url}: {e}", exc_info=True)
-            analysis_results["api_endpoints"] = {"error": f"Unexpected error: {str(e)}"}
+            analysis_results.api_endpoints = {"error": f"Unexpected error: {str(e)}"}
 
         try:
-            analysis_results["site_structure"] = self.generate_site_structure_map(collected_links or [], base_url)
+            analysis_results.site_structure = self.generate_site_structure_map(collected_links or [], base_url)
         except Exception as e:
             logger.error(f"Site structure map generation failed for {url}: {e}", exc_info=True)
-            analysis_results["site_structure"] = {"error": f"Unexpected error: {str(e)}"}
+            analysis_results.site_structure = {"error": f"Unexpected error: {str(e)}"}
 
         logger.info(f"Comprehensive backend analysis completed for {url}.")
         return analysis_results
 
+    def analyze_all(self, url, html_content_str=None, response_headers=None, collected_links=None, parsed_tree=None):
+        """
+        Performs a comprehensive backend analysis using all available methods.
+
+        Args:
+            url (str): The primary URL of the website analyzed.
+            html_content_str (str): The HTML content of the main page as a string.
+            response_headers (dict): The HTTP response headers from the main page request.
+            collected_links (list): A list of links collected from the website.
+            parsed_tree (lxml.html.HtmlElement, optional): The page as already parsed by the caller
+                (e.g. DataCollector), so the HTML is not parsed a second time.
+
+        Returns:
+            BackendAnalysisResult: All analysis results (use to_dict() for a plain dict).
+        Raises:
+            BackendAnalysisError: If a critical part of the analysis fails.
+        """
+        logger.info(f"Starting comprehensive backend analysis for URL: {url}")
+        response_headers = _normalize_headers(response_headers) # Normalized once, shared by all analyses
+        technologies = self._identify_technologies_safe(url, html_content_str, response_headers)
+        tree = parsed_tree if parsed_tree is not None else self._parse_html(url, html_content_str)
+        return self._analyze_parsed(url, tree, html_content_str, response_headers, collected_links, technologies)
+
+    async def analyze_all_async(self, url, html_content_str=None, response_headers=None, collected_links=None,
+                                process_pool=None, parsed_tree=None):
+        """
+        Asynchronous variant of analyze_all.
+
+        Technology identification and HTML parsing run concurrently; when the page content is
+        not supplied, technologies are identified from a fetch over the pooled aiohttp session.
+        CPU-bound work (parsing, regex scans, structure building) runs in worker threads, or in
+        process_pool when one is given, so many URLs can be analyzed concurrently from a single
+        loop. Call close() once done to release the pooled session.
+
+        Args:
+            url (str): The primary URL of the website analyzed.
+            html_content_str (str): The HTML content of the main page as a string.
+            response_headers (dict): The HTTP response headers from the main page request.
+            collected_links (list): A list of links collected from the website.
+            process_pool (concurrent.futures.ProcessPoolExecutor, optional): Runs the CPU-bound
+                analyses in another process, in parallel with the technology fetch.
+            parsed_tree (lxml.html.HtmlElement, optional): The page as already parsed by the caller.
+                Trees cannot be sent to another process, so process_pool is not used with it.
+
+        Returns:
+            BackendAnalysisResult: All analysis results (use to_dict() for a plain dict).
+        """
+        logger.info(f"Starting comprehensive backend analysis for URL: {url}")
+        response_headers = _normalize_headers(response_headers) # Normalized once, shared by all analyses
+        if parsed_tree is not None:
+            technologies = await self._identify_technologies_safe_async(url, html_content_str, response_headers)
+            return await asyncio.to_thread(
+                self._analyze_parsed, url, parsed_tree, html_content_str, response_headers, collected_links, technologies
+            )
+        if process_pool is not None:
+            # Only the HTML, headers and links are shipped to the worker; the small result comes back.
+            technologies, analysis_results = await asyncio.gather(
+                self._identify_technologies_safe_async(url, html_content_str, response_headers),
+                asyncio.get_running_loop().run_in_executor(
+                    process_pool, _analyze_in_worker, url, html_content_str, response_headers, collected_links
+                )
+            )
+            analysis_results.technologies = technologies
+            return analysis_results
+
+        technologies, tree = await asyncio.gather(
+            self._identify_technologies_safe_async(url, html_content_str, response_headers),
+            asyncio.to_thread(self._parse_html, url, html_content_str)
+        )
+        return await asyncio.to_thread(
+            self._analyze_parsed, url, tree, html_content_str, response_headers, collected_links, technologies
+        )
+
+    async def analyze_many(self, jobs, max_concurrency=DEFAULT_MAX_CONCURRENCY, processes=None):
+        """
+        Analyzes several pages concurrently.
+
+        Args:
+            jobs (list): A list of dicts holding the keyword arguments of analyze_all_async
+                         (url, html_content_str, response_headers, collected_links).
+            max_concurrency (int): The maximum number of analyses in flight at once.
+            processes (int, optional): If set, the CPU-bound analyses run in a ProcessPoolExecutor
+                                       with this many worker processes, for parallelism across
+                                       cores. By default they run in threads.
+
+        Returns:
+            list: One entry per job, in order. Each entry is the BackendAnalysisResult,
+                  or the exception raised while analyzing that job.
+        """
+        logger.info(f"Starting batch backend analysis of {len(jobs)} pages (max concurrency: {max_concurrency}).")
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run_job(job, process_pool):
+            async with semaphore:
+                return await self.analyze_all_async(**job, process_pool=process_pool)
+
+        if not processes:
+            return await asyncio.gather(*(run_job(job, None) for job in jobs), return_exceptions=True)
+        with ProcessPoolExecutor(max_workers=processes) as process_pool:
+            return await asyncio.gather(*(run_job(job, process_pool) for job in jobs), return_exceptions=True)
+
+# BackendAnalyzer used by _analyze_in_worker, created once per worker process
+_worker_analyzer = None
+
+def _analyze_in_worker(url, html_content_str, response_headers, collected_links):
+    """
+    Process pool entry point: parses the page and runs the CPU-bound analyses.
+    response_headers must already be normalized. The technologies field is left for the caller to fill.
+    """
+    global _worker_analyzer
+    if _worker_analyzer is None:
+        _worker_analyzer = BackendAnalyzer()
+    tree = _worker_analyzer._parse_html(url, html_content_str)
+    return _worker_analyzer._analyze_parsed(url, tree, html_content_str, response_headers, collected_links, None)
+
 # Example Usage (for testing purposes)
 if __name__ == "__main__":
     # This setup should ideally be in the main application entry point
@@ -381,7 +917,7 @@ if __name__ == "__main__":
         
         logger.info("\n--- Full Analysis Results ---")
         # Pretty print the JSON-like dictionary for readability in logs
-        logger.info(json.dumps(full_analysis, indent=2))
+        logger.info(_dumps(full_analysis))
 
         # Test with a URL that might not be easily parsed by builtwith or has no clear tech
         # test_url_simple = "https://www.iana.org"
@@ -1,30 +1,386 @@
 # data_collector.py
 
+import asyncio
+import aiohttp
+import lxml.html
 import requests
+from lxml import etree
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
 import csv
+import gzip
+import hashlib
+import importlib.util
 import json
 import logging # Use standard logging
+import re
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import lru_cache, partial
 from datetime import datetime
 import os
+from urllib.parse import urlsplit
+
+try:
+    import orjson
+except ImportError:  # Optional; the standard json module is used instead
+    orjson = None
+
+try:
+    import httpx
+except ImportError:  # Optional; only needed for DataCollector(http2=True)
+    httpx = None
+
+try:
+    import trafilatura
+except ImportError:  # Optional; only needed for DataCollector(extractor="trafilatura")
+    trafilatura = None
+
+try:
+    import requests_cache
+except ImportError:  # Optional; without it every collection fetches the page from the network
+    requests_cache = None
 
 # Import custom exceptions
 from ..utils.custom_exceptions import DataCollectionError
+from ..utils.url_utils import origin_of, resolve_url
 
 # Get a logger for this module
 logger = logging.getLogger(__name__)
 
+# Timeout (seconds) for page fetches
+FETCH_TIMEOUT = 15
+# Connection caps of the aiohttp session used by collect_and_store_many
+MAX_CONNECTIONS = 100
+MAX_CONNECTIONS_PER_HOST = 8
+# Connection pooling of the requests session: number of hosts kept pooled, and connections kept per host
+POOL_CONNECTIONS = 32
+POOL_MAXSIZE = 64
+# Idle connections the HTTP/2 clients keep open (each multiplexes all requests to its host)
+HTTP2_MAX_KEEPALIVE_CONNECTIONS = 20
+# Connection-specific (hop-by-hop) request headers, which HTTP/2 forbids (RFC 9113, section 8.2.2)
+_HOP_BY_HOP_HEADERS = frozenset(("connection", "keep-alive", "proxy-connection", "transfer-encoding", "upgrade"))
+# Retries for failed connections and for transient HTTP errors, with exponential backoff
+FETCH_RETRIES = Retry(
+    total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504],
+    raise_on_status=False # Hand the last response back so raise_for_status reports its status code
+)
+# Seconds a cached response is reused without revalidation, unless its Cache-Control headers say otherwise
+HTTP_CACHE_EXPIRE_AFTER = 600
+# Write buffer size (bytes) of CsvBatchWriter, and how many rows it writes between flushes
+CSV_BUFFER_SIZE = 1 << 20
+CSV_FLUSH_EVERY = 256
+# Number of sanitized URL netlocs _safe_domain remembers
+SAFE_DOMAIN_CACHE_SIZE = 1024
+# Byte translation table for ASCII netlocs in filenames: letters, digits and "_" are kept, everything else becomes "_"
+_SAFE_FILENAME_TABLE = bytes(c if chr(c).isalnum() or c == ord("_") else ord("_") for c in range(256))
+# gzip level of compressed output files: most of the size reduction of level 9, at a fraction of the CPU time
+OUTPUT_COMPRESS_LEVEL = 3
+# Leading bytes of a gzip file
+_GZIP_MAGIC = b"\x1f\x8b"
+# Timestamp format of generated filenames (microseconds included for more uniqueness)
+FILENAME_TIMESTAMP_FORMAT = "%Y%m%d_%H%M%S_%f"
+# Text longer than this (in characters) is written to its own .txt file instead of inline in the JSON
+DEFAULT_MAX_INLINE_TEXT_BYTES = 65536
+# Write buffer size (bytes) for those text files
+TEXT_BUFFER_SIZE = 1 << 20
+# Default number of threads collect_and_store_batch runs collect_and_store in
+DEFAULT_MAX_WORKERS = 16
+# HTML parsers DataCollector can use: lxml trees built directly, or BeautifulSoup on top of lxml
+HTML_PARSERS = ("lxml-direct", "bs4")
+# Text and metadata extractors DataCollector can use: its own tree walk, or trafilatura's main-content extraction
+TEXT_EXTRACTORS = ("builtin", "trafilatura")
+
+# Precompiled queries for the lxml-direct parser
+_META_CONTENT_XPATH = etree.XPath("(//meta[@name=$name])[1]/@content", smart_strings=False)
+_LINK_HREFS_XPATH = etree.XPath("//a/@href", smart_strings=False)
+# Meta tags (by name) extract_metadata reports, in result order
+_METADATA_NAMES = ("description", "keywords", "author")
+# Link schemes extract_links skips
+_SKIPPED_LINK_SCHEMES = ("mailto:", "tel:", "javascript:")
+# Chunk size (bytes) in which parse_html_streaming feeds a streamed response to the parser
+STREAM_CHUNK_SIZE = 65536
+# A charset declaration (meta tag or XML declaration) near the start of a page
+_DECLARED_CHARSET_RE = re.compile(rb"<meta[^>]+charset|<\?xml[^>]+encoding", re.IGNORECASE)
+# Elements parse_html_streaming keeps: everything extract_metadata and extract_links read
+_STREAMED_TAGS = frozenset(("title", "meta", "a"))
+# Elements whose own text is not visible page text
+_INVISIBLE_TEXT_TAGS = frozenset(("script", "style"))
+
+def _parse_lxml(html_content):
+    """
+    Parses HTML into an lxml document tree. Bytes are decoded as UTF-8 when they are valid UTF-8;
+    otherwise libxml2 decodes them according to the page's own charset declaration.
+    """
+    raw_content = html_content
+    if isinstance(html_content, bytes):
+        try:
+            html_content = html_content.decode("utf-8-sig")
+        except UnicodeDecodeError:
+            pass
+    try:
+        try:
+            return lxml.html.document_fromstring(html_content)
+        except ValueError: # A decoded page starting with an XML encoding declaration
+            return lxml.html.document_fromstring(raw_content)
+    except etree.ParserError: # Nothing but whitespace or comments: an empty document, as BeautifulSoup gives
+        return lxml.html.document_fromstring("<html></html>")
+
+@lru_cache(maxsize=SAFE_DOMAIN_CACHE_SIZE)
+def _safe_domain(netloc):
+    """Sanitizes a URL netloc for use in filenames: dots, port colons and other symbols become "_"."""
+    if netloc.isascii():
+        return netloc.encode("ascii").translate(_SAFE_FILENAME_TABLE).decode("ascii")
+    return "".join(c if c.isalnum() or c == "_" else "_" for c in netloc) # Internationalized names keep their letters
+
+def _open_output(path, mode, compress, **kwargs):
+    """Opens an output file for writing, through gzip when compress is set (buffering is then left to gzip)."""
+    if compress:
+        kwargs.pop("buffering", None)
+        return gzip.open(path, mode, compresslevel=OUTPUT_COMPRESS_LEVEL, **kwargs)
+    return open(path, mode, **kwargs)
+
+def open_collected_file(path, mode="rt", encoding="utf-8"):
+    """
+    Opens a file written by DataCollector for reading, whether or not it was written with
+    compress=True: gzip files are recognized by their leading bytes, not their name.
+
+    Args:
+        path (str): The CSV, JSON or text file to open.
+        mode (str): "rt" (default) or "rb".
+        encoding (str): The text encoding, for "rt".
+
+    Returns:
+        file object: The open file, decompressed as it is read.
+    """
+    with open(path, "rb") as f:
+        compressed = f.read(2) == _GZIP_MAGIC
+    text_options = {"encoding": encoding, "newline": ""} if "b" not in mode else {}
+    if compressed:
+        return gzip.open(path, mode, **text_options)
+    return open(path, mode, **text_options)
+
+def _response_charset(response):
+    """The charset given in a response's Content-Type header, or None."""
+    return response.encoding if "charset=" in response.headers.get("Content-Type", "").lower() else None
+
+def _iter_visible_text(tree):
+    """Yields the text pieces of an lxml tree in document order, skipping scripts, styles and comments."""
+    for event, element in etree.iterwalk(tree, events=("start", "end", "comment", "pi")):
+        if event == "start":
+            if element.text and element.tag not in _INVISIBLE_TEXT_TAGS:
+                yield element.text
+        elif element.tail and element is not tree: # "end", or a comment/processing instruction: only its tail is text
+            yield element.tail
+
+def _dump_json_bytes(data):
+    """Serializes data to indented UTF-8 JSON, with orjson when it is available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=4, ensure_ascii=False).encode("utf-8")
+
+def _dumps_compact(data):
+    """Serializes data to a compact JSON string, with orjson when it is available."""
+    if orjson is not None:
+        return orjson.dumps(data).decode("utf-8")
+    return json.dumps(data)
+
+def _keep_streamed_elements(parser, skeleton):
+    """
+    Drains the pending "end" events of a pull parser: copies title, meta and a elements into
+    skeleton, then discards every completed element (and its earlier siblings) from the parse tree.
+    """
+    for _, element in parser.read_events():
+        if element.tag in _STREAMED_TAGS:
+            kept = etree.SubElement(skeleton, element.tag, attrib=dict(element.attrib))
+            if element.tag == "title":
+                kept.text = element.text
+        element.clear(keep_tail=False)
+        parent = element.getparent()
+        if parent is not None:
+            while element.getprevious() is not None:
+                del parent[0]
+
+def _walk_page(tree):
+    """
+    Gathers in a single walk over an lxml tree what extract_metadata, extract_links and
+    extract_all_text each collect: the metadata dict, the raw href values and the visible
+    text pieces (in document order, without scripts, styles and comments).
+    """
+    title_element = None
+    meta_contents = {}
+    hrefs = []
+    text_pieces = []
+    for event, element in etree.iterwalk(tree, events=("start", "end", "comment", "pi")):
+        if event == "start":
+            tag = element.tag
+            if tag == "a":
+                href = element.get("href")
+                if href is not None:
+                    hrefs.append(href)
+            elif tag == "meta":
+                name = element.get("name")
+                if name in _METADATA_NAMES and name not in meta_contents: # The first tag of each name counts
+                    meta_contents[name] = element.get("content")
+            elif tag == "title" and title_element is None:
+                title_element = element
+            if element.text and tag not in _INVISIBLE_TEXT_TAGS:
+                text_pieces.append(element.text)
+        elif element.tail and element is not tree: # "end", or a comment/processing instruction: only its tail is text
+            text_pieces.append(element.tail)
+
+    title = title_element.text if title_element is not None else None
+    metadata = {"title": title.strip() if title else None}
+    for name in _METADATA_NAMES:
+        content = meta_contents.get(name)
+        metadata[name] = content.strip() if content is not None else None
+    return metadata, hrefs, text_pieces
+
+def _trafilatura_extract(tree, url):
+    """
+    Runs trafilatura on an lxml tree (which it leaves unchanged).
+
+    Returns:
+        tuple: (metadata dict with the title, description, keywords and author trafilatura found,
+               each None when it found none; main text), or None if it found no main content.
+    """
+    try:
+        document = trafilatura.bare_extraction(tree, url=url, with_metadata=True, include_comments=False)
+    except Exception as e: # Its heuristics can fail on unusual markup
+        logger.warning(f"trafilatura extraction failed for {url}, using the builtin extractor: {e}")
+        return None
+    if document is None or not document.text:
+        return None
+    metadata = {
+        "title": document.title,
+        "description": document.description,
+        "keywords": ", ".join(document.tags) if document.tags else None,
+        "author": document.author
+    }
+    return metadata, document.text
+
+def _absolute_links(hrefs, base_url):
+    """Returns the set of absolute URLs of the given href values, skipping mailto:, tel: and javascript: links."""
+    links = set()
+    origin = origin_of(base_url) # Parsed once; root-relative and absolute links skip urljoin
+    add_link = links.add
+    for href in hrefs:
+        href = href.strip()
+        if href and not href.startswith(_SKIPPED_LINK_SCHEMES):
+            add_link(resolve_url(origin, base_url, href))
+    return links
+
+@dataclass(slots=True)
+class FetchedPage:
+    """A fetched page, independent of the HTTP client that fetched it."""
+    url: str # Final URL, after any redirects
+    status_code: int
+    request_headers: dict
+    response_headers: dict
+    content: bytes
+
+class CsvBatchWriter:
+    """
+    Appends the CSV rows of many collections to a single file through one buffered DictWriter,
+    instead of writing one file per URL. The header is taken from the first row. Writes are
+    serialized with a lock, so the thread-pool and asyncio batch paths can share one writer.
+    """
+
+    def __init__(self, path, flush_every=CSV_FLUSH_EVERY, compress=False):
+        """
+        Opens path for writing.
+
+        Args:
+            path (str): The CSV file to write.
+            flush_every (int): Number of rows written between flushes to disk.
+            compress (bool): Write the file gzip-compressed.
+        Raises:
+            OSError: If the file cannot be opened.
+        """
+        self.path = path
+        self.flush_every = flush_every
+        self._file = _open_output(path, "wt", compress, newline="", encoding="utf-8", buffering=CSV_BUFFER_SIZE)
+        self._writer = None # Created with the first row, whose keys become the header
+        self._unflushed_rows = 0
+        self._lock = threading.Lock()
+
+    def writerows(self, rows):
+        """Appends rows (dictionaries) to the file."""
+        with self._lock:
+            for row in rows:
+                if self._writer is None:
+                    self._writer = csv.DictWriter(self._file, fieldnames=list(row.keys()), restval="")
+                    self._writer.writeheader()
+                self._writer.writerow(row)
+                self._unflushed_rows += 1
+            if self._unflushed_rows >= self.flush_every:
+                self._file.flush()
+                self._unflushed_rows = 0
+
+    def close(self):
+        """Flushes and closes the file."""
+        with self._lock:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
 class DataCollector:
     """Handles the collection of data from websites."""
 
-    def __init__(self, output_directory="collected_data"):
+    def __init__(self, output_directory="collected_data", max_workers=DEFAULT_MAX_WORKERS, parser="lxml-direct",
+                 use_http_cache=True, max_inline_text_bytes=DEFAULT_MAX_INLINE_TEXT_BYTES, http2=False, compress=False,
+                 extractor="builtin"):
         """
         Initializes the DataCollector.
 
         Args:
             output_directory (str): The directory where collected data will be stored.
+            max_workers (int): Default number of threads used by collect_and_store_batch.
+            parser (str): "lxml-direct" (default) parses pages into lxml trees; "bs4" keeps the
+                          former BeautifulSoup parsing, as a fallback.
+            use_http_cache (bool): Cache responses on disk (in output_directory/.http_cache), honoring
+                                   Cache-Control and revalidating with ETag/Last-Modified, so unchanged
+                                   pages are neither downloaded nor processed again. Requires the
+                                   optional requests_cache package; ignored without it.
+            max_inline_text_bytes (int): Extracted text longer than this (in characters) is stored in a
+                                         separate .txt file referenced from the JSON, not inline.
+            http2 (bool): Fetch with httpx over HTTP/2 (falling back to HTTP/1.1 for servers that do
+                          not offer it), so concurrent fetches to one host share a single connection.
+                          Such fetches bypass the HTTP cache, the retries and streamed parsing.
+                          Requires the optional httpx[http2] package; ignored without it.
+            compress (bool): Write the CSV, JSON and text outputs gzip-compressed, with a ".gz"
+                             suffix. open_collected_file reads both forms.
+            extractor (str): "builtin" (default) extracts all visible text of a page; "trafilatura"
+                             extracts the main content of article-like pages, without navigation
+                             and boilerplate, and prefers its metadata (which also reads Open Graph
+                             and similar tags). Pages where trafilatura finds no main content, pages
+                             parsed with bs4 and link extraction use the builtin extractor. Requires
+                             the optional trafilatura package; ignored without it.
+        Raises:
+            DataCollectionError: If the output directory cannot be created, or the parser or extractor is unknown.
         """
+        if parser not in HTML_PARSERS:
+            raise DataCollectionError(f"Unknown HTML parser {parser!r}; expected one of {HTML_PARSERS}")
+        if extractor not in TEXT_EXTRACTORS:
+            raise DataCollectionError(f"Unknown text extractor {extractor!r}; expected one of {TEXT_EXTRACTORS}")
+        if extractor == "trafilatura" and trafilatura is None:
+            logger.warning("trafilatura is not installed; using the builtin text extractor instead.")
+            extractor = "builtin"
         self.output_directory = output_directory
+        self.max_workers = max_workers
+        self.parser = parser
+        self.max_inline_text_bytes = max_inline_text_bytes
+        self.compress = compress
+        self.extractor = extractor
+        self._csv_batch_writer = None # Set while a csv_batch() context is active
         try:
             if not os.path.exists(self.output_directory):
                 os.makedirs(self.output_directory)
@@ -32,20 +388,64 @@ class DataCollector:
             logger.error(f"Failed to create output directory {self.output_directory}: {e}")
             raise DataCollectionError(f"Failed to create output directory {self.output_directory}: {e}")
             
-        self.session = requests.Session()
+        self.http_cache_directory = os.path.join(self.output_directory, ".http_cache")
+        if use_http_cache and requests_cache is not None:
+            self.session = requests_cache.CachedSession(
+                os.path.join(self.http_cache_directory, "responses"), backend="sqlite",
+                cache_control=True, expire_after=HTTP_CACHE_EXPIRE_AFTER
+            )
+        else:
+            self.session = requests.Session()
+        # Keep-alive connections are pooled per host, so repeated fetches skip the TCP/TLS handshake
+        adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE, max_retries=FETCH_RETRIES, pool_block=False)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
         self.session.headers.update({
             # Standard User-Agent to avoid being blocked by simple checks
             # Users should be aware of the implications of User-Agent strings.
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36 WebAnalysisTool/1.0"
+            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36 WebAnalysisTool/1.0",
+            "Connection": "keep-alive",
+            # Compressed bodies; br is only advertised when a Brotli decoder is installed
+            "Accept-Encoding": ACCEPT_ENCODING
         })
+        self.http2 = http2 and self._http2_available()
+        self.http2_client = httpx.Client(**self._http2_client_options()) if self.http2 else None
         logger.info(f"DataCollector initialized. Output directory: {self.output_directory}")
 
-    def fetch_page(self, url):
+    @staticmethod
+    def _http2_available():
+        """Whether httpx and its h2 dependency are installed, logging a warning when they are not."""
+        if httpx is None:
+            logger.warning("httpx is not installed; fetching over HTTP/1.1 with requests instead.")
+            return False
+        # httpx needs h2 for http2=True; only check that it is installed
+        if importlib.util.find_spec("h2") is None:
+            logger.warning("httpx is installed without HTTP/2 support (httpx[http2]); fetching with requests instead.")
+            return False
+        return True
+
+    def _http2_headers(self):
+        """The session headers without the hop-by-hop ones (the session sends "Connection: keep-alive")."""
+        return {name: value for name, value in self.session.headers.items() if name.lower() not in _HOP_BY_HOP_HEADERS}
+
+    def _http2_client_options(self):
+        """Arguments of the httpx.Client/httpx.AsyncClient used when http2 is enabled."""
+        return {
+            "http2": True,
+            "headers": self._http2_headers(),
+            "timeout": FETCH_TIMEOUT,
+            "limits": httpx.Limits(max_connections=MAX_CONNECTIONS, max_keepalive_connections=HTTP2_MAX_KEEPALIVE_CONNECTIONS),
+            "follow_redirects": True # As requests does
+        }
+
+    def fetch_page(self, url, stream=False):
         """
         Fetches the content of a given URL.
 
         Args:
             url (str): The URL to fetch.
+            stream (bool): If True, only the headers are read; the body is left to be streamed,
+                           e.g. by parse_html_streaming.
 
         Returns:
             requests.Response: The response object if successful.
@@ -54,11 +454,11 @@ class DataCollector:
         """
         try:
             logger.info(f"Fetching URL: {url}")
-            response = self.session.get(url, timeout=15) # Increased timeout slightly
+            response = self.session.get(url, timeout=FETCH_TIMEOUT, stream=stream)
             response.raise_for_status()  # Raises an HTTPError for bad responses (4XX or 5XX)
             
-            logger.debug(f"Request Headers for {url}: {response.request.headers}")
-            logger.debug(f"Response Headers for {url}: {response.headers}")
+            logger.debug("Request Headers for %s: %s", url, response.request.headers)
+            logger.debug("Response Headers for %s: %s", url, response.headers)
             logger.info(f"Successfully fetched {url} with status code: {response.status_code}")
             
             return response
@@ -72,42 +472,177 @@ class DataCollector:
             logger.error(f"Generic error fetching {url}: {e}")
             raise DataCollectionError(f"Error fetching {url}: {e}")
 
+    @staticmethod
+    def _http2_page(response):
+        """Checks an httpx response's status and returns it as a FetchedPage."""
+        response.raise_for_status()  # Raises an HTTPStatusError for bad responses (4XX or 5XX)
+        page = FetchedPage(
+            url=str(response.url),
+            status_code=response.status_code,
+            request_headers=dict(response.request.headers),
+            response_headers=dict(response.headers),
+            content=response.content
+        )
+        logger.debug("Request Headers for %s: %s", page.url, page.request_headers)
+        logger.debug("Response Headers for %s: %s", page.url, page.response_headers)
+        logger.info(f"Successfully fetched {page.url} over {response.http_version} with status code: {page.status_code}")
+        return page
+
+    @staticmethod
+    def _http2_error(url, e):
+        """Logs an httpx error raised while fetching url and returns the DataCollectionError to raise."""
+        if isinstance(e, httpx.TimeoutException):
+            logger.error(f"Timeout error fetching {url}: {e}")
+            return DataCollectionError(f"Timeout error fetching {url}: {e}")
+        if isinstance(e, httpx.HTTPStatusError):
+            logger.error(f"HTTP error for {url}: {e}. Status code: {e.response.status_code}")
+            return DataCollectionError(f"HTTP error for {url}: {e}. Status code: {e.response.status_code}")
+        logger.error(f"Generic error fetching {url}: {e}")
+        return DataCollectionError(f"Error fetching {url}: {e}")
+
+    def fetch_page_http2(self, url):
+        """
+        Fetches the content of a given URL with the HTTP/2 client (see the http2 argument of DataCollector).
+
+        Args:
+            url (str): The URL to fetch.
+
+        Returns:
+            FetchedPage: The fetched page, with its body fully read.
+        Raises:
+            DataCollectionError: If fetching or response validation fails.
+        """
+        try:
+            logger.info(f"Fetching URL: {url}")
+            return self._http2_page(self.http2_client.get(url))
+        except httpx.HTTPError as e:
+            raise self._http2_error(url, e)
+
     def parse_html(self, html_content):
         """
-        Parses HTML content using BeautifulSoup.
+        Parses HTML content with lxml, or with BeautifulSoup when the collector uses parser="bs4".
 
         Args:
             html_content (str or bytes): The HTML content to parse.
 
         Returns:
-            BeautifulSoup: The BeautifulSoup object.
+            lxml.html.HtmlElement or BeautifulSoup: The root of the parsed document.
         Raises:
             DataCollectionError: If HTML parsing fails.
         """
         try:
-            soup = BeautifulSoup(html_content, "lxml")
+            if self.parser == "bs4":
+                soup = BeautifulSoup(html_content, "lxml")
+            else:
+                soup = _parse_lxml(html_content)
             logger.info("HTML content parsed successfully.")
             return soup
-        except Exception as e: # BeautifulSoup can raise various errors
+        except Exception as e: # lxml and BeautifulSoup can raise various errors
             logger.error(f"Error parsing HTML: {e}")
             raise DataCollectionError(f"Error parsing HTML: {e}")
 
+    def parse_html_streaming(self, response):
+        """
+        Parses a streamed response incrementally, as its body arrives, keeping only the title,
+        meta and a elements. Everything else is discarded as soon as it is complete, and the
+        body is never held in memory as a whole, so memory stays flat regardless of page size.
+
+        Args:
+            response (requests.Response): A response from fetch_page(url, stream=True). It is closed once read.
+
+        Returns:
+            lxml.html.HtmlElement: A skeleton document holding the kept elements, for extract_metadata
+                                   and extract_links (it holds no other page text).
+        Raises:
+            DataCollectionError: If reading or parsing the response fails.
+        """
+        skeleton = lxml.html.Element("html")
+        # A charset from the Content-Type header wins; otherwise libxml2 uses the page's own declaration.
+        encoding = _response_charset(response)
+        parser = etree.HTMLPullParser(events=("end",), encoding=encoding)
+        try:
+            with response:
+                for chunk in response.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+                    parser.feed(chunk)
+                    _keep_streamed_elements(parser, skeleton)
+            try:
+                parser.close()
+            except etree.XMLSyntaxError: # Nothing but whitespace or comments: an empty document
+                pass
+            _keep_streamed_elements(parser, skeleton)
+            logger.info("HTML content parsed successfully (streamed).")
+            return skeleton
+        except Exception as e:
+            logger.error(f"Error parsing streamed HTML: {e}")
+            raise DataCollectionError(f"Error parsing streamed HTML: {e}")
+
+    def parse_html_incremental(self, response):
+        """
+        Parses a streamed response into a complete lxml document, feeding the parser each chunk as
+        it is decompressed, so the body is never held in memory as one bytes object next to the tree.
+
+        The encoding must be known before the first chunk is parsed: it is taken from the
+        Content-Type header, or left to libxml2 when the first chunk declares a charset. Otherwise
+        the body is read whole and parsed by parse_html, which prefers UTF-8 when the bytes are valid UTF-8.
+
+        Args:
+            response (requests.Response): A response from fetch_page(url, stream=True). It is closed once read.
+
+        Returns:
+            lxml.html.HtmlElement: The root of the parsed document.
+        Raises:
+            DataCollectionError: If reading or parsing the response fails.
+        """
+        encoding = _response_charset(response)
+        try:
+            with response:
+                chunks = response.iter_content(chunk_size=STREAM_CHUNK_SIZE)
+                first_chunk = next(chunks, b"")
+                if encoding is None and not _DECLARED_CHARSET_RE.search(first_chunk):
+                    return self.parse_html(first_chunk + b"".join(chunks))
+                parser = lxml.html.HTMLParser(encoding=encoding)
+                parser.feed(first_chunk)
+                for chunk in chunks:
+                    parser.feed(chunk)
+            try:
+                tree = parser.close()
+            except etree.XMLSyntaxError:
+                tree = None
+            if tree is None: # Nothing but whitespace or comments: an empty document, as parse_html gives
+                tree = lxml.html.document_fromstring("<html></html>")
+            logger.info("HTML content parsed successfully (incrementally).")
+            return tree
+        except DataCollectionError:
+            raise
+        except Exception as e:
+            logger.error(f"Error parsing streamed HTML: {e}")
+            raise DataCollectionError(f"Error parsing streamed HTML: {e}")
+
     def extract_metadata(self, soup):
         """
-        Extracts metadata from a BeautifulSoup object.
+        Extracts metadata from a parsed page.
 
         Args:
-            soup (BeautifulSoup): The BeautifulSoup object of the parsed page.
+            soup (lxml.html.HtmlElement or BeautifulSoup): The parsed page, as returned by parse_html.
 
         Returns:
             dict: A dictionary containing extracted metadata.
         """
         metadata = {}
-        if not soup:
+        if soup is None:
             logger.warning("Soup object is None, cannot extract metadata.")
             return metadata
 
         try:
+            if not isinstance(soup, BeautifulSoup):
+                title_tag = soup.find(".//title")
+                metadata["title"] = title_tag.text.strip() if title_tag is not None and title_tag.text else None
+                for name in ("description", "keywords", "author"):
+                    content = _META_CONTENT_XPATH(soup, name=name)
+                    metadata[name] = content[0].strip() if content else None
+                logger.info("Extracted metadata: %s", metadata)
+                return metadata
+
             title_tag = soup.find("title")
             metadata["title"] = title_tag.string.strip() if title_tag and title_tag.string else None
 
@@ -120,7 +655,7 @@ class DataCollector:
             author_tag = soup.find("meta", attrs={"name": "author"})
             metadata["author"] = author_tag["content"].strip() if author_tag and author_tag.has_attr("content") else None
             
-            logger.info(f"Extracted metadata: {metadata}")
+            logger.info("Extracted metadata: %s", metadata)
         except Exception as e:
             logger.error(f"Error during metadata extraction: {e}", exc_info=True)
             # Continue with what was extracted, or raise error depending on desired strictness
@@ -128,78 +663,177 @@ class DataCollector:
 
     def extract_links(self, soup, base_url):
         """
-        Extracts all hyperlinks from a BeautifulSoup object.
+        Extracts all hyperlinks from a parsed page.
 
         Args:
-            soup (BeautifulSoup): The BeautifulSoup object.
+            soup (lxml.html.HtmlElement or BeautifulSoup): The parsed page, as returned by parse_html.
             base_url (str): The base URL of the page, for resolving relative links.
 
         Returns:
             list: A list of absolute URLs found on the page.
         """
         links = set() # Use a set to avoid duplicate links initially
-        if not soup:
+        if soup is None:
             logger.warning("Soup object is None, cannot extract links.")
             return []
         
-        from urllib.parse import urljoin # Moved import here to keep it local if needed
         try:
-            for a_tag in soup.find_all("a", href=True):
-                href = a_tag["href"].strip()
-                if href and not href.startswith(("mailto:", "tel:", "javascript:")):
-                    absolute_link = urljoin(base_url, href)
-                    links.add(absolute_link)
-            logger.info(f"Extracted {len(links)} unique links.")
+            if isinstance(soup, BeautifulSoup):
+                hrefs = (a_tag["href"] for a_tag in soup.find_all("a", href=True))
+            else:
+                hrefs = _LINK_HREFS_XPATH(soup)
+            links = _absolute_links(hrefs, base_url)
+            logger.info("Extracted %d unique links.", len(links))
         except Exception as e:
             logger.error(f"Error during link extraction: {e}", exc_info=True)
         return list(links)
 
     def extract_all_text(self, soup):
         """
-        Extracts all visible text content from a BeautifulSoup object.
+        Extracts all visible text content (everything but scripts and styles) from a parsed page.
 
         Args:
-            soup (BeautifulSoup): The BeautifulSoup object.
+            soup (lxml.html.HtmlElement or BeautifulSoup): The parsed page, as returned by parse_html.
+                A BeautifulSoup page has its script and style tags removed; an lxml tree is left unchanged.
 
         Returns:
             str: All extracted text, concatenated.
         """
-        if not soup:
+        if soup is None:
             logger.warning("Soup object is None, cannot extract text.")
             return ""
         try:
+            if not isinstance(soup, BeautifulSoup):
+                text = " ".join(stripped for stripped in map(str.strip, _iter_visible_text(soup)) if stripped)
+                logger.info("Extracted text length: %d characters.", len(text))
+                return text
+
             for script_or_style in soup(["script", "style"]):
                 script_or_style.decompose()
             text = soup.get_text(separator=" ", strip=True)
-            logger.info(f"Extracted text length: {len(text)} characters.")
+            logger.info("Extracted text length: %d characters.", len(text))
             return text
         except Exception as e:
             logger.error(f"Error during text extraction: {e}", exc_info=True)
             return "" # Return empty string on error
 
-    def _generate_filename(self, url, extension):
+    def extract_page_data(self, soup, base_url, collect_text=True, collect_links=True):
+        """
+        Extracts metadata, links and text together. On an lxml tree this is a single walk over
+        the page instead of one traversal per extractor; a BeautifulSoup page goes through
+        extract_metadata, extract_all_text and extract_links in turn. With the trafilatura
+        extractor, the text (and the metadata it finds) of an lxml tree come from trafilatura.
+
+        Args:
+            soup (lxml.html.HtmlElement or BeautifulSoup): The parsed page, as returned by parse_html.
+            base_url (str): The base URL of the page, for resolving relative links.
+            collect_text (bool): Whether to extract the text.
+            collect_links (bool): Whether to extract the links.
+
+        Returns:
+            tuple: (metadata dict, list of absolute links or None, text or None), as the individual
+                   extractors return them; links and text are None when not collected.
+        """
+        if soup is not None and not isinstance(soup, BeautifulSoup):
+            try:
+                metadata, hrefs, text_pieces = _walk_page(soup)
+                main_content = None
+                if collect_text and self.extractor == "trafilatura":
+                    main_content = _trafilatura_extract(soup, base_url)
+                text = None
+                if main_content is not None:
+                    main_metadata, text = main_content
+                    metadata = {name: main_metadata[name] or value for name, value in metadata.items()}
+                elif collect_text:
+                    text = " ".join(stripped for stripped in map(str.strip, text_pieces) if stripped)
+                links = None
+                if collect_links:
+                    links = list(_absolute_links(hrefs, base_url))
+                if logger.isEnabledFor(logging.INFO): # Runs for every page; skipped outright when INFO is off
+                    logger.info("Extracted metadata: %s", metadata)
+                    if text is not None:
+                        logger.info("Extracted text length: %d characters.", len(text))
+                    if links is not None:
+                        logger.info("Extracted %d unique links.", len(links))
+                return metadata, links, text
+            except Exception as e:
+                logger.error(f"Error during single-pass page extraction, extracting separately: {e}", exc_info=True)
+
+        metadata = self.extract_metadata(soup)
+        text = self.extract_all_text(soup) if collect_text else None
+        links = self.extract_links(soup, base_url) if collect_links else None
+        return metadata, links, text
+
+    def _generate_filename(self, url, extension, ts=None):
         """
-        Generates a sanitized filename based on the URL and current timestamp.
+        Generates a sanitized filename based on the URL and a timestamp.
+
+        Args:
+            url (str): The URL the file holds data for.
+            extension (str): The file extension.
+            ts (str, optional): The timestamp, formatted with FILENAME_TIMESTAMP_FORMAT, so that
+                                the files of one collection share it. Defaults to the current time.
+
+        Returns:
+            str: The file path, ending in ".gz" when the collector compresses its outputs.
         """
         try:
-            domain = url.split("//")[-1].split("/")[0].replace(".", "_").replace(":", "_") # Sanitize port numbers too
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f") # Added microseconds for more uniqueness
-            safe_domain = "".join(c if c.isalnum() or c in (".", "_") else "_" for c in domain)
+            safe_domain = _safe_domain(url.split("//")[-1].split("/")[0])
+            timestamp = ts or datetime.now().strftime(FILENAME_TIMESTAMP_FORMAT)
+            if self.compress:
+                extension += ".gz"
             return os.path.join(self.output_directory, f"{safe_domain}_{timestamp}.{extension}")
         except Exception as e:
             logger.error(f"Error generating filename for URL {url}: {e}")
             # Fallback filename
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+            timestamp = ts or datetime.now().strftime(FILENAME_TIMESTAMP_FORMAT)
+            if self.compress:
+                extension += ".gz"
             return os.path.join(self.output_directory, f"error_filename_{timestamp}.{extension}")
 
-    def save_data_to_csv(self, data_list, url, filename_prefix="web_extract"):
+    @contextmanager
+    def csv_batch(self, path=None):
         """
-        Saves a list of dictionaries to a CSV file.
+        Context manager under which save_data_to_csv (and so every collect_and_store, including
+        the collect_and_store_batch and collect_and_store_many threads) appends its rows to one
+        shared CSV file instead of creating a file per URL. Worker processes of
+        collect_and_store_many(processes=...) still write their own files.
+
+        Args:
+            path (str, optional): The CSV file to write. Defaults to a timestamped file in the output directory.
+
+        Yields:
+            CsvBatchWriter: The active writer; its path is also returned as csv_filepath.
+        Raises:
+            DataCollectionError: If the file cannot be opened.
+        """
+        if path is None:
+            extension = "csv.gz" if self.compress else "csv"
+            path = os.path.join(self.output_directory, f"batch_{datetime.now().strftime(FILENAME_TIMESTAMP_FORMAT)}.{extension}")
+        try:
+            writer = CsvBatchWriter(path, compress=self.compress)
+        except OSError as e:
+            logger.error(f"Failed to open batch CSV file {path}: {e}")
+            raise DataCollectionError(f"Failed to open batch CSV file {path}: {e}")
+        self._csv_batch_writer = writer
+        logger.info(f"Batch CSV output started: {path}")
+        try:
+            yield writer
+        finally:
+            self._csv_batch_writer = None
+            writer.close()
+            logger.info(f"Batch CSV output finished: {path}")
+
+    def save_data_to_csv(self, data_list, url, filename_prefix="web_extract", ts=None):
+        """
+        Saves a list of dictionaries to a CSV file, or appends them to the batch file while a
+        csv_batch() context is active.
 
         Args:
             data_list (list): A list of dictionaries to save.
             url (str): The URL from which data was collected, used for filename generation.
             filename_prefix (str): Prefix for the filename (currently not used in _generate_filename, but kept for compatibility).
+            ts (str, optional): Filename timestamp (see _generate_filename). Defaults to the current time.
 
         Returns:
             str: The path to the saved file.
@@ -209,10 +843,20 @@ class DataCollector:
         if not data_list:
             logger.warning("No data provided to save to CSV.")
             raise DataCollectionError("No data to save to CSV.")
+
+        batch_writer = self._csv_batch_writer
+        if batch_writer is not None and isinstance(data_list[0], dict):
+            try:
+                batch_writer.writerows(data_list)
+            except (OSError, ValueError) as e: # ValueError: a row with keys outside the batch header
+                logger.error(f"Error appending data for {url} to batch CSV {batch_writer.path}: {e}")
+                raise DataCollectionError(f"Failed to append data for {url} to batch CSV {batch_writer.path}: {e}")
+            logger.info(f"Data for {url} appended to batch CSV: {batch_writer.path}")
+            return batch_writer.path
         
-        filename = self._generate_filename(url, "csv")
+        filename = self._generate_filename(url, "csv", ts=ts)
         try:
-            with open(filename, "w", newline="", encoding="utf-8") as csvfile:
+            with _open_output(filename, "wt", self.compress, newline="", encoding="utf-8") as csvfile:
                 if not data_list: # Should be caught above, but double check
                     raise DataCollectionError("Cannot write empty data_list to CSV.")
                 
@@ -240,7 +884,31 @@ class DataCollector:
             logger.error(f"Unexpected error saving data to CSV {filename}: {e}", exc_info=True)
             raise DataCollectionError(f"Unexpected error saving data to CSV {filename}: {e}")
 
-    def save_data_to_json(self, data, url, filename_prefix="web_extract_details"):
+    def save_text_to_file(self, text, url, ts=None):
+        """
+        Saves extracted text to a .txt file, streamed through a large write buffer.
+
+        Args:
+            text (str): The text to save.
+            url (str): The URL the text was extracted from, used for filename generation.
+            ts (str, optional): Filename timestamp (see _generate_filename). Defaults to the current time.
+
+        Returns:
+            str: The path to the saved file.
+        Raises:
+            DataCollectionError: If saving the text fails.
+        """
+        filename = self._generate_filename(url, "txt", ts=ts)
+        try:
+            with _open_output(filename, "wt", self.compress, encoding="utf-8", buffering=TEXT_BUFFER_SIZE) as textfile:
+                textfile.write(text)
+            logger.info(f"Text saved to: {filename}")
+            return filename
+        except (IOError, UnicodeError) as e:
+            logger.error(f"Error saving text to {filename}: {e}")
+            raise DataCollectionError(f"Failed to save text to {filename}: {e}")
+
+    def save_data_to_json(self, data, url, filename_prefix="web_extract_details", ts=None):
         """
         Saves data to a JSON file.
 
@@ -248,6 +916,7 @@ class DataCollector:
             data (dict or list): The data to save.
             url (str): The URL from which data was collected, used for filename generation.
             filename_prefix (str): Prefix for the filename.
+            ts (str, optional): Filename timestamp (see _generate_filename). Defaults to the current time.
 
         Returns:
             str: The path to the saved file.
@@ -258,10 +927,10 @@ class DataCollector:
             logger.warning("No data provided to save to JSON.")
             raise DataCollectionError("No data to save to JSON.")
 
-        filename = self._generate_filename(url, "json")
+        filename = self._generate_filename(url, "json", ts=ts)
         try:
-            with open(filename, "w", encoding="utf-8") as jsonfile:
-                json.dump(data, jsonfile, indent=4, ensure_ascii=False)
+            with _open_output(filename, "wb", self.compress) as jsonfile:
+                jsonfile.write(_dump_json_bytes(data))
             logger.info(f"Data saved to JSON: {filename}")
             return filename
         except IOError as e:
@@ -274,108 +943,359 @@ class DataCollector:
             logger.error(f"Unexpected error saving data to JSON {filename}: {e}", exc_info=True)
             raise DataCollectionError(f"Unexpected error saving data to JSON {filename}: {e}")
 
-    def collect_and_store(self, url, collect_text=True, collect_links=True, store_csv=True, store_json=True):
+    def _stored_results_path(self, url, options):
+        """Path of the stored collect_and_store results for url, keyed on a SHA-1 of the normalized URL and options."""
+        url_parts = urlsplit(url)
+        normalized_url = url_parts._replace(scheme=url_parts.scheme.lower(), netloc=url_parts.netloc.lower(), fragment="").geturl()
+        key = hashlib.sha1(f"{normalized_url} {options}".encode("utf-8")).hexdigest()
+        return os.path.join(self.http_cache_directory, "stored_results", f"{key}.json")
+
+    def _load_stored_results(self, url, options):
+        """Returns the results stored for url by an earlier collect_and_store, or None if there are none (or their files are gone)."""
+        try:
+            with open(self._stored_results_path(url, options), "r", encoding="utf-8") as f:
+                results = json.load(f)
+        except (OSError, ValueError):
+            return None
+        for stored_file in (results.get("csv_filepath"), results.get("json_filepath"), results.get("full_text_content_path")):
+            if stored_file and not os.path.exists(stored_file):
+                return None
+        return results
+
+    def _save_stored_results(self, url, options, results):
+        """Remembers results for url, so an unchanged page can be answered from them next time."""
+        stored_results_path = self._stored_results_path(url, options)
+        try:
+            os.makedirs(os.path.dirname(stored_results_path), exist_ok=True)
+            with open(stored_results_path, "w", encoding="utf-8") as f:
+                json.dump({**results, "parsed_tree": None}, f, ensure_ascii=False)
+        except (OSError, TypeError) as e:
+            logger.warning(f"Could not remember the stored results for {url}: {e}")
+
+    def _process_page(self, url, page, collect_text=True, collect_links=True, store_csv=True, store_json=True, soup=None):
         """
-        Orchestrates the collection and storage of data from a URL.
+        Parses, extracts and stores an already fetched page: the CPU and disk bound part of
+        collect_and_store, shared by the sequential and the concurrent collection paths.
 
         Args:
-            url (str): The URL to process.
-            collect_text (bool): Whether to extract all text.
-            collect_links (bool): Whether to extract all links.
-            store_csv (bool): Whether to save extracted data to CSV.
-            store_json (bool): Whether to save extracted data (metadata primarily) to JSON.
+            url (str): The URL that was requested.
+            page (FetchedPage): The fetched page.
+            collect_text, collect_links, store_csv, store_json: As for collect_and_store.
+            soup (optional): The page as already parsed (e.g. by parse_html_streaming), in which
+                             case page.content is not parsed and no parsed tree is returned.
 
         Returns:
-            dict: A dictionary containing paths to saved files and extracted data.
-        Raises:
-            DataCollectionError: If a critical step in collection or storage fails.
+            dict: The collect_and_store results.
         """
-        logger.info(f"Starting collection and storage process for URL: {url}")
         results = {
             "url": url,
             "metadata": None,
             "text_content_preview": None,
             "full_text_content_path": None, # Path to separate file if text is too long
             "links": None,
+            "parsed_tree": None, # Parsed page, so BackendAnalyzer.analyze_all(parsed_tree=...) need not parse it again
             "csv_filepath": None,
             "json_filepath": None,
             "http_log": {
-                "request_headers": None,
-                "response_headers": None,
-                "status_code": None
+                "request_headers": page.request_headers,
+                "response_headers": page.response_headers,
+                "status_code": page.status_code
             }
         }
 
-        try:
-            response = self.fetch_page(url)
-            results["http_log"]["request_headers"] = dict(response.request.headers)
-            results["http_log"]["response_headers"] = dict(response.headers)
-            results["http_log"]["status_code"] = response.status_code
+        if soup is None:
+            soup = self.parse_html(page.content)
+            results["parsed_tree"] = soup
 
-            soup = self.parse_html(response.content)
-            
-            metadata = self.extract_metadata(soup)
-            results["metadata"] = metadata
-
-            # Prepare data for CSV - typically a flat structure or simple list of dicts
-            # For this example, we save metadata and optionally link/text summaries in one CSV row.
-            csv_row_data = {**metadata} # Start with metadata
-            csv_row_data["url"] = url # Add URL to the CSV data
-            csv_row_data["collection_timestamp"] = datetime.now().isoformat()
-
-            text_content = None
-            if collect_text:
-                text_content = self.extract_all_text(soup)
-                results["text_content_preview"] = (text_content[:500] + "...") if text_content and len(text_content) > 500 else text_content
-                csv_row_data["text_preview"] = results["text_content_preview"]
-                # Optionally save full text to a separate file if very long
-                # text_filepath = self._generate_filename(url, "txt")
-                # with open(text_filepath, "w", encoding="utf-8") as f:
-                # f.write(text_content)
-                # results["full_text_content_path"] = text_filepath
-
-            if collect_links:
-                # Ensure base_url is correctly derived for urljoin
-                parsed_url = urlparse(response.url) # Use response.url as it might have followed redirects
-                base_url = f"{parsed_url.scheme}://{parsed_url.netloc}"
-                links = self.extract_links(soup, base_url)
-                results["links"] = links
-                csv_row_data["extracted_links_count"] = len(links)
-                # Storing all links in a single CSV cell can be problematic. Consider storing a sample or count.
-                csv_row_data["sample_links"] = json.dumps(links[:5]) # Store first 5 links as JSON string
-            
-            # Comprehensive data for JSON storage
-            json_data_to_store = {
-                "url": url,
-                "collection_timestamp": datetime.now().isoformat(),
-                "metadata": metadata,
-                "http_info": results["http_log"],
-                "links": results["links"],
-                # Full text can be large, consider if it should always be in JSON or linked as a file path
-                "full_text": text_content if collect_text else None 
-            }
+        # Ensure base_url is correctly derived for urljoin
+        base_url = origin_of(page.url) or page.url # Use the final URL as it might have followed redirects
+        metadata, links, text_content = self.extract_page_data(soup, base_url, collect_text, collect_links)
+        results["metadata"] = metadata
+
+        # One timestamp for the whole collection: the CSV row, the JSON payload and both filenames
+        now = datetime.now()
+        collection_timestamp = now.isoformat()
+        ts = now.strftime(FILENAME_TIMESTAMP_FORMAT)
 
-            if store_csv and csv_row_data:
-                # CSV expects a list of dictionaries
-                csv_path = self.save_data_to_csv([csv_row_data], url, filename_prefix="web_extract")
-                results["csv_filepath"] = csv_path
+        # Prepare data for CSV - typically a flat structure or simple list of dicts
+        # For this example, we save metadata and optionally link/text summaries in one CSV row.
+        csv_row_data = {**metadata} # Start with metadata
+        csv_row_data["url"] = url # Add URL to the CSV data
+        csv_row_data["collection_timestamp"] = collection_timestamp
+
+        if collect_text:
+            results["text_content_preview"] = (text_content[:500] + "...") if text_content and len(text_content) > 500 else text_content
+            csv_row_data["text_preview"] = results["text_content_preview"]
+            if store_json and len(text_content) > self.max_inline_text_bytes:
+                # Too long to embed in the JSON: written to its own file, which the JSON references
+                results["full_text_content_path"] = self.save_text_to_file(text_content, url, ts=ts)
+
+        if collect_links:
+            results["links"] = links
+            csv_row_data["extracted_links_count"] = len(links)
+            # Storing all links in a single CSV cell can be problematic. Consider storing a sample or count.
+            csv_row_data["sample_links"] = _dumps_compact(links[:5]) # Store first 5 links as JSON string
+        
+        # Comprehensive data for JSON storage
+        json_data_to_store = {
+            "url": url,
+            "collection_timestamp": collection_timestamp,
+            "metadata": metadata,
+            "http_info": results["http_log"],
+            "links": results["links"],
+            # Long text is stored in its own file (full_text_path) rather than inline
+            "full_text": text_content if collect_text and not results["full_text_content_path"] else None
+        }
+        if results["full_text_content_path"]:
+            json_data_to_store["full_text_path"] = results["full_text_content_path"]
+            json_data_to_store["full_text_length"] = len(text_content)
+
+        if store_csv and csv_row_data:
+            # CSV expects a list of dictionaries
+            csv_path = self.save_data_to_csv([csv_row_data], url, filename_prefix="web_extract", ts=ts)
+            results["csv_filepath"] = csv_path
+        
+        if store_json and json_data_to_store:
+            json_path = self.save_data_to_json(json_data_to_store, url, filename_prefix="web_extract_details", ts=ts)
+            results["json_filepath"] = json_path
             
-            if store_json and json_data_to_store:
-                json_path = self.save_data_to_json(json_data_to_store, url, filename_prefix="web_extract_details")
-                results["json_filepath"] = json_path
-                
-            logger.info(f"Successfully processed and stored data for {url}.")
+        logger.info(f"Successfully processed and stored data for {url}.")
+        return results
+
+    def collect_and_store(self, url, collect_text=True, collect_links=True, store_csv=True, store_json=True):
+        """
+        Orchestrates the collection and storage of data from a URL.
+
+        With the lxml-direct parser the page is parsed while it downloads (see parse_html_incremental).
+        Without collect_text only the title, meta tags and links are needed, so only those are
+        kept (see parse_html_streaming) and the results hold no parsed tree.
+
+        Args:
+            url (str): The URL to process.
+            collect_text (bool): Whether to extract all text.
+            collect_links (bool): Whether to extract all links.
+            store_csv (bool): Whether to save extracted data to CSV.
+            store_json (bool): Whether to save extracted data (metadata primarily) to JSON.
+
+        Returns:
+            dict: A dictionary containing paths to saved files and extracted data.
+        Raises:
+            DataCollectionError: If a critical step in collection or storage fails.
+        """
+        logger.info(f"Starting collection and storage process for URL: {url}")
+        try:
+            if self.http2_client is not None:
+                page = self.fetch_page_http2(url)
+                return self._process_page(url, page, collect_text, collect_links, store_csv, store_json)
+            stream = not collect_text or self.parser == "lxml-direct"
+            response = self.fetch_page(url, stream=stream)
+            from_cache = getattr(response, "from_cache", False) # Only CachedSession responses have it
+            # Everything that changes the stored output, so collectors sharing an output
+            # directory with other settings never get each other's results back
+            options = (collect_text, collect_links, store_csv, store_json,
+                       self.parser, self.max_inline_text_bytes, self.compress, self.extractor)
+            # Under csv_batch() the row has to reach the batch file, so stored results are neither
+            # reused nor saved (their csv_filepath would be the shared batch file).
+            batch_csv = store_csv and self._csv_batch_writer is not None
+            if from_cache and not batch_csv:
+                # Fresh in the cache, or revalidated with a 304: the stored files are still up to date
+                results = self._load_stored_results(url, options)
+                if results is not None:
+                    response.close()
+                    logger.info(f"{url} is unchanged since it was last collected; reusing the stored results.")
+                    return results
+            page = FetchedPage(
+                url=response.url,
+                status_code=response.status_code,
+                request_headers=dict(response.request.headers),
+                response_headers=dict(response.headers),
+                content=b"" if stream else response.content
+            )
+            soup = None
+            if not collect_text:
+                soup = self.parse_html_streaming(response)
+            elif stream:
+                soup = self.parse_html_incremental(response)
+            results = self._process_page(url, page, collect_text, collect_links, store_csv, store_json, soup=soup)
+            if collect_text and stream:
+                results["parsed_tree"] = soup # A complete document, unlike the parse_html_streaming skeleton
+            if hasattr(response, "from_cache") and not batch_csv:
+                self._save_stored_results(url, options, results)
             return results
 
         except DataCollectionError as e:
             logger.error(f"DataCollectionError during processing of {url}: {e}", exc_info=True)
-            # results dictionary will contain partial data if any step succeeded before failure
             # The error is re-raised to be handled by the caller (e.g., GUI)
             raise
         except Exception as e:
             logger.critical(f"Unexpected critical error during processing of {url}: {e}", exc_info=True)
             raise DataCollectionError(f"An unexpected critical error occurred while processing {url}: {e}")
 
+    def collect_and_store_batch(self, urls, max_workers=None, **options):
+        """
+        Collects and stores several URLs with a thread pool, for callers that do not use asyncio.
+        The work is network-bound and requests releases the GIL while waiting, so the threads
+        overlap their fetches; they share self.session and its connection pool.
+
+        Args:
+            urls (list): The URLs to process.
+            max_workers (int, optional): Number of threads. Defaults to the max_workers given to __init__.
+            **options: collect_text, collect_links, store_csv and store_json, as for collect_and_store.
+
+        Yields:
+            tuple: (url, result) pairs in completion order, where result is the collect_and_store
+                   results dict, or the exception (normally a DataCollectionError) raised for url.
+        """
+        max_workers = max_workers or self.max_workers
+        logger.info(f"Starting threaded batch collection of {len(urls)} URLs with {max_workers} workers.")
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(self.collect_and_store, url, **options): url for url in urls}
+            for future in as_completed(futures):
+                try:
+                    yield futures[future], future.result()
+                except Exception as e:
+                    yield futures[future], e
+
+    async def fetch_page_async(self, session, url):
+        """
+        Asynchronous counterpart of fetch_page.
+
+        Args:
+            session (aiohttp.ClientSession): The session to fetch with (see collect_and_store_many).
+            url (str): The URL to fetch.
+
+        Returns:
+            FetchedPage: The fetched page, with its body fully read.
+        Raises:
+            DataCollectionError: If fetching or response validation fails.
+        """
+        try:
+            logger.info(f"Fetching URL: {url}")
+            async with session.get(url, timeout=aiohttp.ClientTimeout(total=FETCH_TIMEOUT)) as response:
+                response.raise_for_status()  # Raises a ClientResponseError for bad responses (4XX or 5XX)
+                content = await response.read()
+                page = FetchedPage(
+                    url=str(response.url),
+                    status_code=response.status,
+                    request_headers=dict(response.request_info.headers),
+                    response_headers=dict(response.headers),
+                    content=content
+                )
+            logger.debug("Request Headers for %s: %s", url, page.request_headers)
+            logger.debug("Response Headers for %s: %s", url, page.response_headers)
+            logger.info(f"Successfully fetched {url} with status code: {page.status_code}")
+            return page
+        except asyncio.TimeoutError as e:
+            logger.error(f"Timeout error fetching {url}: {e}")
+            raise DataCollectionError(f"Timeout error fetching {url}: {e}")
+        except aiohttp.ClientResponseError as e:
+            logger.error(f"HTTP error for {url}: {e}. Status code: {e.status}")
+            raise DataCollectionError(f"HTTP error for {url}: {e}. Status code: {e.status}")
+        except aiohttp.ClientError as e:
+            logger.error(f"Generic error fetching {url}: {e}")
+            raise DataCollectionError(f"Error fetching {url}: {e}")
+
+    async def fetch_page_http2_async(self, client, url):
+        """
+        Asynchronous counterpart of fetch_page_http2.
+
+        Args:
+            client (httpx.AsyncClient): The client to fetch with (see collect_and_store_many).
+            url (str): The URL to fetch.
+
+        Returns:
+            FetchedPage: The fetched page, with its body fully read.
+        Raises:
+            DataCollectionError: If fetching or response validation fails.
+        """
+        try:
+            logger.info(f"Fetching URL: {url}")
+            return self._http2_page(await client.get(url))
+        except httpx.HTTPError as e:
+            raise self._http2_error(url, e)
+
+    async def _collect_and_store_async(self, fetch, url, options, process_pool):
+        """Fetches url with the fetch coroutine function, then processes it in a worker thread, or in process_pool if given."""
+        logger.info(f"Starting collection and storage process for URL: {url}")
+        try:
+            page = await fetch(url)
+            if process_pool is None:
+                return await asyncio.to_thread(self._process_page, url, page, **options)
+            return await asyncio.get_running_loop().run_in_executor(
+                process_pool, _process_page_in_worker, self._worker_settings(), url, page, options
+            )
+        except DataCollectionError as e:
+            logger.error(f"DataCollectionError during processing of {url}: {e}", exc_info=True)
+            raise
+        except Exception as e:
+            logger.critical(f"Unexpected critical error during processing of {url}: {e}", exc_info=True)
+            raise DataCollectionError(f"An unexpected critical error occurred while processing {url}: {e}")
+
+    def _worker_settings(self):
+        """The DataCollector arguments a collect_and_store_many worker process recreates this collector with."""
+        return {
+            "output_directory": self.output_directory,
+            "parser": self.parser,
+            "max_inline_text_bytes": self.max_inline_text_bytes,
+            "compress": self.compress,
+            "extractor": self.extractor
+        }
+
+    async def collect_and_store_many(self, urls, processes=None, **options):
+        """
+        Collects and stores several URLs concurrently.
+
+        The fetches overlap on a single aiohttp session whose connector caps the open connections
+        (MAX_CONNECTIONS in total, MAX_CONNECTIONS_PER_HOST per host), or on an HTTP/2
+        httpx.AsyncClient when the collector was created with http2=True. Parsing and file writes run
+        in worker threads, or in a ProcessPoolExecutor when processes is set, so the event loop
+        is never blocked.
+
+        Args:
+            urls (list): The URLs to process.
+            processes (int, optional): If set, pages are parsed and stored in this many worker
+                                       processes instead of threads. The "parsed_tree" entry of
+                                       the results is then None, as parsed pages are not sent back.
+            **options: collect_text, collect_links, store_csv and store_json, as for collect_and_store.
+
+        Returns:
+            list: One entry per URL, in order. Each entry is the collect_and_store results dict,
+                  or the exception (normally a DataCollectionError) raised for that URL.
+        """
+        logger.info(f"Starting batch collection of {len(urls)} URLs.")
+        if self.http2:
+            async with httpx.AsyncClient(**self._http2_client_options()) as client:
+                return await self._gather_collections(partial(self.fetch_page_http2_async, client), urls, processes, options)
+        connector = aiohttp.TCPConnector(limit=MAX_CONNECTIONS, limit_per_host=MAX_CONNECTIONS_PER_HOST, ttl_dns_cache=300)
+        async with aiohttp.ClientSession(connector=connector, headers=dict(self.session.headers)) as session:
+            return await self._gather_collections(partial(self.fetch_page_async, session), urls, processes, options)
+
+    async def _gather_collections(self, fetch, urls, processes, options):
+        """Runs _collect_and_store_async for every URL concurrently, in a process pool when processes is set."""
+        if not processes:
+            return await asyncio.gather(
+                *(self._collect_and_store_async(fetch, url, options, None) for url in urls), return_exceptions=True
+            )
+        with ProcessPoolExecutor(max_workers=processes) as process_pool:
+            return await asyncio.gather(
+                *(self._collect_and_store_async(fetch, url, options, process_pool) for url in urls), return_exceptions=True
+            )
+
+# DataCollector used by _process_page_in_worker, created once per worker process
+_worker_collector = None
+
+def _process_page_in_worker(settings, url, page, options):
+    """
+    Process pool entry point for collect_and_store_many: parses and stores a fetched page.
+    The parsed tree is dropped from the results, as it is not worth pickling back.
+    """
+    global _worker_collector
+    if _worker_collector is None or _worker_collector._worker_settings() != settings:
+        _worker_collector = DataCollector(**settings)
+    results = _worker_collector._process_page(url, page, **options)
+    results["parsed_tree"] = None
+    return results
+
 # Example Usage (for testing purposes, will be called from GUI later)
 if __name__ == "__main__":
     # This setup should ideally be in the main application entry point
@@ -398,19 +1318,19 @@ if __name__ == "__main__":
         
         if collection_results:
             logger.info("--- Collection Summary ---")
-            logger.info(f"URL: {collection_results.get("url")}")
-            logger.info(f"Metadata: {collection_results.get("metadata")}")
-            logger.info(f"Text Preview: {collection_results.get("text_content_preview")}")
-            logger.info(f"Extracted Links (first 5): {collection_results.get("links", [])[:5]}")
-            logger.info(f"CSV saved to: {collection_results.get("csv_filepath")}")
-            logger.info(f"JSON saved to: {collection_results.get("json_filepath")}")
-            logger.info(f"HTTP Status: {collection_results.get("http_log", {}).get("status_code")}")
+            logger.info(f"URL: {collection_results.get('url')}")
+            logger.info(f"Metadata: {collection_results.get('metadata')}")
+            logger.info(f"Text Preview: {collection_results.get('text_content_preview')}")
+            logger.info(f"Extracted Links (first 5): {collection_results.get('links', [])[:5]}")
+            logger.info(f"CSV saved to: {collection_results.get('csv_filepath')}")
+            logger.info(f"JSON saved to: {collection_results.get('json_filepath')}")
+            logger.info(f"HTTP Status: {collection_results.get('http_log', {}).get('status_code')}")
 
             if collection_results.get("json_filepath") and os.path.exists(collection_results.get("json_filepath")):
                 with open(collection_results["json_filepath"], "r", encoding="utf-8") as f:
                     loaded_data = json.load(f)
                     logger.info("--- Loaded JSON Data (sample) ---")
-                    logger.info(f"Title from loaded JSON: {loaded_data.get("metadata", {}).get("title")}")
+                    logger.info(f"Title from loaded JSON: {loaded_data.get('metadata', {}).get('title')}")
             else:
                 logger.warning("JSON file was not created or path is incorrect.")
         else:
@@ -0,0 +1,55 @@
+# _fast.py
+"""
+Formatting helpers of the GUI's per-click handlers, kept free of Qt so they are cheap to call
+and can be compiled (e.g. with Cython) on their own should they ever show up in profiles.
+"""
+
+try:
+    from ._link_stats import analyze_links
+except ImportError:  # Imported by main_app run as a script rather than as part of the src package
+    from _link_stats import analyze_links
+
+# Text shown in the data collection results area for a finished collection (see _DefaultingFields)
+_DC_TEMPLATE = (
+    "Data Collection for: {url}\n"
+    "Status Code: {status}\n"
+    "Title: {title}\n"
+    "Description: {desc}\n"
+    "Links Found: {nlinks}\n"
+    "Most Linked Hosts: {hosts}\n"
+    "Text Preview: {preview}...\n"
+    "CSV saved to: {csv}\n"
+    "JSON saved to: {json}\n"
+)
+
+class _DefaultingFields(dict):
+    """str.format_map fields for _DC_TEMPLATE: a field the results do not have shows as "N/A"."""
+    def __missing__(self, key):
+        return "N/A"
+
+def build_display_text(url, results):
+    """
+    Builds the text shown in the data collection results area for a finished collection.
+
+    Args:
+        url (str): The collected URL.
+        results (dict): The collect_and_store results.
+
+    Returns:
+        str: The display text (see _DC_TEMPLATE).
+    """
+    metadata = results.get("metadata") or {}
+    preview = results.get("text_content_preview")
+    link_stats = analyze_links(results.get("links") or ())
+    fields = {
+        "url": url,
+        "status": (results.get("http_log") or {}).get("status_code"),
+        "title": metadata.get("title"),
+        "desc": metadata.get("description"),
+        "nlinks": link_stats["count"],
+        "hosts": ", ".join(f"{host} ({count})" for host, count in link_stats["top_hosts"]) or None,
+        "preview": preview[:200] if preview else None,
+        "csv": results.get("csv_filepath"),
+        "json": results.get("json_filepath")
+    }
+    return _DC_TEMPLATE.format_map(_DefaultingFields((name, value) for name, value in fields.items() if value is not None))
@@ -0,0 +1,31 @@
+# _link_stats.py
+
+from collections import Counter
+from urllib.parse import urlsplit
+
+# Number of most-linked hosts analyze_links reports
+LINK_STATS_TOP_HOSTS = 3
+
+def analyze_links(links, top_hosts=LINK_STATS_TOP_HOSTS):
+    """
+    Summarizes the links collected from a page. The counting is done by Counter, whose
+    counting loop runs in C, over a single urlsplit of each link.
+
+    Args:
+        links (list): Absolute URLs, as in the "links" entry of collect_and_store results.
+        top_hosts (int): Number of most-linked hosts to report.
+
+    Returns:
+        dict: "count" (number of links), "schemes" (scheme -> number of links),
+              "top_hosts" (list of (host, number of links), most linked first; links without
+              a host, such as mailto:, are not counted) and
+              "max_depth" (largest number of path segments of any link).
+    """
+    link_parts = [urlsplit(link) for link in links]
+    host_counts = Counter(parts.netloc.lower() for parts in link_parts if parts.netloc)
+    return {
+        "count": len(link_parts),
+        "schemes": dict(Counter(parts.scheme for parts in link_parts)),
+        "top_hosts": host_counts.most_common(top_hosts),
+        "max_depth": max((parts.path.strip("/").count("/") + 1 for parts in link_parts if parts.path.strip("/")), default=0)
+    }
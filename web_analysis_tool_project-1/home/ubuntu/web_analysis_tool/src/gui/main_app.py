@@ -1,14 +1,29 @@
 # main_app.py
 
 import sys
+import asyncio
+import hashlib
+import json
 import logging
+import os
+import re
+import time
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QTabWidget, QWidget, QVBoxLayout, 
-    QLabel, QLineEdit, QPushButton, QTextEdit, QMessageBox, QFileDialog,
-    QGroupBox, QFormLayout, QScrollArea, QSplitter
+    QLabel, QLineEdit, QPushButton, QPlainTextEdit, QMessageBox,
+    QGroupBox, QFormLayout, QCheckBox, QListView
 )
-from PyQt6.QtGui import QIcon # For application icon, if needed
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex, QObject, QRunnable, QThreadPool, pyqtSignal
+
+try:
+    from ._fast import build_display_text
+except ImportError:  # Run as a script (python src/gui/main_app.py) rather than as part of the src package
+    from _fast import build_display_text
+
+try:
+    import qasync
+except ImportError:  # Optional; without it collections run on the QThreadPool instead of the asyncio loop
+    qasync = None
 
 # Placeholder for importing the actual backend modules
 # These will be developed and integrated properly later
@@ -16,74 +31,180 @@ from PyQt6.QtCore import Qt
 # from ..backend_analysis.backend_analyzer import BackendAnalyzer
 # from ..pgp_management.pgp_manager import PGPManager
 
-# Configure basic logging for the GUI. More advanced logging will be handled centrally.
-logging.basicConfig(level=logging.INFO, format=\'%(asctime)s - %(levelname)s - %(module)s - %(message)s\
+# Text of the ethical-use reminder shown at startup
+_ETHICAL_WARNING_TEXT = (
+    "This tool is intended for educational purposes and should ONLY be used on websites "
+    "where you have explicit permission for testing and analysis. "
+    "Unauthorized access attempts are illegal and unethical. "
+    "Always act responsibly and in compliance with all applicable laws and terms of service."
 )
+# Days an acknowledged ethical-use reminder is not shown again (unless its text changes)
+ETHICAL_WARNING_ACK_DAYS = 30
+# Lines the results areas keep; older lines are dropped as new ones are appended
+RESULTS_MAX_BLOCKS = 2000
+# Rows the links view lays out per batch, so long link lists appear without blocking the UI
+LINKS_VIEW_BATCH_SIZE = 100
+# Number of collection results the GUI keeps (and stores on disk) for reuse
+COLLECT_CACHE_SIZE = 128
+
+# URLs the data collector accepts: http and https only
+_URL_RE = re.compile(r"^https?://")
+
+def validate_urls(urls):
+    """Returns, for each of urls, whether it is an http(s) URL the data collector accepts."""
+    url_match = _URL_RE.match
+    return [url_match(url) is not None for url in urls]
+
+def _make_private_directory(path):
+    """Creates path (owner-only permissions) if it does not exist, logging rather than raising on failure."""
+    try:
+        os.makedirs(path, mode=0o700, exist_ok=True)
+    except OSError as e:
+        logging.error(f"Could not create directory {path}: {e}")
+
+def _init_logging():
+    """Configures basic logging when the GUI is run on its own. More advanced logging is handled centrally (see main.py)."""
+    # Optimized runs (python -O, PYTHONOPTIMIZE=1) log warnings and errors only
+    level = logging.INFO if __debug__ else logging.WARNING
+    logging.basicConfig(level=level, format='%(asctime)s - %(levelname)s - %(module)s - %(message)s')
 
 # --- Placeholder Classes for Backend Modules (until they are integrated) ---
 class PlaceholderDataCollector:
+    __slots__ = ()
+
     def collect_and_store(self, url, **kwargs):
-        logging.info(f"[GUI Placeholder] Collecting data from: {url} with options: {kwargs}")
+        if logging.getLogger().isEnabledFor(logging.INFO):
+            logging.info("[GUI Placeholder] Collecting data from: %s with options: %s", url, kwargs)
         return {
-            \"url\": url,
-            \"metadata\": {\"title\": \"Placeholder Title\", \"description\": \"Placeholder description.\"},
-            \"text_content_preview\": \"This is placeholder text content...\",
-            \"links\": [\"http://example.com/link1\", \"http://example.com/link2\"],
-            \"csv_filepath\": \"/path/to/placeholder.csv\",
-            \"json_filepath\": \"/path/to/placeholder.json\",
-            \"http_log\": {\"status_code\": 200, \"request_headers\": {}, \"response_headers\": {}}
+            "url": url,
+            "metadata": {"title": "Placeholder Title", "description": "Placeholder description."},
+            "text_content_preview": "This is placeholder text content...",
+            "links": ["http://example.com/link1", "http://example.com/link2"],
+            "csv_filepath": "/path/to/placeholder.csv",
+            "json_filepath": "/path/to/placeholder.json",
+            "http_log": {"status_code": 200, "request_headers": {}, "response_headers": {}}
         }
 
 class PlaceholderBackendAnalyzer:
+    __slots__ = ()
+
     def identify_technologies(self, url):
-        logging.info(f"[GUI Placeholder] Identifying technologies for: {url}")
-        return {\"cms\": \"PlaceholderCMS\", \"javascript-framework\": \"PlaceholderJSFramework\"}
+        logging.info("[GUI Placeholder] Identifying technologies for: %s", url)
+        return {"cms": "PlaceholderCMS", "javascript-framework": "PlaceholderJSFramework"}
     
     def analyze_authentication(self, soup_placeholder, headers_placeholder):
-        logging.info(f"[GUI Placeholder] Analyzing authentication mechanisms.")
-        return {\"login_forms_found\": True, \"session_cookies_likely\": True}
+        logging.info("[GUI Placeholder] Analyzing authentication mechanisms.")
+        return {"login_forms_found": True, "session_cookies_likely": True}
 
     def discover_api_endpoints(self, soup_placeholder, base_url):
-        logging.info(f"[GUI Placeholder] Discovering API endpoints for: {base_url}")
-        return [\"/api/placeholder/users\", \"/api/placeholder/data\"]
+        logging.info("[GUI Placeholder] Discovering API endpoints for: %s", base_url)
+        return ["/api/placeholder/users", "/api/placeholder/data"]
 
     def generate_site_structure_map(self, links, base_url):
-        logging.info(f"[GUI Placeholder] Generating site structure for: {base_url}")
-        return {\"home\": \"[page]\", \"about\": {\"team\": \"[page]\"}}
+        logging.info("[GUI Placeholder] Generating site structure for: %s", base_url)
+        return {"home": "[page]", "about": {"team": "[page]"}}
+
+class _MockKey:
+    """Key returned by PlaceholderPGPManager.generate_key_pair."""
+    __slots__ = ()
+    fingerprint = "PLACEHOLDERFINGERPRINT12345"
 
 class PlaceholderPGPManager:
+    __slots__ = ("gpg_home", "gpg")
+
     def __init__(self, gpg_home=None):
         self.gpg_home = gpg_home
-        logging.info(f"[GUI Placeholder] PGPManager initialized. GPG Home: {self.gpg_home}")
+        logging.info("[GUI Placeholder] PGPManager initialized. GPG Home: %s", self.gpg_home)
         self.gpg = True # Simulate GPG available
 
     def generate_key_pair(self, name_real, name_email, passphrase):
-        logging.info(f"[GUI Placeholder] Generating PGP key for {name_email}")
-        class MockKey: fingerprint = \"PLACEHOLDERFINGERPRINT12345\"
-        return MockKey()
+        logging.info("[GUI Placeholder] Generating PGP key for %s", name_email)
+        return _MockKey()
 
     def list_keys(self, secret=False):
-        logging.info(f"[GUI Placeholder] Listing PGP keys (secret={secret})")
-        return [{\"uids\": [\"Placeholder User <placeholder@example.com>\"], \"fingerprint\": \"PLACEHOLDERFINGERPRINT12345\"}]
+        logging.info("[GUI Placeholder] Listing PGP keys (secret=%s)", secret)
+        return [{"uids": ["Placeholder User <placeholder@example.com>"], "fingerprint": "PLACEHOLDERFINGERPRINT12345"}]
     
     def encrypt_message(self, recipients, message, **kwargs):
-        logging.info(f"[GUI Placeholder] Encrypting message for {recipients}")
-        return \"---BEGIN PGP MESSAGE---\nPlaceholderEncryptedData\n---END PGP MESSAGE---\"
+        if logging.getLogger().isEnabledFor(logging.INFO):
+            logging.info("[GUI Placeholder] Encrypting message for %s", recipients)
+        return "---BEGIN PGP MESSAGE---\nPlaceholderEncryptedData\n---END PGP MESSAGE---"
 
     def decrypt_message(self, encrypted_message, **kwargs):
-        logging.info(f"[GUI Placeholder] Decrypting message.")
-        return \"This is a placeholder decrypted message.\"
+        logging.info("[GUI Placeholder] Decrypting message.")
+        return "This is a placeholder decrypted message."
     
     def attempt_pgp_authentication_simulation(self, fingerprint, passphrase, target_info):
-        logging.warning(\"[GUI Placeholder] ETHICAL WARNING: PGP Auth Simulation triggered for educational purposes only.\")
-        return {\"success\": True, \"message\": \"PGP Authentication Simulation: Placeholder success.\"}
+        logging.warning("[GUI Placeholder] ETHICAL WARNING: PGP Auth Simulation triggered for educational purposes only.")
+        return {"success": True, "message": "PGP Authentication Simulation: Placeholder success."}
 
 # --- End Placeholder Classes ---
 
+class WorkerSignals(QObject):
+    """Signals of a CollectWorker (a QRunnable is not a QObject, so it cannot define signals itself)."""
+    finished = pyqtSignal(dict)
+    error = pyqtSignal(str)
+
+class CollectWorker(QRunnable):
+    """Runs collect_and_store for one URL on a QThreadPool thread, so the fetch never blocks the UI."""
+    def __init__(self, data_collector, url, **options):
+        super().__init__()
+        self.data_collector = data_collector
+        self.url = url
+        self.options = options
+        self.signals = WorkerSignals()
+
+    def run(self):
+        try:
+            results = self.data_collector.collect_and_store(self.url, **self.options)
+        except Exception as e:
+            logging.error(f"Error during data collection GUI handling: {e}")
+            self.signals.error.emit(str(e))
+            return
+        self.signals.finished.emit(results)
+
+class LinksModel(QAbstractListModel):
+    """List model over the links of the last collection: the view only renders the rows on screen."""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._links = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._links)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and index.isValid():
+            return self._links[index.row()]
+        return None
+
+    def set_links(self, links):
+        """Replaces the model's links (the list is used as is, not copied)."""
+        self.beginResetModel()
+        self._links = links
+        self.endResetModel()
+
+def run_event_loop(app):
+    """
+    Runs the Qt event loop until the application quits. When qasync is installed, the loop is
+    also the asyncio event loop, so the GUI can await coroutines (see handle_collect_data).
+
+    Returns:
+        int: The application's exit code.
+    """
+    if qasync is None:
+        return app.exec()
+    loop = qasync.QEventLoop(app)
+    asyncio.set_event_loop(loop)
+    with loop:
+        return loop.run_forever()
+
 class WebAnalysisToolGUI(QMainWindow):
+    # Application-wide style sheet, set once on the QApplication (parsed once, not per widget)
+    APP_QSS = "QGroupBox { font-weight: bold; } QPushButton { padding: 4px; }"
+
     def __init__(self):
         super().__init__()
-        self.setWindowTitle(\"Comprehensive Web Analysis Tool\")
+        self.setWindowTitle("Comprehensive Web Analysis Tool")
         self.setGeometry(100, 100, 1200, 800) # x, y, width, height
 
         # Initialize backend components (using placeholders for now)
@@ -92,15 +213,32 @@ class WebAnalysisToolGUI(QMainWindow):
         self.backend_analyzer = PlaceholderBackendAnalyzer() # BackendAnalyzer()
         # For PGPManager, specify a dedicated GPG home for the app
         # This path should be configurable or determined appropriately
-        app_data_path = os.path.join(os.path.expanduser(\"~\"), \".web_analysis_tool_data\")
-        gpg_home_path = os.path.join(app_data_path, \"gnupg_home\")
-        if not os.path.exists(gpg_home_path):
-            os.makedirs(gpg_home_path, mode=0o700)
-        self.pgp_manager = PlaceholderPGPManager(gpg_home=gpg_home_path) # PGPManager(gpg_home=gpg_home_path)
+        app_data_path = os.path.join(os.path.expanduser("~"), ".web_analysis_tool_data")
+        self._gpg_home_path = os.path.join(app_data_path, "gnupg_home")
+        self._ethical_ack_path = os.path.join(app_data_path, "ack.json")
+        self._pgp_manager = None # Created on first use, see the pgp_manager property
+        # Results of earlier collections, keyed by URL and options (loaded from disk on first use)
+        self._collect_cache_path = os.path.join(app_data_path, "collect_cache.json")
+        self._collect_cache = None
+        self._pending_cache_key = None # Key of the collection in progress
+        # Message boxes by title, created on first use and reused for later messages
+        self._message_boxes = {}
+        # Long-running work (network fetches) runs here, off the UI thread
+        self.threadpool = QThreadPool.globalInstance()
+        # The GPG home is created in the background while the window is built
+        self.threadpool.start(lambda: _make_private_directory(self._gpg_home_path))
 
         self.init_ui()
         self.show_initial_ethical_warning()
 
+    @property
+    def pgp_manager(self):
+        """The PGP manager, created (with its GPG home) the first time it is used."""
+        if self._pgp_manager is None:
+            _make_private_directory(self._gpg_home_path) # Normally done by the background job already
+            self._pgp_manager = PlaceholderPGPManager(gpg_home=self._gpg_home_path) # PGPManager(gpg_home=self._gpg_home_path)
+        return self._pgp_manager
+
     def init_ui(self):
         self.tabs = QTabWidget()
         self.setCentralWidget(self.tabs)
@@ -111,133 +249,268 @@ class WebAnalysisToolGUI(QMainWindow):
         self.pgp_management_tab = QWidget()
         self.settings_tab = QWidget() # For settings and logs
 
-        self.tabs.addTab(self.data_collection_tab, \"Data Collection\")
-        self.tabs.addTab(self.backend_analysis_tab, \"Backend Analysis\")
-        self.tabs.addTab(self.pgp_management_tab, \"PGP Key Management\")
-        self.tabs.addTab(self.settings_tab, \"Settings & Logs\")
-
-        # Populate each tab with its specific UI elements
-        self.init_data_collection_ui()
-        self.init_backend_analysis_ui()
-        self.init_pgp_management_ui()
-        self.init_settings_ui()
+        self.tabs.addTab(self.data_collection_tab, "Data Collection")
+        self.tabs.addTab(self.backend_analysis_tab, "Backend Analysis")
+        self.tabs.addTab(self.pgp_management_tab, "PGP Key Management")
+        self.tabs.addTab(self.settings_tab, "Settings & Logs")
+
+        # Each tab is populated with its specific UI elements the first time it is shown,
+        # and only then are its widgets' signals connected (None: no separate wiring step)
+        self._tab_builders = (
+            (self.init_data_collection_ui, self._wire_data_collection_signals),
+            (self.init_backend_analysis_ui, None),
+            (self.init_pgp_management_ui, None),
+            (self.init_settings_ui, None)
+        )
+        self._tab_initialized = [False] * len(self._tab_builders)
+        self.tabs.currentChanged.connect(self._ensure_tab_built)
+        self._ensure_tab_built(self.tabs.currentIndex())
+
+    def _ensure_tab_built(self, index):
+        """Builds the UI of tab index and connects its signals, unless that has been done already."""
+        if 0 <= index < len(self._tab_builders) and not self._tab_initialized[index]:
+            self._tab_initialized[index] = True
+            build_ui, wire_signals = self._tab_builders[index]
+            build_ui()
+            if wire_signals is not None:
+                wire_signals()
+
+    def _show_message(self, icon, title, text):
+        """Shows a modal message box, reusing the one built for title earlier instead of building a new dialog each time."""
+        message_box = self._message_boxes.get(title)
+        if message_box is None:
+            message_box = QMessageBox(self)
+            message_box.setIcon(icon)
+            message_box.setWindowTitle(title)
+            self._message_boxes[title] = message_box
+        message_box.setText(text)
+        return message_box.exec()
 
     def show_initial_ethical_warning(self):
-        QMessageBox.warning(
-            self,
-            \"Ethical Use Reminder\",
-            \"This tool is intended for educational purposes and should ONLY be used on websites \
-            where you have explicit permission for testing and analysis. \
-            Unauthorized access attempts are illegal and unethical. \
-            Always act responsibly and in compliance with all applicable laws and terms of service.\"
-        )
+        """
+        Shows the ethical-use reminder, unless this exact text was acknowledged within the last
+        ETHICAL_WARNING_ACK_DAYS days. The acknowledgement is recorded in ack.json in the app data directory.
+        """
+        warning_sha = hashlib.sha256(_ETHICAL_WARNING_TEXT.encode("utf-8")).hexdigest()
+        try:
+            with open(self._ethical_ack_path, "r", encoding="utf-8") as f:
+                ack = json.load(f)
+            if ack.get("acked_sha") == warning_sha and time.time() - ack.get("ts", 0) < ETHICAL_WARNING_ACK_DAYS * 86400:
+                return
+        except (OSError, ValueError, AttributeError): # Missing or unreadable acknowledgement: show the reminder
+            pass
+
+        self._show_message(QMessageBox.Icon.Warning, "Ethical Use Reminder", _ETHICAL_WARNING_TEXT)
+        try:
+            os.makedirs(os.path.dirname(self._ethical_ack_path), exist_ok=True)
+            with open(self._ethical_ack_path, "w", encoding="utf-8") as f:
+                json.dump({"acked_sha": warning_sha, "ts": time.time()}, f)
+        except OSError as e:
+            logging.warning(f"Could not record the ethical-use acknowledgement in {self._ethical_ack_path}: {e}")
 
     # --- UI Initialization for Each Tab (Placeholders) ---
     def init_data_collection_ui(self):
         layout = QVBoxLayout(self.data_collection_tab)
         
         # URL Input Group
-        url_group = QGroupBox(\"Target Website\")
+        url_group = QGroupBox("Target Website")
         url_layout = QFormLayout()
         self.dc_url_input = QLineEdit()
-        self.dc_url_input.setPlaceholderText(\"Enter website URL (e.g., http://example.com)\")
-        url_layout.addRow(QLabel(\"URL:\"), self.dc_url_input)
-        self.dc_collect_button = QPushButton(\"Collect Data\")
-        self.dc_collect_button.clicked.connect(self.handle_collect_data) # Placeholder handler
+        self.dc_url_input.setPlaceholderText("Enter website URL (e.g., http://example.com)")
+        url_layout.addRow(QLabel("URL:"), self.dc_url_input)
+        self.dc_reuse_results_checkbox = QCheckBox("Reuse earlier results for the same URL")
+        self.dc_reuse_results_checkbox.setChecked(True)
+        url_layout.addRow(self.dc_reuse_results_checkbox)
+        self.dc_collect_button = QPushButton("Collect Data")
         url_layout.addRow(self.dc_collect_button)
         url_group.setLayout(url_layout)
         layout.addWidget(url_group)
 
         # Results Display Area
-        results_group = QGroupBox(\"Collection Results\")
+        results_group = QGroupBox("Collection Results")
         results_layout = QVBoxLayout()
-        self.dc_results_area = QTextEdit()
+        self.dc_results_area = QPlainTextEdit()
+        self.dc_results_area.setMaximumBlockCount(RESULTS_MAX_BLOCKS)
         self.dc_results_area.setReadOnly(True)
         results_layout.addWidget(self.dc_results_area)
         results_group.setLayout(results_layout)
         layout.addWidget(results_group)
+
+        # Links of the last collection
+        links_group = QGroupBox("Links Found")
+        links_layout = QVBoxLayout()
+        self._links_model = LinksModel(self)
+        self.dc_links_view = QListView()
+        self.dc_links_view.setModel(self._links_model)
+        self.dc_links_view.setUniformItemSizes(True) # Row heights need not be measured one by one
+        self.dc_links_view.setLayoutMode(QListView.LayoutMode.Batched)
+        self.dc_links_view.setBatchSize(LINKS_VIEW_BATCH_SIZE)
+        links_layout.addWidget(self.dc_links_view)
+        links_group.setLayout(links_layout)
+        layout.addWidget(links_group)
         
         self.data_collection_tab.setLayout(layout)
 
-    def init_backend_analysis_ui(self):
-        layout = QVBoxLayout(self.backend_analysis_tab)
+    def _wire_data_collection_signals(self):
+        self.dc_collect_button.clicked.connect(self.handle_collect_data) # Placeholder handler
+
+    def _make_placeholder_tab(self, tab, label_text, buttons=(), group_title=None, with_results_area=True):
+        """
+        Fills a tab with the common placeholder layout: a centered label, the given buttons
+        (inside a group box when group_title is set) and a read-only results area.
+
+        Args:
+            tab (QWidget): The tab page to fill.
+            label_text (str): Text of the label at the top.
+            buttons (iterable): (button text, slot or None) pairs.
+            group_title (str, optional): Title of a group box around the buttons.
+            with_results_area (bool): Whether to add the results area.
+
+        Returns:
+            tuple: (list of the created QPushButtons, the results QPlainTextEdit or None).
+        """
+        layout = QVBoxLayout(tab)
         # Placeholder content
-        label = QLabel(\"Backend Analysis features will be implemented here.\")
+        label = QLabel(label_text)
         label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(label)
-        self.ba_analyze_button = QPushButton(\"Analyze Current Data (Placeholder)\")
-        layout.addWidget(self.ba_analyze_button)
-        self.ba_results_area = QTextEdit()
-        self.ba_results_area.setReadOnly(True)
-        layout.addWidget(self.ba_results_area)
-        self.backend_analysis_tab.setLayout(layout)
+
+        button_layout = layout
+        if group_title is not None:
+            group = QGroupBox(group_title)
+            button_layout = QVBoxLayout(group)
+            layout.addWidget(group)
+        created_buttons = []
+        for text, slot in buttons:
+            button = QPushButton(text)
+            if slot is not None:
+                button.clicked.connect(slot)
+            button_layout.addWidget(button)
+            created_buttons.append(button)
+
+        results_area = None
+        if with_results_area:
+            results_area = QPlainTextEdit()
+            results_area.setMaximumBlockCount(RESULTS_MAX_BLOCKS)
+            results_area.setReadOnly(True)
+            layout.addWidget(results_area)
+        return created_buttons, results_area
+
+    def init_backend_analysis_ui(self):
+        (self.ba_analyze_button,), self.ba_results_area = self._make_placeholder_tab(
+            self.backend_analysis_tab, "Backend Analysis features will be implemented here.",
+            buttons=[("Analyze Current Data (Placeholder)", None)]
+        )
 
     def init_pgp_management_ui(self):
-        layout = QVBoxLayout(self.pgp_management_tab)
-        # Placeholder content
-        label = QLabel(\"PGP Key Generation and Management features will be implemented here.\")
-        label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        layout.addWidget(label)
-        
-        pgp_group = QGroupBox(\"PGP Operations\")
-        pgp_layout = QFormLayout()
-        self.pgp_generate_button = QPushButton(\"Generate New Key Pair (Placeholder)\")
-        pgp_layout.addRow(self.pgp_generate_button)
-        self.pgp_list_keys_button = QPushButton(\"List Keys (Placeholder)\")
-        pgp_layout.addRow(self.pgp_list_keys_button)
-        pgp_group.setLayout(pgp_layout)
-        layout.addWidget(pgp_group)
-
-        self.pgp_results_area = QTextEdit()
-        self.pgp_results_area.setReadOnly(True)
-        layout.addWidget(self.pgp_results_area)
-        self.pgp_management_tab.setLayout(layout)
+        (self.pgp_generate_button, self.pgp_list_keys_button), self.pgp_results_area = self._make_placeholder_tab(
+            self.pgp_management_tab, "PGP Key Generation and Management features will be implemented here.",
+            buttons=[("Generate New Key Pair (Placeholder)", None), ("List Keys (Placeholder)", None)],
+            group_title="PGP Operations"
+        )
 
     def init_settings_ui(self):
-        layout = QVBoxLayout(self.settings_tab)
-        # Placeholder content
-        label = QLabel(\"Application settings and logs viewer will be implemented here.\")
-        label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        layout.addWidget(label)
-        self.settings_tab.setLayout(layout)
+        self._make_placeholder_tab(
+            self.settings_tab, "Application settings and logs viewer will be implemented here.",
+            with_results_area=False
+        )
 
     # --- Placeholder Handler Methods ---
     def handle_collect_data(self):
         url = self.dc_url_input.text().strip()
         if not url:
-            QMessageBox.warning(self, \"Input Error\", \"Please enter a URL.\")
+            self._show_message(QMessageBox.Icon.Warning, "Input Error", "Please enter a URL.")
             return
 
         # Basic URL validation (very simple)
-        if not (url.startswith(\"http://\") or url.startswith(\"https://\")):
-            QMessageBox.warning(self, \"Input Error\", \"Please enter a valid URL starting with http:// or https://.\")
+        if not _URL_RE.match(url):
+            self._show_message(QMessageBox.Icon.Warning, "Input Error", "Please enter a valid URL starting with http:// or https://.")
             return
         
-        self.dc_results_area.setText(f\"Starting data collection for: {url}...\") 
-        QApplication.processEvents() # Update UI
-
+        self.dc_results_area.appendPlainText(f"Starting data collection for: {url}...")
+        self.dc_collect_button.setEnabled(False) # One collection at a time
+
+        # This will call the placeholder method for now
+        options = {"collect_text": True, "collect_links": True}
+        cache_key = json.dumps([url, sorted(options.items())])
+        if self.dc_reuse_results_checkbox.isChecked():
+            cached_results = self._get_collect_cache().get(cache_key)
+            if cached_results is not None:
+                logging.info(f"Showing earlier collection results for {url}")
+                self._on_collect_done(cached_results)
+                return
+        self._pending_cache_key = cache_key
         try:
-            # This will call the placeholder method for now
-            results = self.data_collector.collect_and_store(url, collect_text=True, collect_links=True)
-            
-            # Display results (simplified)
-            display_text = f\"Data Collection for: {url}\n\"
-            display_text += f\"Status Code: {results.get(\'http_log\',{}).get(\'status_code\')}\n\"
-            display_text += f\"Title: {results.get(\'metadata\',{}).get(\'title\')}\n\"
-            display_text += f\"Description: {results.get(\'metadata\',{}).get(\'description\')}\n\"
-            display_text += f\"Links Found: {len(results.get(\'links\',[]))}\n\"
-            display_text += f\"Text Preview: {results.get(\'text_content_preview\', \'N/A\')[:200]}...\n\"
-            display_text += f\"CSV saved to: {results.get(\'csv_filepath\')}\n\"
-            display_text += f\"JSON saved to: {results.get(\'json_filepath\')}\n\"
-            self.dc_results_area.setText(display_text)
+            asyncio.get_running_loop() # Running under qasync (see run_event_loop)
+        except RuntimeError:
+            worker = CollectWorker(self.data_collector, url, **options)
+            worker.signals.finished.connect(self._on_collect_done)
+            worker.signals.error.connect(self._on_collect_error)
+            self.threadpool.start(worker)
+            return
+        asyncio.ensure_future(self._collect_async(url, options))
 
+    async def _collect_async(self, url, options):
+        """Collects url on the asyncio loop: natively with collect_and_store_many when the collector has it, otherwise in a thread."""
+        try:
+            collect_and_store_many = getattr(self.data_collector, "collect_and_store_many", None)
+            if collect_and_store_many is not None:
+                results, = await collect_and_store_many([url], **options)
+                if isinstance(results, Exception):
+                    raise results
+            else:
+                results = await asyncio.to_thread(self.data_collector.collect_and_store, url, **options)
         except Exception as e:
-            logging.error(f\"Error during data collection GUI handling: {e}\")
-            self.dc_results_area.append(f\"\nError: {e}\")
-            QMessageBox.critical(self, \"Collection Error\", f\"An error occurred: {e}\")
-
-
-if __name__ == \"__main__\":
+            logging.error(f"Error during data collection GUI handling: {e}")
+            self._on_collect_error(str(e))
+            return
+        self._on_collect_done(results)
+
+    def _get_collect_cache(self):
+        """The cache of collection results, read from disk the first time it is needed."""
+        if self._collect_cache is None:
+            try:
+                with open(self._collect_cache_path, "r", encoding="utf-8") as f:
+                    self._collect_cache = json.load(f)
+            except (OSError, ValueError): # No cache yet, or an unreadable one: start afresh
+                self._collect_cache = {}
+        return self._collect_cache
+
+    def _remember_results(self, cache_key, results):
+        """Adds results to the collection cache, dropping the oldest entries beyond COLLECT_CACHE_SIZE, and saves it."""
+        cache = self._get_collect_cache()
+        cache.pop(cache_key, None)
+        cache[cache_key] = {key: value for key, value in results.items() if key != "parsed_tree"} # Trees are not JSON
+        while len(cache) > COLLECT_CACHE_SIZE:
+            del cache[next(iter(cache))]
+        try:
+            with open(self._collect_cache_path, "w", encoding="utf-8") as f:
+                json.dump(cache, f, default=str)
+        except OSError as e:
+            logging.warning(f"Could not save the collection cache to {self._collect_cache_path}: {e}")
+
+    def _on_collect_done(self, results):
+        self.dc_collect_button.setEnabled(True)
+        if self._pending_cache_key is not None:
+            self._remember_results(self._pending_cache_key, results)
+            self._pending_cache_key = None
+        # Display results (simplified)
+        self.dc_results_area.appendPlainText(build_display_text(results.get("url"), results))
+        self._links_model.set_links(results.get("links") or [])
+
+    def _on_collect_error(self, message):
+        self.dc_collect_button.setEnabled(True)
+        self._pending_cache_key = None
+        self.dc_results_area.appendPlainText(f"Error: {message}\n")
+        self._show_message(QMessageBox.Icon.Critical, "Collection Error", f"An error occurred: {message}")
+
+
+if __name__ == "__main__":
+    _init_logging()
     app = QApplication(sys.argv)
-    # Potentially set an application icon here
-    # app.setWindowIcon(QIcon(\
+    app.setStyleSheet(WebAnalysisToolGUI.APP_QSS)
+    # Potentially set an application icon here (import QIcon from PyQt6.QtGui at that point)
+    # app.setWindowIcon(QIcon("path/to/icon.png"))
+    main_window = WebAnalysisToolGUI()
+    main_window.show()
+    sys.exit(run_event_loop(app))
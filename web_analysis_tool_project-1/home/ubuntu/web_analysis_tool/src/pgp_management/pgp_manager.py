@@ -1,8 +1,10 @@
 # pgp_manager.py
 
-import gnupg
 import logging # Use standard logging
 import os
+import re
+import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Import custom exceptions
 from ..utils.custom_exceptions import PGPManagementError, ConfigurationError
@@ -10,10 +12,36 @@ from ..utils.custom_exceptions import PGPManagementError, ConfigurationError
 # Get a logger for this module
 logger = logging.getLogger(__name__)
 
+# Number of keyring shards used when sharding is enabled, one per leading hex digit of a fingerprint.
+GPG_SHARD_COUNT = 16
+# Full v4 (40 hex) or v5 (64 hex) fingerprints; only these can be routed to a shard.
+_FINGERPRINT_RE = re.compile(r"^(?:[0-9A-Fa-f]{40}|[0-9A-Fa-f]{64})$")
+# Key types generated as an elliptic-curve signing key plus an ECDH encryption subkey.
+ECC_KEY_TYPES = ("ECC", "EDDSA", "ECDSA")
+# Encryption subkey curve paired with each signing curve; other curves reuse the signing curve.
+_ECDH_SUBKEY_CURVES = {"ed25519": "cv25519"}
+# Buffer size for writing exported key files, so a whole keyring goes out in a few syscalls.
+KEY_FILE_BUFFER_SIZE = 256 * 1024
+# Random bytes in each simulated authentication challenge.
+CHALLENGE_NONCE_BYTES = 16
+
 class PGPManager:
     """Manages PGP key generation, storage, and cryptographic operations."""
 
-    def __init__(self, gpg_home=None, gpg_binary=None):
+    # GnuPG --gen-key batch parameters; only the per-key values are substituted at generation time.
+    _BATCH_TEMPLATE = (
+        "Key-Type: {key_type}\nKey-Length: {key_length}\n"
+        "Name-Real: {name_real}\nName-Email: {name_email}\n"
+        "Passphrase: {passphrase}\nExpire-Date: 0\n%commit\n"
+    )
+    _ECC_BATCH_TEMPLATE = (
+        "Key-Type: {key_type}\nKey-Curve: {key_curve}\n"
+        "Subkey-Type: ECDH\nSubkey-Curve: {subkey_curve}\n"
+        "Name-Real: {name_real}\nName-Email: {name_email}\n"
+        "Passphrase: {passphrase}\nExpire-Date: 0\n%commit\n"
+    )
+
+    def __init__(self, gpg_home=None, gpg_binary=None, sharded=False):
         """
         Initializes the PGPManager.
 
@@ -22,68 +50,198 @@ class PGPManager:
                                       If None, python-gnupg will use the default GPG home.
                                       It is highly recommended to use a dedicated directory for the application keys.
             gpg_binary (str, optional): Path to the GPG binary. If None, it will be searched in PATH.
+            sharded (bool, optional): Split the keyring into GPG_SHARD_COUNT sub-homes
+                                      (gpg_home/shard_0 .. shard_f) keyed by the first hex digit of
+                                      each fingerprint, so operations on different keys do not queue
+                                      behind one gpg-agent. Requires gpg_home. Keys are then addressed
+                                      by full fingerprint; gpg_home itself only stages new keys.
         """
         self.gpg = None
+        # The gnupg module, imported on first construction so importing this module stays cheap.
+        self._gnupg = None
+        # Set once GnuPG has answered with a version, so later calls only check a flag.
+        self._gpg_ready = False
+        # GnuPG version tuple probed by python-gnupg at construction, read once and kept here.
+        self._gpg_version_info = None
+        # One gnupg.GPG per shard when sharding is enabled, empty otherwise.
+        self.gpg_shards = []
+        # Last list_keys result per secret flag and secret keys by fingerprint; both are
+        # built on first use and dropped by _invalidate_key_cache whenever the keyring changes.
+        self._keys_cache = {False: None, True: None}
+        self._secret_fp_index = None
         try:
             if gpg_home:
-                if not os.path.exists(gpg_home):
-                    # Ensure the parent directory exists before creating gpg_home
-                    parent_gpg_home = os.path.dirname(gpg_home)
-                    if parent_gpg_home and not os.path.exists(parent_gpg_home):
-                         os.makedirs(parent_gpg_home, exist_ok=True)
-                    os.makedirs(gpg_home, mode=0o700, exist_ok=True) # Ensure directory is private
+                # Creates missing parents too; only gpg_home itself gets the private mode.
+                os.makedirs(gpg_home, mode=0o700, exist_ok=True)
                 logger.info(f"Using GPG home directory: {gpg_home}")
             
-            self.gpg = gnupg.GPG(gnupghome=gpg_home, gpgbinary=gpg_binary)
+            import gnupg
+            self._gnupg = gnupg
+            self.gpg = gnupg.GPG(gnupghome=gpg_home, gpgbinary=gpg_binary or "gpg")
             
-            # Test GPG availability and version
-            version_info = self.gpg.version
+            # Test GPG availability and version; python-gnupg probed it in GPG(), so read it only once.
+            version_info = getattr(self.gpg, "version", None)
+            self._gpg_version_info = version_info
             if not version_info:
                 error_msg = "GnuPG binary not found or GPG version could not be determined. Please ensure GnuPG is installed and in your PATH, or specify the binary path."
                 logger.error(error_msg)
                 # self.gpg will likely be None or unusable here, subsequent calls will fail gracefully.
                 raise ConfigurationError(error_msg)
             logger.info(f"GnuPG initialized. Version: {version_info}")
+            self._gpg_ready = bool(version_info)
+
+            if sharded:
+                if not gpg_home:
+                    raise ConfigurationError("A sharded keyring needs an explicit gpg_home.")
+                with ThreadPoolExecutor(max_workers=GPG_SHARD_COUNT) as executor:
+                    self.gpg_shards = list(executor.map(
+                        lambda index: self._open_shard(gpg_home, gpg_binary, index), range(GPG_SHARD_COUNT)
+                    ))
+                logger.info(f"Using {GPG_SHARD_COUNT} keyring shards under {gpg_home}")
 
         except FileNotFoundError as fnf_error: # Specifically if gpg_binary path is wrong
             error_msg = f"GnuPG binary not found at specified path or in PATH: {fnf_error}. Ensure GnuPG is installed and configured correctly."
             logger.error(error_msg)
             self.gpg = None # Ensure gpg is None if initialization fails
+            self._gpg_ready = False
+            self.gpg_shards = []
             raise ConfigurationError(error_msg)
         except Exception as e:
             error_msg = f"Failed to initialize GPG: {e}. Ensure GnuPG is installed and configured correctly."
             logger.error(error_msg, exc_info=True)
             self.gpg = None # Ensure gpg is None if initialization fails
+            self._gpg_ready = False
+            self.gpg_shards = []
             raise ConfigurationError(error_msg)
 
+    def _open_shard(self, gpg_home, gpg_binary, index):
+        """Creates the private sub-home for one shard and returns a gnupg.GPG bound to it."""
+        shard_home = os.path.join(gpg_home, f"shard_{index:x}")
+        os.makedirs(shard_home, mode=0o700, exist_ok=True)
+        return self._gnupg.GPG(gnupghome=shard_home, gpgbinary=gpg_binary or "gpg")
+
+    @staticmethod
+    def _shard_index(fingerprint):
+        return int(fingerprint[0], 16) % GPG_SHARD_COUNT
+
+    def _shard_for(self, fingerprint):
+        """Returns the shard that owns fingerprint."""
+        return self.gpg_shards[self._shard_index(fingerprint)]
+
+    def _gpg_for(self, keyid):
+        """Returns the gnupg.GPG instance holding keyid: its shard when sharded, else the single keyring."""
+        if not self.gpg_shards:
+            return self.gpg
+        if not _FINGERPRINT_RE.match(keyid or ""):
+            raise PGPManagementError(f"Sharded keyrings address keys by full fingerprint; got {keyid!r}.")
+        return self._shard_for(keyid)
+
+    def _list_sharded_keys(self, secret):
+        """Lists every shard in parallel, keeping only the keys each shard owns."""
+        with ThreadPoolExecutor(max_workers=GPG_SHARD_COUNT) as executor:
+            listings = list(executor.map(lambda gpg: gpg.list_keys(secret), self.gpg_shards))
+        return [
+            key
+            for index, listing in enumerate(listings)
+            for key in listing
+            if self._shard_index(key["fingerprint"]) == index
+        ]
+
+    def _move_to_shard(self, fingerprint, passphrase=None, has_secret=True):
+        """Moves a key from the staging keyring in gpg_home into the shard that owns it."""
+        key_data = self.gpg.export_keys(fingerprint)
+        if has_secret:
+            key_data += self.gpg.export_keys(fingerprint, secret=True, passphrase=passphrase)
+        import_result = self._shard_for(fingerprint).import_keys(key_data, passphrase=passphrase)
+        if not import_result or fingerprint not in import_result.fingerprints:
+            raise PGPManagementError(f"Failed to move key {fingerprint} into its keyring shard.")
+        if has_secret:
+            self.gpg.delete_keys(fingerprint, secret=True, passphrase=passphrase)
+        self.gpg.delete_keys(fingerprint)
+
+    def migrate_to_shards(self, passphrase=None):
+        """
+        Moves every key from the unsharded keyring in gpg_home into its shard.
+        Secret keys are exported with passphrase, so keys protected by another passphrase fail.
+        Returns the list of migrated fingerprints or raises PGPManagementError.
+        """
+        self._ensure_gpg_available()
+        if not self.gpg_shards:
+            raise PGPManagementError("Keyring sharding is not enabled for this PGPManager.")
+        try:
+            secret_fingerprints = {key["fingerprint"] for key in self.gpg.list_keys(True)}
+            migrated = []
+            for key in self.gpg.list_keys():
+                fingerprint = key["fingerprint"]
+                self._move_to_shard(fingerprint, passphrase, has_secret=fingerprint in secret_fingerprints)
+                migrated.append(fingerprint)
+            self._invalidate_key_cache()
+            logger.info(f"Migrated {len(migrated)} keys into keyring shards.")
+            return migrated
+        except PGPManagementError:
+            raise
+        except Exception as e:
+            logger.error(f"Error migrating keys into keyring shards: {e}", exc_info=True)
+            raise PGPManagementError(f"Failed to migrate keys into keyring shards: {e}")
+
     def _ensure_gpg_available(self):
-        if not self.gpg or not self.gpg.version: # Check version again as a proxy for successful init
+        if not self._gpg_ready:
             raise PGPManagementError("GnuPG is not available or not properly initialized. Please check application logs and GPG setup.")
 
-    def generate_key_pair(self, name_real, name_email, passphrase, key_type="RSA", key_length=2048):
+    def _invalidate_key_cache(self):
+        self._keys_cache = {False: None, True: None}
+        self._secret_fp_index = None
+
+    def _get_secret_index(self):
+        """Returns a dict mapping fingerprint to secret key dict, listing the keyring only once."""
+        if self._secret_fp_index is None:
+            self._secret_fp_index = {key["fingerprint"]: key for key in self.list_keys(secret=True)}
+        return self._secret_fp_index
+
+    def generate_key_pair(self, name_real, name_email, passphrase, key_type="ECC", key_length=2048, key_curve="ed25519"):
         """
         Generates a new PGP key pair.
+        The default is an Ed25519 signing key with a Curve25519 encryption subkey, which needs far less
+        entropy than RSA and is generated almost instantly. Pass key_type="RSA" (with key_length 2048 or
+        4096) for interoperability with older OpenPGP implementations; key_length only applies to RSA.
         Returns gnupg.GenKey object or raises PGPManagementError.
         """
         self._ensure_gpg_available()
-        logger.info(f"Attempting to generate PGP key for {name_email} with type {key_type} and length {key_length}.")
+        ecc = key_type.upper() in ECC_KEY_TYPES
+        key_spec = f"curve {key_curve}" if ecc else f"length {key_length}"
+        logger.info(f"Attempting to generate PGP key for {name_email} with type {key_type} and {key_spec}.")
         
         # Check if passphrase is provided
         if not passphrase:
             logger.error("Passphrase is required to generate a PGP key.")
             raise PGPManagementError("Passphrase cannot be empty for key generation.")
-
-        input_data = self.gpg.gen_key_input(
-            name_real=name_real,
-            name_email=name_email,
-            passphrase=passphrase,
-            key_type=key_type,
-            key_length=key_length,
-            expire_date=0 # 0 means key does not expire
-        )
+        if not name_email:
+            raise PGPManagementError("Email address cannot be empty for key generation.")
+        # Each value fills one line of the batch file, so a newline would inject extra parameters.
+        if any("\n" in str(value) or "\r" in str(value) for value in (name_real, name_email, passphrase, key_type, key_curve)):
+            raise PGPManagementError("Key generation parameters cannot contain line breaks.")
+
+        params = {
+            "name_real": name_real or "Autogenerated Key",
+            "name_email": name_email,
+            "passphrase": passphrase,
+        }
+        if ecc:
+            params.update(
+                key_type="EDDSA" if key_curve == "ed25519" else "ECDSA",
+                key_curve=key_curve,
+                subkey_curve=_ECDH_SUBKEY_CURVES.get(key_curve, key_curve),
+            )
+            input_data = self._ECC_BATCH_TEMPLATE.format_map(params)
+        else:
+            params.update(key_type=key_type, key_length=key_length)
+            input_data = self._BATCH_TEMPLATE.format_map(params)
         try:
             key = self.gpg.gen_key(input_data)
+            self._invalidate_key_cache()
             if key and key.fingerprint:
+                if self.gpg_shards:
+                    self._move_to_shard(key.fingerprint, passphrase)
                 logger.info(f"Successfully generated PGP key. Fingerprint: {key.fingerprint}")
                 return key
             else:
@@ -97,31 +255,102 @@ class PGPManager:
             logger.error(f"Exception during PGP key generation for {name_email}: {e}", exc_info=True)
             raise PGPManagementError(f"An unexpected error occurred during key generation: {e}")
 
-    def list_keys(self, secret=False):
-        """Lists available PGP keys. Returns list of key dicts or raises PGPManagementError."""
+    def list_keys(self, secret=False, force_refresh=False):
+        """
+        Lists available PGP keys. Returns list of key dicts or raises PGPManagementError.
+        The result is cached until this manager changes the keyring; pass force_refresh=True
+        to pick up changes made by other GnuPG clients.
+        """
         self._ensure_gpg_available()
+        if not force_refresh and self._keys_cache[secret] is not None:
+            return self._keys_cache[secret]
         try:
-            keys = self.gpg.list_keys(secret)
-            logger.info(f"Found {len(keys)} {"private" if secret else "public"} keys.")
+            keys = self._list_sharded_keys(secret) if self.gpg_shards else self.gpg.list_keys(secret)
+            logger.info("Found %d %s keys.", len(keys), "private" if secret else "public")
+            self._keys_cache[secret] = keys
+            if secret:
+                self._secret_fp_index = None
             return keys
         except Exception as e:
             logger.error(f"Error listing PGP keys (secret={secret}): {e}", exc_info=True)
             raise PGPManagementError(f"Failed to list PGP keys: {e}")
 
-    def export_key(self, keyid, output_file, secret=False, armor=True):
-        """Exports a PGP key. Returns True on success or raises PGPManagementError."""
+    @staticmethod
+    def _colon_fingerprints(gpg, secret):
+        """Runs gpg --with-colons on one keyring and returns the primary key fingerprints in a single pass."""
+        args = [gpg.gpgbinary, "--batch", "--no-tty", "--with-colons", "--fixed-list-mode", "--with-fingerprint",
+                "--list-secret-keys" if secret else "--list-keys"]
+        if gpg.gnupghome:
+            args[1:1] = ["--homedir", gpg.gnupghome]
+        output = subprocess.run(args, capture_output=True, check=True).stdout
+        fingerprints = []
+        # Every key record is followed by an fpr record; only those after pub/sec belong to primary keys.
+        after_primary = False
+        for line in output.split(b"\n"):
+            if line.startswith(b"fpr:"):
+                if after_primary:
+                    fingerprints.append(line.split(b":", 10)[9].decode("ascii"))
+                    after_primary = False
+            else:
+                after_primary = line[:4] in (b"pub:", b"sec:")
+        return fingerprints
+
+    def list_fingerprints_fast(self, secret=False):
+        """
+        Returns the fingerprints of all keys as a plain list of strings.
+        Parses gpg's colon listing directly instead of building python-gnupg's key dicts, which
+        is much cheaper on large keyrings. Use it for lookups; list_keys remains the call for display.
+        """
+        self._ensure_gpg_available()
+        try:
+            if not self.gpg_shards:
+                return self._colon_fingerprints(self.gpg, secret)
+            with ThreadPoolExecutor(max_workers=GPG_SHARD_COUNT) as executor:
+                listings = list(executor.map(lambda gpg: self._colon_fingerprints(gpg, secret), self.gpg_shards))
+            return [
+                fingerprint
+                for index, listing in enumerate(listings)
+                for fingerprint in listing
+                if self._shard_index(fingerprint) == index
+            ]
+        except subprocess.CalledProcessError as e:
+            logger.error(f"gpg failed listing fingerprints (secret={secret}): {e.stderr}")
+            raise PGPManagementError(f"Failed to list PGP key fingerprints: {e.stderr}")
+        except Exception as e:
+            logger.error(f"Error listing PGP key fingerprints (secret={secret}): {e}", exc_info=True)
+            raise PGPManagementError(f"Failed to list PGP key fingerprints: {e}")
+
+    def export_key(self, keyid, output_file, secret=False, armor=True, passphrase=None):
+        """
+        Exports a PGP key. Returns True on success or raises PGPManagementError.
+        Since GnuPG 2.1 exporting a secret key needs its passphrase.
+        """
         self._ensure_gpg_available()
         if secret:
             logger.warning(f"Attempting to export SECRET key {keyid} to {output_file}. This is a sensitive operation.")
-            key_data = self.gpg.export_keys(keyid, secret=True, armor=armor)
         else:
             logger.info(f"Exporting public key {keyid} to {output_file}")
-            key_data = self.gpg.export_keys(keyid, secret=False, armor=armor)
+        try:
+            key_data = self._gpg_for(keyid).export_keys(keyid, secret=secret, armor=armor, passphrase=passphrase)
+        except ValueError as e: # python-gnupg refuses secret exports without a passphrase on GnuPG >= 2.1
+            logger.error(f"Failed to export key {keyid}: {e}")
+            raise PGPManagementError(f"Failed to export key {keyid}: {e}")
 
         if key_data:
             try:
-                with open(output_file, "w", encoding="utf-8") as f:
-                    f.write(key_data)
+                # Armored exports are ASCII text; binary exports already come back as bytes.
+                if isinstance(key_data, str):
+                    key_data = key_data.encode("ascii")
+                # Write next to the target and rename, so readers never see a half-written key file.
+                tmp_file = output_file + ".tmp"
+                try:
+                    with open(tmp_file, "wb", buffering=KEY_FILE_BUFFER_SIZE) as f:
+                        f.write(key_data)
+                    os.replace(tmp_file, output_file)
+                except IOError:
+                    if os.path.exists(tmp_file):
+                        os.remove(tmp_file)
+                    raise
                 logger.info(f"Key {keyid} successfully exported to {output_file}")
                 return True
             except IOError as e:
@@ -131,20 +360,46 @@ class PGPManager:
             logger.error(f"Failed to export key {keyid}. Key not found or error during export.")
             raise PGPManagementError(f"Failed to export key {keyid}. Check if key exists and GPG logs.")
 
-    def import_key(self, key_file_path):
-        """Imports a PGP key. Returns gnupg.ImportResult or raises PGPManagementError."""
+    def export_all_keys(self, output_dir, secret=False, armor=True, max_workers=None, passphrase=None):
+        """
+        Exports every key in the keyring to output_dir as <fingerprint>.asc (or .gpg when armor=False).
+        Secret keys are exported with passphrase, so keys protected by another passphrase fail.
+        Exports run on a thread pool so one key's file writes overlap the next key's GPG export.
+        Returns the list of written paths or raises PGPManagementError.
+        """
+        self._ensure_gpg_available()
+        os.makedirs(output_dir, exist_ok=True)
+        extension = ".asc" if armor else ".gpg"
+        fingerprints = [key["fingerprint"] for key in self.list_keys(secret)]
+        paths = [os.path.join(output_dir, fingerprint + extension) for fingerprint in fingerprints]
+        with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+            list(executor.map(
+                lambda fingerprint, path: self.export_key(fingerprint, path, secret=secret, armor=armor, passphrase=passphrase),
+                fingerprints, paths,
+            ))
+        logger.info(f"Exported {len(paths)} {'private' if secret else 'public'} keys to {output_dir}")
+        return paths
+
+    def import_key(self, key_file_path, passphrase=None):
+        """
+        Imports a PGP key. Returns gnupg.ImportResult or raises PGPManagementError.
+        With sharding, secret keys are moved out of the staging keyring with passphrase.
+        """
         self._ensure_gpg_available()
         try:
-            with open(key_file_path, "r", encoding="utf-8") as f:
-                key_data = f.read()
-            import_result = self.gpg.import_keys(key_data)
+            # Unbuffered readall() sizes its result from fstat and reads straight into it,
+            # so the key data is not copied through an intermediate stdio buffer.
+            with open(key_file_path, "rb", buffering=0) as f:
+                key_data = f.readall()
+            import_result = self._import_sharded(key_data, passphrase) if self.gpg_shards else self.gpg.import_keys(key_data)
+            self._invalidate_key_cache()
             if import_result and import_result.fingerprints:
                 logger.info(f"Key import result: Fingerprints imported: {import_result.fingerprints}")
             elif import_result:
                  logger.warning(f"Key import processed, but no fingerprints reported. Status: {import_result.results}")
             else:
                 logger.error(f"Key import failed for {key_file_path}. Result: {import_result}")
-                raise PGPManagementError(f"Key import failed. GPG result: {import_result.results if import_result else \"No result\"}")
+                raise PGPManagementError(f"Key import failed. GPG result: {import_result.results if import_result else 'No result'}")
             return import_result
         except IOError as e:
             logger.error(f"IOError reading key file {key_file_path}: {e}")
@@ -153,24 +408,40 @@ class PGPManager:
             logger.error(f"Error importing key from {key_file_path}: {e}", exc_info=True)
             raise PGPManagementError(f"An unexpected error occurred during key import: {e}")
 
+    def _import_sharded(self, key_data, passphrase=None):
+        """
+        Imports key_data into the staging keyring, then moves each key into the shard that owns it,
+        so no shard ends up with copies of keys it does not own. Returns the staging import result.
+        """
+        import_result = self.gpg.import_keys(key_data, passphrase=passphrase)
+        if not import_result:
+            return import_result
+        # Secret-key bundles report every fingerprint once for the pub and once for the sec entry.
+        fingerprints = list(dict.fromkeys(import_result.fingerprints))
+        secret_fingerprints = {key["fingerprint"] for key in self.gpg.list_keys(True)}
+        for fingerprint in fingerprints:
+            self._move_to_shard(fingerprint, passphrase, has_secret=fingerprint in secret_fingerprints)
+        import_result.fingerprints = fingerprints
+        return import_result
+
     def delete_key(self, fingerprint, secret=False):
         """Deletes a PGP key. Returns True on success or raises PGPManagementError."""
         self._ensure_gpg_available()
         action = "SECRET" if secret else "public"
-        log_message = f"Attempting to delete {action} key with fingerprint {fingerprint}. This is a destructive operation if secret=True."
-        if secret: logger.warning(log_message)
-        else: logger.info(log_message)
+        logger.log(logging.WARNING if secret else logging.INFO,
+                   "Attempting to delete %s key with fingerprint %s. This is a destructive operation if secret=True.", action, fingerprint)
         
         try:
             # Pass expect_passphrase=True if the key might be passphrase protected for deletion (though usually not for public keys)
             # For secret keys, GPG might prompt if not handled by agent or if passphrase not supplied to python-gnupg directly.
             # This tool assumes user handles GPG agent or enters passphrase if prompted by GPG CLI via python-gnupg.
-            result = self.gpg.delete_keys(fingerprint, secret=secret)
+            result = self._gpg_for(fingerprint).delete_keys(fingerprint, secret=secret)
+            self._invalidate_key_cache()
             if result and "ok" in result.status.lower():
-                logger.info(f"Successfully processed delete request for {action} key {fingerprint}. Status: {result.status}")
+                logger.info("Successfully processed delete request for %s key %s. Status: %s", action, fingerprint, result.status)
                 return True
             elif result and ("not found" in result.status.lower() or "no such key" in result.status.lower()):
-                logger.info(f"{action.capitalize()} key {fingerprint} not found for deletion. Status: {result.status}")
+                logger.info("%s key %s not found for deletion. Status: %s", action.capitalize(), fingerprint, result.status)
                 return True # Key is not present, so deletion is effectively successful.
             else:
                 status_msg = result.status if result else "Unknown error from GPG"
@@ -181,6 +452,40 @@ class PGPManager:
             logger.error(f"Exception during key deletion for fingerprint {fingerprint} (secret={secret}): {e}", exc_info=True)
             raise PGPManagementError(f"An unexpected error occurred during key deletion: {e}")
 
+    def delete_keys_bulk(self, fingerprints, secret=False, passphrase=None):
+        """
+        Deletes several keys with a single GPG invocation (one per shard when sharded).
+        Since GnuPG 2.1 deleting secret keys needs their passphrase. Keys that are already
+        gone count as deleted. Returns True on success or raises PGPManagementError.
+        """
+        self._ensure_gpg_available()
+        fingerprints = list(fingerprints)
+        if not fingerprints:
+            return True
+        action = "SECRET" if secret else "public"
+        logger.log(logging.WARNING if secret else logging.INFO,
+                   "Attempting to delete %d %s keys. This is a destructive operation if secret=True.", len(fingerprints), action)
+
+        by_keyring = {}
+        for fingerprint in fingerprints:
+            gpg = self._gpg_for(fingerprint)
+            by_keyring.setdefault(id(gpg), (gpg, []))[1].append(fingerprint)
+        try:
+            for gpg, group in by_keyring.values():
+                result = gpg.delete_keys(group, secret=secret, passphrase=passphrase)
+                if result.status not in ("ok", "No such key"):
+                    logger.error(f"Failed to delete {action} keys {group}. Status: {result.status}, Stderr: {result.stderr}")
+                    raise PGPManagementError(f"Failed to delete {action} keys {group}. GPG Status: {result.status}. Details: {result.stderr}")
+            logger.info("Deleted %d %s keys.", len(fingerprints), action)
+            return True
+        except PGPManagementError:
+            raise
+        except Exception as e:
+            logger.error(f"Exception during bulk key deletion (secret={secret}): {e}", exc_info=True)
+            raise PGPManagementError(f"An unexpected error occurred during bulk key deletion: {e}")
+        finally:
+            self._invalidate_key_cache()
+
     def encrypt_message(self, recipients, message, armor=True, sign=None, passphrase=None):
         """Encrypts a message. Returns encrypted string or raises PGPManagementError."""
         self._ensure_gpg_available()
@@ -191,7 +496,7 @@ class PGPManager:
             logger.warning("Encrypting an empty message.")
 
         try:
-            encrypted_data = self.gpg.encrypt(message, recipients, armor=armor, sign=sign, passphrase=passphrase, always_trust=True)
+            encrypted_data = self._gpg_for_recipients(recipients, sign).encrypt(message, recipients, armor=armor, sign=sign, passphrase=passphrase, always_trust=True)
             if encrypted_data.ok:
                 logger.info("Message encrypted successfully.")
                 return str(encrypted_data)
@@ -202,6 +507,73 @@ class PGPManager:
             logger.error(f"Exception during message encryption: {e}", exc_info=True)
             raise PGPManagementError(f"An unexpected error occurred during encryption: {e}")
 
+    def encrypt_message_bulk(self, recipient_groups, message, armor=True, sign=None, passphrase=None, max_workers=None):
+        """
+        Encrypts the same message separately for each recipient group, running the GPG calls concurrently.
+
+        Use this for broadcasts where every recipient (or group) gets its own ciphertext; for a single
+        ciphertext readable by several recipients use encrypt_message. GnuPG 2's gpg-agent serializes
+        secret-key operations, which caps the speedup when sign is set or all recipients share one home;
+        a sharded PGPManager (or GnuPG 1) lets the calls actually overlap.
+
+        Args:
+            recipient_groups (iterable): Fingerprints, or lists of fingerprints, one entry per ciphertext.
+            message (str): The message to encrypt.
+            max_workers (int, optional): Thread pool size. Defaults to os.cpu_count().
+
+        Returns:
+            list: Encrypted strings in the same order as recipient_groups, or raises PGPManagementError.
+        """
+        self._ensure_gpg_available()
+        groups = [[group] if isinstance(group, str) else list(group) for group in recipient_groups]
+        if not groups or not all(groups):
+            raise PGPManagementError("Every recipient group must name at least one recipient for encryption.")
+        if not message:
+            logger.warning("Encrypting an empty message.")
+
+        encrypted = [None] * len(groups)
+        with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+            futures = {
+                executor.submit(
+                    self._gpg_for_recipients(group, sign).encrypt,
+                    message, group, armor=armor, sign=sign, passphrase=passphrase, always_trust=True,
+                ): index
+                for index, group in enumerate(groups)
+            }
+            for future in as_completed(futures):
+                index = futures[future]
+                try:
+                    encrypted_data = future.result()
+                except Exception as e:
+                    logger.error(f"Exception during bulk encryption for {groups[index]}: {e}", exc_info=True)
+                    raise PGPManagementError(f"An unexpected error occurred during bulk encryption: {e}")
+                if not encrypted_data.ok:
+                    logger.error(f"Failed to encrypt message for {groups[index]}. Status: {encrypted_data.status}, Stderr: {encrypted_data.stderr}")
+                    raise PGPManagementError(f"Encryption failed for {groups[index]}. GPG Status: {encrypted_data.status}. Details: {encrypted_data.stderr}")
+                encrypted[index] = str(encrypted_data)
+        logger.info("Message encrypted for %d recipient groups.", len(groups))
+        return encrypted
+
+    def _gpg_for_recipients(self, recipients, sign=None):
+        """Returns the keyring to encrypt with; with sharding, all recipients and the signer must share a shard."""
+        if not self.gpg_shards:
+            return self.gpg
+        fingerprints = list(recipients) + ([sign] if sign else [])
+        shards = {id(self._gpg_for(fingerprint)): self._gpg_for(fingerprint) for fingerprint in fingerprints}
+        if len(shards) > 1:
+            raise PGPManagementError("Recipients and signer are spread over several keyring shards; encrypt to each shard separately.")
+        return next(iter(shards.values()))
+
+    def _decrypt_sharded(self, encrypted_message, passphrase):
+        """Decrypts with the shard holding a secret key the message is addressed to."""
+        recipient_ids = set(self.gpg.get_recipients(encrypted_message))
+        for fingerprint, key in self._get_secret_index().items():
+            key_ids = {key["keyid"]}.union(subkey[0] for subkey in key.get("subkeys", []))
+            if recipient_ids & key_ids:
+                return self._shard_for(fingerprint).decrypt(encrypted_message, passphrase=passphrase)
+        # No local secret key matches; let GnuPG report the failure.
+        return self.gpg.decrypt(encrypted_message, passphrase=passphrase)
+
     def decrypt_message(self, encrypted_message, passphrase=None):
         """Decrypts a PGP message. Returns decrypted string or raises PGPManagementError."""
         self._ensure_gpg_available()
@@ -209,19 +581,25 @@ class PGPManager:
             raise PGPManagementError("Encrypted message cannot be empty for decryption.")
 
         try:
-            decrypted_data = self.gpg.decrypt(encrypted_message, passphrase=passphrase)
+            decrypted_data = self._decrypt_sharded(encrypted_message, passphrase) if self.gpg_shards else self.gpg.decrypt(encrypted_message, passphrase=passphrase)
             if decrypted_data.ok:
                 logger.info("Message decrypted successfully.")
                 return str(decrypted_data)
-            elif "no secret key" in str(decrypted_data.stderr).lower() or decrypted_data.status == "no secret key":
+            # GPG's status usually names the failure; stderr is only lowered and scanned when it does not.
+            status = decrypted_data.status or ""
+            stderr_l = "" if status in ("bad passphrase", "no secret key") else str(decrypted_data.stderr or "").lower()
+            # A wrong passphrase also makes GnuPG print "No secret key", so it is checked first.
+            if status == "bad passphrase" or "bad passphrase" in stderr_l:
+                logger.error(f"Decryption failed: Bad passphrase. Status: {decrypted_data.status}, Stderr: {decrypted_data.stderr}")
+                raise PGPManagementError("Decryption failed: Incorrect passphrase provided.")
+            elif status == "no secret key" or "no secret key" in stderr_l:
                 logger.error(f"Decryption failed: No secret key available for the encrypted message. Status: {decrypted_data.status}, Stderr: {decrypted_data.stderr}")
                 raise PGPManagementError("Decryption failed: No secret key available for one or more recipients.")
-            elif "bad passphrase" in str(decrypted_data.stderr).lower() or decrypted_data.status == "bad passphrase":
-                 logger.error(f"Decryption failed: Bad passphrase. Status: {decrypted_data.status}, Stderr: {decrypted_data.stderr}")
-                 raise PGPManagementError("Decryption failed: Incorrect passphrase provided.")
             else:
                 logger.error(f"Failed to decrypt message. Status: {decrypted_data.status}, Stderr: {decrypted_data.stderr}")
                 raise PGPManagementError(f"Decryption failed. GPG Status: {decrypted_data.status}. Details: {decrypted_data.stderr}")
+        except PGPManagementError: # Already classified above
+            raise
         except Exception as e:
             logger.error(f"Exception during message decryption: {e}", exc_info=True)
             raise PGPManagementError(f"An unexpected error occurred during decryption: {e}")
@@ -239,31 +617,32 @@ class PGPManager:
         logger.warning("ETHICAL USE WARNING: This function is for educational demonstration on systems you OWN and have EXPLICITLY configured for PGP authentication tests.")
         logger.warning("Attempting unauthorized access to any system is illegal and unethical.")
         
-        private_keys = self.list_keys(secret=True)
-        target_key = next((key for key in private_keys if key["fingerprint"] == key_fingerprint), None)
+        target_key = self._get_secret_index().get(key_fingerprint)
         if not target_key:
             msg = f"Private key with fingerprint {key_fingerprint} not found in keyring for simulation."
             logger.error(msg)
             # This is not a GPG operational error, but a logic error for the simulation
             return {"success": False, "message": msg, "details": "Key not found."}
 
-        logger.info(f"Simulating authentication for system: {target_system_info.get("type", "unknown")} at {target_system_info.get("host", "unknown_host")} using key {key_fingerprint}")
+        logger.info(f"Simulating authentication for system: {target_system_info.get('type', 'unknown')} at {target_system_info.get('host', 'unknown_host')} using key {key_fingerprint}")
         
-        challenge_data = f"simulated_challenge_from_{target_system_info.get("host", "target")}_{datetime.utcnow().timestamp()}"
+        challenge = f"simulated_challenge_from_{target_system_info.get('host', 'target')}_{os.urandom(CHALLENGE_NONCE_BYTES).hex()}"
+        # Passing bytes lets python-gnupg feed GPG directly instead of encoding a str first.
+        challenge_data = challenge.encode("utf-8")
         try:
             # Test signing capability with the key and passphrase
-            signed_data = self.gpg.sign(challenge_data, keyid=key_fingerprint, passphrase=passphrase, clearsign=False, detach=True)
-            if signed_data and signed_data.ok:
+            signed_data = self._gpg_for(key_fingerprint).sign(challenge_data, keyid=key_fingerprint, passphrase=passphrase, clearsign=False, detach=True)
+            if signed_data: # python-gnupg Sign results are truthy once a signature was produced
                 logger.info("Successfully signed simulated challenge data with the PGP key.")
                 return {
                     "success": True, 
                     "message": "PGP authentication simulation: Key accessed and challenge signed (simulated).",
                     "details": "This is a conceptual step. Actual authentication requires a compatible target system and protocol (e.g., SSH agent, PGP-based web challenge).",
-                    "simulated_challenge": challenge_data,
+                    "simulated_challenge": challenge,
                     "simulated_signature_status": str(signed_data.status)
                 }
             else:
-                err_msg = f"Failed to sign simulated challenge. GPG status: {signed_data.status if signed_data else "N/A"}, stderr: {signed_data.stderr if signed_data else "N/A"}"
+                err_msg = f"Failed to sign simulated challenge. GPG status: {signed_data.status if signed_data else 'N/A'}, stderr: {signed_data.stderr if signed_data else 'N/A'}"
                 logger.error(err_msg)
                 # This indicates a problem with the key or passphrase during the GPG operation
                 raise PGPManagementError(f"Simulation signing failed: {err_msg}")
@@ -283,8 +662,7 @@ if __name__ == "__main__":
     test_gpg_home_path = os.path.join(project_root, "test_gnupg_home")
     
     # Ensure the test GPG home directory exists
-    if not os.path.exists(test_gpg_home_path):
-        os.makedirs(test_gpg_home_path, mode=0o700)
+    os.makedirs(test_gpg_home_path, mode=0o700, exist_ok=True)
     
     # Setup logging for the test
     setup_logging(logging.DEBUG)
@@ -309,12 +687,12 @@ if __name__ == "__main__":
             logger.info("\n--- Listing Public Keys ---")
             public_keys = pgp_manager.list_keys()
             for pk in public_keys:
-                logger.debug(f"  Public Key UID: {pk.get("uids")}, Fingerprint: {pk.get("fingerprint")}")
+                logger.debug("  Public Key UID: %s, Fingerprint: %s", pk.get("uids"), pk.get("fingerprint"))
 
             logger.info("\n--- Listing Private Keys ---")
             private_keys = pgp_manager.list_keys(secret=True)
             for sk in private_keys:
-                logger.debug(f"  Private Key UID: {sk.get("uids")}, Fingerprint: {sk.get("fingerprint")}")
+                logger.debug("  Private Key UID: %s, Fingerprint: %s", sk.get("uids"), sk.get("fingerprint"))
 
             logger.info("\n--- Exporting Public Key ---")
             public_key_file = os.path.join(test_gpg_home_path, "test_public_key.asc")
@@ -329,7 +707,7 @@ if __name__ == "__main__":
             message_to_encrypt = "This is a secret message for the PGPManager test!"
             encrypted_msg = pgp_manager.encrypt_message([test_fingerprint], message_to_encrypt, sign=test_fingerprint, passphrase=key_pass)
             if encrypted_msg:
-                logger.debug(f"Encrypted: {encrypted_msg[:150]}...")
+                logger.debug("Encrypted: %s...", encrypted_msg[:150])
                 decrypted_msg = pgp_manager.decrypt_message(encrypted_msg, passphrase=key_pass)
                 if decrypted_msg:
                     logger.info(f"Decrypted: {decrypted_msg}")
@@ -354,8 +732,8 @@ if __name__ == "__main__":
             if test_fingerprint:
                 logger.info("\n--- Deleting Test Key (Cleanup) ---")
                 try:
-                    pgp_manager.delete_key(test_fingerprint, secret=True)
-                    pgp_manager.delete_key(test_fingerprint, secret=False) # Public part
+                    pgp_manager.delete_keys_bulk([test_fingerprint], secret=True, passphrase=key_pass)
+                    pgp_manager.delete_keys_bulk([test_fingerprint]) # Public part
                     logger.info("Test key deletion processed.")
                 except PGPManagementError as e:
                     logger.error(f"Error during test key cleanup: {e}")
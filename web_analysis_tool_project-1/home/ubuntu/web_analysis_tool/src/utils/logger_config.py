@@ -1,8 +1,10 @@
 # logger_config.py
 
+import atexit
 import logging
 import os
-from logging.handlers import RotatingFileHandler
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 # Define the path for log files within the application's data directory
 APP_NAME = "WebAnalysisTool"
@@ -11,17 +13,58 @@ APP_NAME = "WebAnalysisTool"
 # This should be consistent with where other app data (like GPG home) might be stored.
 APP_DATA_DIR = os.path.join(os.path.expanduser("~"), ".web_analysis_tool_data")
 LOG_DIR = os.path.join(APP_DATA_DIR, "logs")
+LOG_FILE_PATH = os.path.join(LOG_DIR, "app.log")
+# Write buffer for the log file; records below LOG_FLUSH_LEVEL wait in it until it fills.
+LOG_FILE_BUFFER_SIZE = 64 * 1024
+# Records at or above this level are flushed to disk as soon as they are written.
+LOG_FLUSH_LEVEL = logging.WARNING
 
-if not os.path.exists(LOG_DIR):
-    os.makedirs(LOG_DIR, exist_ok=True)
+# Background listener that writes queued records to the console and file handlers.
+_queue_listener = None
 
-LOG_FILE_PATH = os.path.join(LOG_DIR, "app.log")
+# Record format; LOG_LOCATION_FORMAT is inserted only when setup_logging is asked for call sites.
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - {location}%(message)s'
+LOG_LOCATION_FORMAT = '%(module)s.%(funcName)s:%(lineno)d - '
+# logging walks the stack for the caller of every record unless _srcfile is None (see the
+# "Optimization" section of the logging docs); the original value restores the walk.
+_LOGGING_SRCFILE = logging._srcfile
 
-def setup_logging(log_level=logging.INFO):
+class BufferedRotatingFileHandler(RotatingFileHandler):
+    """
+    RotatingFileHandler that writes through a large buffer and only flushes on
+    warnings and errors, instead of issuing a write syscall for every record.
+    """
+
+    def _open(self):
+        return self._builtin_open(self.baseFilename, self.mode, buffering=LOG_FILE_BUFFER_SIZE,
+                                  encoding=self.encoding, errors=self.errors)
+
+    def emit(self, record):
+        try:
+            if self.shouldRollover(record):
+                self.doRollover()
+            if self.stream is None:
+                if self.mode != "w" or not self._closed:
+                    self.stream = self._open()
+            if self.stream:
+                self.stream.write(self.format(record) + self.terminator)
+                if record.levelno >= LOG_FLUSH_LEVEL:
+                    self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+def setup_logging(log_level=logging.INFO, verbose_location=False):
     """
     Configures centralized logging for the application.
-    Logs to both console and a rotating file.
+    Logs to both console and a rotating file. Callers only enqueue records; a
+    QueueListener thread does the console and disk writes.
+    With verbose_location=True each record also shows module.function:line, which
+    costs a stack walk per record; otherwise that lookup is switched off.
     """
+    global _queue_listener
+    os.makedirs(LOG_DIR, exist_ok=True)
     # Get the root logger
     logger = logging.getLogger() # Root logger
     logger.setLevel(log_level) # Set the minimum level for the root logger
@@ -29,32 +72,47 @@ def setup_logging(log_level=logging.INFO):
     # Prevent multiple handlers if setup_logging is called more than once (e.g., in tests or reloads)
     if logger.hasHandlers():
         logger.handlers.clear()
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        for handler in _queue_listener.handlers:
+            handler.close()
+    else:
+        atexit.register(_stop_queue_listener)
 
     # Formatter
     formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(module)s.%(funcName)s:%(lineno)d - %(message)s'
+        LOG_FORMAT.format(location=LOG_LOCATION_FORMAT if verbose_location else ""), style='%'
     )
+    logging._srcfile = _LOGGING_SRCFILE if verbose_location else None
 
     # Console Handler
     console_handler = logging.StreamHandler()
     console_handler.setLevel(log_level)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
 
-    # File Handler (Rotating)
-    # Rotates logs when they reach 2MB, keeps up to 5 backup logs.
-    file_handler = RotatingFileHandler(
-        LOG_FILE_PATH, maxBytes=2*1024*1024, backupCount=5, encoding=\'utf-8\'
+    # File Handler (Rotating, buffered)
+    # Rotates logs when they reach 2MB, keeps up to 5 backup logs. The file is opened on the first record.
+    file_handler = BufferedRotatingFileHandler(
+        LOG_FILE_PATH, maxBytes=2*1024*1024, backupCount=5, encoding='utf-8', delay=True
     )
     file_handler.setLevel(log_level) # Log everything at INFO level and above to file
     file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
+
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(QueueHandler(log_queue))
+    _queue_listener = QueueListener(log_queue, console_handler, file_handler, respect_handler_level=True)
+    _queue_listener.start()
 
     logging.info("Logging configured. Log file: %s", LOG_FILE_PATH)
 
     # Return the root logger if needed, though usually modules will get their own logger via logging.getLogger(__name__)
     return logger
 
+def _stop_queue_listener():
+    """Drains the log queue at interpreter exit so no queued record is lost."""
+    if _queue_listener is not None:
+        _queue_listener.stop()
+
 # Call setup_logging here to configure it once when this module is imported.
 # However, it's often better to call this explicitly from the main application entry point.
 # For this project structure, we'll assume main_app.py will call it.
@@ -0,0 +1,34 @@
+# url_utils.py
+
+from functools import lru_cache
+from urllib.parse import urljoin, urlsplit
+
+# Number of URLs origin_of remembers the origin of
+ORIGIN_CACHE_SIZE = 4096
+
+@lru_cache(maxsize=ORIGIN_CACHE_SIZE)
+def origin_of(base_url):
+    """
+    Returns the "scheme://netloc" prefix of base_url, or None if it is not an absolute URL.
+    Cached, as the same page URL is looked up by several steps of a collection and analysis.
+    """
+    base_parts = urlsplit(base_url)
+    if not base_parts.scheme or not base_parts.netloc:
+        return None
+    return f"{base_parts.scheme}://{base_parts.netloc}"
+
+def resolve_url(origin, base_url, candidate):
+    """
+    Same result as urljoin(base_url, candidate), without reparsing base_url for the common cases:
+    root-relative paths are appended to the precomputed origin (see origin_of) and absolute
+    http(s) URLs are returned as-is. Relative paths, "//host" references and dot segments
+    still go through urljoin.
+    """
+    if origin is not None and "/." not in candidate:
+        if candidate[:1] == "/" and candidate[1:2] != "/":
+            return origin + candidate
+        if candidate.startswith(("http://", "https://")):
+            host_start = candidate.index("://") + 3
+            if candidate[host_start:host_start + 1] not in ("", "/", "?", "#"): # Has a host
+                return candidate
+    return urljoin(base_url, candidate)
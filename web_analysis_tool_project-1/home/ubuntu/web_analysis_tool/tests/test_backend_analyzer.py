@@ -0,0 +1,100 @@
+# test_backend_analyzer.py
+
+import unittest
+from unittest import mock
+
+import lxml.html
+
+from src.backend_analysis import backend_analyzer
+
+# Scripts whose API literals contain nested or overlapping pattern matches.
+API_SCRIPTS = (
+    "fetch('/svc/api/v1/users'); var endpoint = 'https://cdn.ex.com/rest/v2/items'",
+    "axios.get('/api/v2/orders'); apiUrl = '/rest/v1/stock'; $.post(\"/graphql\")",
+    "var a = '/api/x/y.json', b = \"/rest/{id}/z\"; endpoint: 'https://ex.com/api/v3'",
+)
+# Chunks where a match starts inside an earlier, longer Hyperscan span, or relies on Unicode \w.
+RAW_CHUNKS = (
+    "\"/rest/x'/graphql'url: XMLHttpRequest",
+    "'/api/v1'/rest/'/graphql'",
+    "fetch('/api/caf\u00e9/men\u00fc')",
+    "var x = 1; // no endpoints here",
+)
+
+@unittest.skipIf(backend_analyzer._API_HS_DB is None, "hyperscan is not installed")
+class ApiPathCandidatesTest(unittest.TestCase):
+    """The Hyperscan and re.finditer scanners must find the same API endpoints."""
+
+    def discover(self, script):
+        page = f"<html><body><script>{script}</script></body></html>"
+        analyzer = backend_analyzer.BackendAnalyzer()
+        return set(analyzer.discover_api_endpoints(lxml.html.fromstring(page), "https://ex.com/p", page))
+
+    def test_hyperscan_matches_finditer(self):
+        for script in API_SCRIPTS:
+            with self.subTest(script=script):
+                with_hyperscan = self.discover(script)
+                with mock.patch.object(backend_analyzer, "_API_HS_DB", None):
+                    with_re = self.discover(script)
+                self.assertEqual(with_hyperscan, with_re)
+
+    def test_candidates_match_finditer(self):
+        for chunk in RAW_CHUNKS + API_SCRIPTS:
+            with self.subTest(chunk=chunk):
+                with_hyperscan = list(backend_analyzer._iter_api_path_candidates([chunk]))
+                with mock.patch.object(backend_analyzer, "_API_HS_DB", None):
+                    with_re = list(backend_analyzer._iter_api_path_candidates([chunk]))
+                self.assertEqual(with_hyperscan, with_re)
+
+    def test_nested_spans_are_not_reported(self):
+        self.assertEqual(self.discover(API_SCRIPTS[0]),
+                         {"https://ex.com/svc/api/v1/users", "https://cdn.ex.com/rest/v2/items"})
+
+class SessionCookieDetectionTest(unittest.TestCase):
+    """Session cookies are recognised by name, including prefixed and route-suffixed names."""
+
+    def session_cookies_likely(self, set_cookie):
+        analyzer = backend_analyzer.BackendAnalyzer()
+        return analyzer.analyze_authentication(None, {"Set-Cookie": set_cookie}).session_cookies_likely
+
+    def test_plain_session_cookie(self):
+        self.assertTrue(self.session_cookies_likely("sessionid=abc; Path=/; HttpOnly"))
+
+    def test_cookie_name_prefixes_are_stripped(self):
+        self.assertTrue(self.session_cookies_likely("__Host-sessionid=abc; Path=/; Secure"))
+        self.assertTrue(self.session_cookies_likely("__Secure-PHPSESSID=abc; Secure"))
+
+    def test_route_suffix_is_stripped(self):
+        self.assertTrue(self.session_cookies_likely("JSESSIONID.node0=abc; Path=/"))
+
+    def test_session_token_inside_name(self):
+        self.assertTrue(self.session_cookies_likely("my_sessionid=abc"))
+        self.assertTrue(self.session_cookies_likely("app-sessid=abc"))
+
+    def test_framework_prefix_and_suffix(self):
+        self.assertTrue(self.session_cookies_likely("_myapp_session=abc; Path=/"))
+        self.assertTrue(self.session_cookies_likely("ASPSESSIONIDQACTRDBS=abc"))
+
+    def test_session_token_in_value_only(self):
+        self.assertFalse(self.session_cookies_likely("pref=sessionid; Path=/"))
+
+    def test_unrelated_cookie(self):
+        self.assertFalse(self.session_cookies_likely("theme=dark; Path=/"))
+
+class JwtDetectionTest(unittest.TestCase):
+    """JWTs are recognised by a Bearer/JWT scheme or by their eyJ header shape."""
+
+    def jwt_likely(self, headers):
+        return backend_analyzer.BackendAnalyzer().analyze_authentication(None, headers).jwt_likely
+
+    def test_bearer_scheme(self):
+        self.assertTrue(self.jwt_likely({"Authorization": "Bearer abc"}))
+
+    def test_token_shape_in_custom_header(self):
+        self.assertTrue(self.jwt_likely({"X-Access-Token": "eyJhbGciOiJIUzI1NiJ9.eyJzdWIiOiIxIn0.c2ln"}))
+
+    def test_basic_auth(self):
+        self.assertFalse(self.jwt_likely({"Authorization": "Basic dXNlcjpwYXNz"}))
+
+if __name__ == "__main__":
+    unittest.main()
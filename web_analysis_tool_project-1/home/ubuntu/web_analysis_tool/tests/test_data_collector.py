@@ -0,0 +1,115 @@
+# test_data_collector.py
+
+import csv
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+from src.data_collection import data_collector
+from src.data_collection.data_collector import DataCollector
+
+class _CacheablePageHandler(BaseHTTPRequestHandler):
+    """Serves a small HTML page per path that the HTTP cache may keep for ten minutes."""
+
+    def do_GET(self):
+        body = f"<html><head><title>{self.path}</title></head><body><p>Page</p></body></html>".encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Cache-Control", "max-age=600")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+@unittest.skipIf(data_collector.requests_cache is None, "requests-cache is not installed")
+class CsvBatchStoredResultsTest(unittest.TestCase):
+    """Stored results must not bypass, or point at, a csv_batch() file."""
+
+    def setUp(self):
+        self.server = HTTPServer(("127.0.0.1", 0), _CacheablePageHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        self.base_url = f"http://127.0.0.1:{self.server.server_port}"
+        output_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(output_directory.cleanup)
+        self.collector = DataCollector(output_directory=output_directory.name)
+
+    def test_cached_url_is_written_to_batch(self):
+        first = self.collector.collect_and_store(self.base_url + "/a")
+        with self.collector.csv_batch() as writer:
+            cached = self.collector.collect_and_store(self.base_url + "/a")
+            self.collector.collect_and_store(self.base_url + "/b")
+        with open(writer.path, newline="", encoding="utf-8") as f:
+            self.assertEqual(len(list(csv.reader(f))) - 1, 2)
+        self.assertEqual(cached["csv_filepath"], writer.path)
+        # Stored results from before the batch are still reused afterwards.
+        self.assertEqual(self.collector.collect_and_store(self.base_url + "/a")["csv_filepath"], first["csv_filepath"])
+
+    def test_batch_results_are_not_stored(self):
+        with self.collector.csv_batch() as writer:
+            self.collector.collect_and_store(self.base_url + "/b")
+        after = self.collector.collect_and_store(self.base_url + "/b")
+        self.assertNotEqual(after["csv_filepath"], writer.path)
+
+@unittest.skipIf(data_collector.requests_cache is None, "requests-cache is not installed")
+class StoredResultsOptionsTest(unittest.TestCase):
+    """Collectors sharing an output directory must not reuse results stored with other output settings."""
+
+    def setUp(self):
+        self.server = HTTPServer(("127.0.0.1", 0), _CacheablePageHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        self.url = f"http://127.0.0.1:{self.server.server_port}/page"
+        output_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(output_directory.cleanup)
+        self.output_directory = output_directory.name
+
+    def collect(self, **settings):
+        return DataCollector(output_directory=self.output_directory, **settings).collect_and_store(self.url)
+
+    def test_same_settings_reuse_stored_results(self):
+        first = self.collect()
+        self.assertEqual(self.collect()["csv_filepath"], first["csv_filepath"])
+
+    def test_inline_text_limit_is_part_of_the_key(self):
+        first = self.collect()
+        self.assertIsNone(first.get("full_text_content_path"))
+        self.assertIsNotNone(self.collect(max_inline_text_bytes=1).get("full_text_content_path"))
+
+    def test_compress_is_part_of_the_key(self):
+        self.collect()
+        compressed = self.collect(compress=True)
+        self.assertTrue(compressed["csv_filepath"].endswith(".csv.gz"))
+        self.assertTrue(compressed["json_filepath"].endswith(".json.gz"))
+
+    @unittest.skipIf(data_collector.trafilatura is None, "trafilatura is not installed")
+    def test_extractor_is_part_of_the_key(self):
+        builtin = self.collect()
+        self.assertNotEqual(self.collect(extractor="trafilatura")["json_filepath"], builtin["json_filepath"])
+
+class Http2HeadersTest(unittest.TestCase):
+    """The HTTP/2 client must not inherit the session's connection-specific headers."""
+
+    def setUp(self):
+        output_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(output_directory.cleanup)
+        self.collector = DataCollector(output_directory=output_directory.name, use_http_cache=False)
+
+    def test_hop_by_hop_headers_are_dropped(self):
+        self.assertEqual(self.collector.session.headers["Connection"], "keep-alive")
+        headers = {name.lower() for name in self.collector._http2_headers()}
+        self.assertNotIn("connection", headers)
+        self.assertIn("user-agent", headers)
+
+    @unittest.skipIf(data_collector.httpx is None, "httpx is not installed")
+    def test_client_options_use_filtered_headers(self):
+        headers = self.collector._http2_client_options()["headers"]
+        self.assertNotIn("connection", {name.lower() for name in headers})
+
+if __name__ == "__main__":
+    unittest.main()
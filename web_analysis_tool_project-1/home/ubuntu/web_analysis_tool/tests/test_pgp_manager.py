@@ -0,0 +1,88 @@
+# test_pgp_manager.py
+
+import os
+import shutil
+import subprocess
+import tempfile
+import unittest
+
+from src.pgp_management.pgp_manager import PGPManager, GPG_SHARD_COUNT
+from src.utils.custom_exceptions import PGPManagementError
+
+PASSPHRASE = "shard-test-passphrase"
+
+@unittest.skipIf(shutil.which("gpg") is None, "gpg is not installed")
+class ShardedImportTest(unittest.TestCase):
+    """A sharded import must leave each key, secret material included, only in its own shard."""
+
+    def setUp(self):
+        self.workdir = tempfile.mkdtemp(prefix="pgp")
+        self.addCleanup(shutil.rmtree, self.workdir, ignore_errors=True)
+
+    def make_home(self, name):
+        home = os.path.join(self.workdir, name)
+        homes = [home] + [os.path.join(home, f"shard_{index:x}") for index in range(GPG_SHARD_COUNT)]
+        for path in homes:
+            self.addCleanup(subprocess.run, ["gpgconf", "--homedir", path, "--kill", "gpg-agent"],
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        return home
+
+    def write_bundle(self):
+        """Generates secret keys until two start with different hex digits and exports both."""
+        source = PGPManager(gpg_home=self.make_home("source"))
+        by_shard = {}
+        while len(by_shard) < 2:
+            fingerprint = source.generate_key_pair("Shard Test", "shard@example.com", PASSPHRASE).fingerprint
+            by_shard.setdefault(fingerprint[0].upper(), fingerprint)
+        first, second = by_shard.values()
+        key_data = source.gpg.export_keys([first, second])
+        key_data += source.gpg.export_keys([first, second], secret=True, passphrase=PASSPHRASE)
+        bundle = os.path.join(self.workdir, "bundle.asc")
+        with open(bundle, "w") as f:
+            f.write(key_data)
+        return bundle, first, second
+
+    def test_deleted_key_leaves_no_copy_in_foreign_shard(self):
+        bundle, first, second = self.write_bundle()
+        manager = PGPManager(gpg_home=self.make_home("sharded"), sharded=True)
+
+        import_result = manager.import_key(bundle, passphrase=PASSPHRASE)
+        self.assertEqual(sorted(import_result.fingerprints), sorted([first, second]))
+        self.assertEqual(sorted(manager.list_fingerprints_fast(secret=True)), sorted([first, second]))
+
+        manager.delete_keys_bulk([first], secret=True, passphrase=PASSPHRASE)
+        manager.delete_keys_bulk([first])
+
+        for secret in (False, True):
+            for shard in manager.gpg_shards:
+                self.assertNotIn(first, {key["fingerprint"] for key in shard.list_keys(secret)})
+            self.assertEqual(manager.gpg.list_keys(secret), [])
+        foreign_shard = manager.gpg_shards[int(second[0], 16)]
+        self.assertEqual([key["fingerprint"] for key in foreign_shard.list_keys(True)], [second])
+
+@unittest.skipIf(shutil.which("gpg") is None, "gpg is not installed")
+class ExportAllKeysTest(unittest.TestCase):
+    """export_all_keys exports secret keys with their passphrase and reports a missing one as PGPManagementError."""
+
+    def setUp(self):
+        workdir = tempfile.mkdtemp(prefix="pgp")
+        self.addCleanup(shutil.rmtree, workdir, ignore_errors=True)
+        home = os.path.join(workdir, "home")
+        self.addCleanup(subprocess.run, ["gpgconf", "--homedir", home, "--kill", "gpg-agent"],
+                        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        self.output_dir = os.path.join(workdir, "export")
+        self.manager = PGPManager(gpg_home=home)
+        self.fingerprint = self.manager.generate_key_pair("Export Test", "export@example.com", PASSPHRASE).fingerprint
+
+    def test_secret_export_with_passphrase(self):
+        paths = self.manager.export_all_keys(self.output_dir, secret=True, passphrase=PASSPHRASE)
+        self.assertEqual(paths, [os.path.join(self.output_dir, self.fingerprint + ".asc")])
+        with open(paths[0]) as f:
+            self.assertIn("PRIVATE KEY BLOCK", f.read())
+
+    def test_secret_export_without_passphrase(self):
+        with self.assertRaises(PGPManagementError):
+            self.manager.export_all_keys(self.output_dir, secret=True)
+
+if __name__ == "__main__":
+    unittest.main()